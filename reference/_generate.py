@@ -12,7 +12,8 @@ import time
 import click
 import requests
 
-from globus_cli.reflect import iter_all_commands, load_main_entrypoint, walk_contexts
+from globus_cli.manifest import get_command_manifest, iter_manifest_commands
+from globus_cli.reflect import iter_all_commands, load_main_entrypoint
 
 CLI = load_main_entrypoint()
 TARGET_DIR = os.path.dirname(__file__)
@@ -133,13 +134,14 @@ def write_pages():
                 f.write(str(AdocPage(ctx)))
 
 
-def commands_with_headings(heading, tree=None):
-    ctx, subcmds, subgroups = tree or walk_contexts("globus", CLI)
-    if subcmds:
-        yield heading, subcmds
-    for subgrouptree in subgroups:
-        heading = f"== {subgrouptree[0].command_path} commands"
-        yield from commands_with_headings(heading, subgrouptree)
+def commands_with_headings(heading):
+    # the index only needs names and short help, which are read from the manifest
+    manifest = get_command_manifest()
+    for group_path, _, subcmds in iter_manifest_commands(manifest["commands"]):
+        if group_path != "globus":
+            heading = f"== {group_path} commands"
+        if subcmds:
+            yield heading, subcmds
 
 
 def generate_index():
@@ -152,10 +154,10 @@ def generate_index():
 [doc-info]*Last Updated: {REV_DATE}*"""
         ):
             f.write(heading + "\n\n")
-            for ctx in commands:
-                link = ctx.command_path.replace(" ", "_")[len("globus_") :]
-                f.write(f"link:{link}[{ctx.command_path}]::\n")
-                f.write(ctx.command.get_short_help_str() + "\n\n")
+            for command_path, node in commands:
+                link = command_path.replace(" ", "_")[len("globus_") :]
+                f.write(f"link:{link}[{command_path}]::\n")
+                f.write(node["help"] + "\n\n")
 
 
 def main():
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Measure the per-row cost of extracting table values with `Field`.
+
+Compares the original approach of calling `jmespath.search()` on the key for every
+cell against `Field.get_value()`, for a representative set of table fields.
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+import typing as t
+
+import jmespath
+
+from globus_cli.termio import Field
+
+FIELDS = [
+    Field("Task ID", "task_id"),
+    Field("Status", "status"),
+    Field("Source", "source_endpoint_display_name"),
+    Field("Nested", "owner.username"),
+    Field("Whole Item", "@"),
+    Field("Display Name", "[display_name, canonical_name]"),
+]
+
+
+def _make_rows(count: int) -> list[dict[str, t.Any]]:
+    return [
+        {
+            "task_id": f"task-{i}",
+            "status": "SUCCEEDED",
+            "source_endpoint_display_name": "source",
+            "owner": {"username": "user@example.org"},
+            "display_name": None,
+            "canonical_name": f"endpoint-{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def _before(rows: list[dict[str, t.Any]]) -> None:
+    for row in rows:
+        for field in FIELDS:
+            jmespath.search(field.key, row)
+
+
+def _after(rows: list[dict[str, t.Any]]) -> None:
+    for row in rows:
+        for field in FIELDS:
+            field.get_value(row)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _make_rows(args.rows)
+    results = {}
+    for name, func in (("jmespath.search", _before), ("Field.get_value", _after)):
+        best = min(timeit.repeat(lambda f=func: f(rows), number=1, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:>16}: {best / args.rows * 1e6:8.2f} us/row")
+    speedup = results["jmespath.search"] / results["Field.get_value"]
+    print(f"{'speedup':>16}: {speedup:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
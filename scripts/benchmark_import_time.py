@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Measure the cold-start cost of representative `globus` invocations.
+
+Each command is run in a fresh interpreter, several times, and the median wall-clock
+time is reported alongside the time for an empty interpreter. Each command is then
+run once more under `python -X importtime`, and the import time is broken down by
+top-level package, with the slowest individual modules listed.
+
+Commands are run through the `globus` console script entrypoint, so completion
+requests are served as they would be in a shell.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+
+_RUN_CLI = """\
+import sys
+sys.argv = ["globus", *sys.argv[1:]]
+from globus_cli.entrypoint import main
+try:
+    main()
+except SystemExit:
+    pass
+"""
+
+# (label, argv, extra env)
+_COMMANDS: list[tuple[str, list[str], dict[str, str]]] = [
+    ("globus --help", ["--help"], {}),
+    ("globus version --help", ["version", "--help"], {}),
+    ("globus ls --help", ["ls", "--help"], {}),
+    ("globus transfer --help", ["transfer", "--help"], {}),
+    ("globus task list --help", ["task", "list", "--help"], {}),
+    ("globus endpoint search --help", ["endpoint", "search", "--help"], {}),
+    (
+        "complete 'globus task li'",
+        [],
+        {
+            "_GLOBUS_COMPLETE": "bash_complete",
+            "COMP_WORDS": "globus task li",
+            "COMP_CWORD": "2",
+        },
+    ),
+]
+
+
+def _run(
+    argv: list[str], env: dict[str, str], *, importtime: bool = False
+) -> subprocess.CompletedProcess[str]:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _RUN_CLI, *argv]
+    return subprocess.run(
+        cmd,
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+
+
+def _median_wall_time(argv: list[str], env: dict[str, str], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(argv, env)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _parse_importtime(stderr: str) -> list[tuple[str, int]]:
+    """
+    Parse `-X importtime` output into (module, self time in us) pairs.
+    """
+    results = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative_us, name = line[len("import time:") :].split("|")
+        results.append((name.strip(), int(self_us)))
+    return results
+
+
+def _by_package(modules: t.Iterable[tuple[str, int]]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for name, self_us in modules:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--top", type=int, default=8, help="the number of slow modules to list"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        # use a scratch data dir, so that a development version (which has no
+        # packaged command manifest) builds and uses a fresh one
+        base_env = {"HOME": home}
+        _run([], {**base_env, **_COMMANDS[-1][2]})
+
+        baseline = statistics.median(
+            _timed_python(["-c", "pass"]) for _ in range(args.runs)
+        )
+        print(f"{'python -c pass':>32}: {baseline * 1000:7.1f} ms")
+
+        for label, argv, env in _COMMANDS:
+            env = {**base_env, **env}
+            wall = _median_wall_time(argv, env, args.runs)
+            modules = _parse_importtime(_run(argv, env, importtime=True).stderr)
+            total_ms = sum(us for _, us in modules) / 1000
+
+            print()
+            print(
+                f"{label:>32}: {wall * 1000:7.1f} ms wall, "
+                f"{total_ms:7.1f} ms importing {len(modules)} modules"
+            )
+            packages = sorted(_by_package(modules).items(), key=lambda x: -x[1])
+            print(
+                f"{'by package':>32}: "
+                + ", ".join(f"{name} {us / 1000:.1f}" for name, us in packages[:6])
+            )
+            slowest = sorted(modules, key=lambda x: -x[1])[: args.top]
+            print(
+                f"{'slowest modules':>32}: "
+                + ", ".join(f"{name} {us / 1000:.1f}" for name, us in slowest)
+            )
+
+
+def _timed_python(args: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], check=False)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
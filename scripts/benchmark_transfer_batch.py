@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Measure the cost of parsing `globus transfer --batch` input.
+
+Generates a synthetic manifest of simple "SOURCE DEST" lines (with a sprinkling of
+comments and lines using options) and times `add_batch_to_transfer_data` on it.
+
+The full shlex and click parser is timed on a sample of the manifest, because
+running it over every line takes minutes. Its per-line cost is extrapolated for
+comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import re
+import time
+import typing as t
+from unittest import mock
+
+import globus_sdk
+
+from globus_cli.services.transfer import add_batch_to_transfer_data
+
+
+def _make_manifest(lines: int) -> str:
+    def gen() -> t.Iterator[str]:
+        for i in range(lines):
+            if i % 1000 == 0:
+                yield f"# chunk {i // 1000}\n"
+            elif i % 997 == 0:
+                yield f"--recursive dir{i}/ dest/dir{i}/\n"
+            else:
+                yield f"data/{i % 100}/file{i}.dat archive/{i % 100}/file{i}.dat\n"
+
+    return "".join(gen())
+
+
+def _parse(manifest: str) -> int:
+    tdata = globus_sdk.TransferData(
+        source_endpoint="src_id", destination_endpoint="dst_id"
+    )
+    add_batch_to_transfer_data("/src/", "/dst/", None, tdata, io.StringIO(manifest))
+    return len(tdata["DATA"])
+
+
+def _parse_without_fast_path(manifest: str) -> int:
+    with mock.patch(
+        "globus_cli.services.transfer.data._SIMPLE_BATCH_LINE", re.compile(r"(?!)")
+    ):
+        return _parse(manifest)
+
+
+def _time(func: t.Callable[[str], int], manifest: str) -> tuple[float, int]:
+    start = time.perf_counter()
+    count = func(manifest)
+    return time.perf_counter() - start, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=20_000,
+        help="the number of lines to run through the full parser",
+    )
+    args = parser.parse_args()
+
+    manifest = _make_manifest(args.lines)
+    sample = _make_manifest(min(args.sample, args.lines))
+
+    fast_elapsed, fast_count = _time(_parse, manifest)
+    slow_elapsed, slow_count = _time(_parse_without_fast_path, sample)
+    fast_per_item = fast_elapsed / fast_count
+    slow_per_item = slow_elapsed / slow_count
+
+    print(f"{'items':>12}: {fast_count}")
+    print(
+        f"{'fast path':>12}: {fast_elapsed:8.2f} s ({fast_per_item * 1e6:.2f} us/item)"
+    )
+    print(
+        f"{'full parser':>12}: {slow_per_item * fast_count:8.2f} s "
+        f"({slow_per_item * 1e6:.2f} us/item, extrapolated from {slow_count} items)"
+    )
+    print(f"{'speedup':>12}: {slow_per_item / fast_per_item:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""
+Generate the command manifest which is shipped in the globus_cli package.
+
+The manifest is stamped with the CLI version, so it must be regenerated whenever the
+version or the command tree changes. The test suite checks that it is up to date.
+"""
+from __future__ import annotations
+
+import json
+import pathlib
+
+from globus_cli.manifest import PACKAGED_MANIFEST_FILENAME, build_command_manifest
+
+REPO_ROOT = pathlib.Path(__file__).parent.parent
+# the manifest in the source tree, which may not be the one imported
+MANIFEST_PATH = REPO_ROOT / "src" / "globus_cli" / "command_manifest.json"
+
+
+def main() -> None:
+    if pathlib.Path(PACKAGED_MANIFEST_FILENAME).resolve() != MANIFEST_PATH.resolve():
+        raise SystemExit(
+            "globus_cli is not installed from this source tree, "
+            "install it with 'pip install -e .'"
+        )
+    print(f"writing {MANIFEST_PATH.relative_to(REPO_ROOT)} ... ", end="")
+    manifest = build_command_manifest()
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=1)
+        fp.write("\n")
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,7 @@ setup(
     version=parse_version(),
     packages=find_packages("src"),
     package_dir={"": "src"},
+    package_data={"globus_cli": ["command_manifest.json"]},
     python_requires=">=3.7",
     install_requires=[
         "globus-sdk==3.28.0",
@@ -59,7 +60,7 @@ setup(
         'typing_extensions>=4.0;python_version<"3.11"',
     ],
     extras_require={"test": TEST_REQUIREMENTS, "development": DEV_REQUIREMENTS},
-    entry_points={"console_scripts": ["globus = globus_cli:main"]},
+    entry_points={"console_scripts": ["globus = globus_cli.entrypoint:main"]},
     # descriptive info, non-critical
     description="Globus CLI",
     long_description=read_readme(),
@@ -1,4 +1,25 @@
-from globus_cli.commands import main
+from __future__ import annotations
+
+import typing as t
+
 from globus_cli.version import __version__
 
-__all__ = ["main", "__version__"]
+if t.TYPE_CHECKING:
+    from globus_cli.commands import main
+    from globus_cli.inprocess import Result, run
+
+__all__ = ["main", "run", "Result", "__version__"]
+
+
+def __getattr__(name: str) -> t.Any:
+    # the command tree is loaded on first use, so that the `globus` entrypoint can
+    # answer shell completion requests without loading it
+    if name == "main":
+        from globus_cli.commands import main
+
+        return main
+    if name in ("run", "Result"):
+        from globus_cli import inprocess
+
+        return getattr(inprocess, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,290 @@
+"""
+Persistent local caches for data fetched from Globus services.
+
+Caches are stored in a SQLite database, ``cache.db``, alongside the token storage
+database in the CLI data directory. Entries are partitioned by the token storage
+namespace (so that environments and profiles do not share data) and by cache name.
+Entries expire after a TTL, and are evicted in least-recently-used order when a
+cache grows beyond its size limit. Recency is tracked coarsely, so that most reads
+do not need to write to the database.
+
+A cache is never required for correctness. If the database cannot be used, caches
+behave as though they were empty.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    import sqlite3
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS cache_entry (
+    namespace TEXT NOT NULL,
+    cache_name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, cache_name, key)
+)
+"""
+
+# the granularity, in seconds, with which entry access times are recorded: reading an
+# entry only updates its access time if that is older than this
+ACCESS_TIME_RESOLUTION = 60
+
+
+def _get_cache_filename() -> str:
+    from globus_cli.login_manager.tokenstore import _get_cache_filename
+
+    return _get_cache_filename()
+
+
+def _get_namespace() -> str:
+    from globus_cli.login_manager.tokenstore import _resolve_namespace
+
+    return _resolve_namespace()
+
+
+class PersistentCache(t.MutableMapping[str, t.Any]):
+    """
+    A mapping of strings to JSON-serializable values, backed by the cache database.
+
+    Values which have been read or written are also held in memory, so repeated
+    lookups within one command do not go back to the database.
+
+    :param cache_name: The name of this cache, distinguishing it from other caches
+    :param ttl: The number of seconds for which an entry is valid
+    :param max_entries: The maximum number of entries to keep in the database
+    :param filename: The database file to use. Defaults to ``cache.db`` in the CLI
+        data directory
+    :param namespace: The namespace of the cache. Defaults to the namespace used for
+        token storage
+    """
+
+    def __init__(
+        self,
+        cache_name: str,
+        *,
+        ttl: float,
+        max_entries: int,
+        filename: str | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        self.cache_name = cache_name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._filename = filename
+        self._namespace = namespace if namespace is not None else _get_namespace()
+
+        # the connection is created on first use, and None after a failure
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._lock = threading.RLock()
+        self._memory: dict[str, t.Any] = {}
+
+    def _connection(self) -> sqlite3.Connection | None:
+        # sqlite3 is imported on first use, so that the many commands which import
+        # this module do not pay for it when they run without touching a cache
+        import sqlite3
+
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                if self._filename is None:
+                    self._filename = _get_cache_filename()
+                conn = sqlite3.connect(
+                    self._filename, timeout=5, check_same_thread=False
+                )
+                conn.execute(_SCHEMA)
+                conn.commit()
+            except (OSError, sqlite3.Error) as err:
+                log.debug("disabling cache '%s': %s", self.cache_name, err)
+                self._disabled = True
+                return None
+            self._conn = conn
+        return self._conn
+
+    def _execute(
+        self, query: str, params: t.Sequence[t.Any] = ()
+    ) -> list[tuple[t.Any, ...]]:
+        """
+        Run a query, returning any rows produced.
+        Errors are logged and result in an empty list of rows.
+        """
+        import sqlite3
+
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            try:
+                with conn:
+                    return conn.execute(query, params).fetchall()
+            except sqlite3.Error as err:
+                log.debug("cache '%s' query failed: %s", self.cache_name, err)
+                return []
+
+    def __getitem__(self, key: str) -> t.Any:
+        if key in self._memory:
+            return self._memory[key]
+
+        now = time.time()
+        rows = self._execute(
+            "SELECT value, accessed_at FROM cache_entry "
+            "WHERE namespace = ? AND cache_name = ? AND key = ? AND stored_at > ?",
+            (self._namespace, self.cache_name, key, now - self.ttl),
+        )
+        if not rows:
+            raise KeyError(key)
+        value_json, accessed_at = rows[0]
+        if accessed_at < now - ACCESS_TIME_RESOLUTION:
+            self._execute(
+                "UPDATE cache_entry SET accessed_at = ? "
+                "WHERE namespace = ? AND cache_name = ? AND key = ?",
+                (now, self._namespace, self.cache_name, key),
+            )
+        value = json.loads(value_json)
+        self._memory[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        self._memory[key] = value
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO cache_entry "
+            "(namespace, cache_name, key, value, stored_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self._namespace, self.cache_name, key, json.dumps(value), now, now),
+        )
+        self._evict(now)
+
+    def __delitem__(self, key: str) -> None:
+        # raise a KeyError for missing keys, per the MutableMapping interface
+        self[key]
+        self._memory.pop(key, None)
+        self._execute(
+            "DELETE FROM cache_entry "
+            "WHERE namespace = ? AND cache_name = ? AND key = ?",
+            (self._namespace, self.cache_name, key),
+        )
+
+    def _keys(self) -> set[str]:
+        rows = self._execute(
+            "SELECT key FROM cache_entry "
+            "WHERE namespace = ? AND cache_name = ? AND stored_at > ?",
+            (self._namespace, self.cache_name, time.time() - self.ttl),
+        )
+        return {row[0] for row in rows}
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._keys() | set(self._memory))
+
+    def __len__(self) -> int:
+        return len(self._keys() | set(self._memory))
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self._execute(
+            "DELETE FROM cache_entry WHERE namespace = ? AND cache_name = ?",
+            (self._namespace, self.cache_name),
+        )
+
+    def _evict(self, now: float) -> None:
+        """
+        Remove expired entries, and then the least recently used entries beyond the
+        size limit.
+        """
+        self._execute(
+            "DELETE FROM cache_entry "
+            "WHERE namespace = ? AND cache_name = ? AND stored_at <= ?",
+            (self._namespace, self.cache_name, now - self.ttl),
+        )
+        self._execute(
+            "DELETE FROM cache_entry "
+            "WHERE namespace = ? AND cache_name = ? AND key NOT IN ("
+            "  SELECT key FROM cache_entry WHERE namespace = ? AND cache_name = ? "
+            "  ORDER BY accessed_at DESC LIMIT ?"
+            ")",
+            (
+                self._namespace,
+                self.cache_name,
+                self._namespace,
+                self.cache_name,
+                self.max_entries,
+            ),
+        )
+
+
+# identity records are keyed by both ID and username
+IDENTITY_CACHE_TTL = 24 * 60 * 60
+IDENTITY_CACHE_MAX_ENTRIES = 10000
+
+
+def get_identity_cache() -> PersistentCache:
+    """
+    Get the cache of Globus Auth identity records, suitable for use as the ``cache``
+    of a ``globus_sdk.IdentityMap``.
+    """
+    return PersistentCache(
+        "identities",
+        ttl=IDENTITY_CACHE_TTL,
+        max_entries=IDENTITY_CACHE_MAX_ENTRIES,
+    )
+
+
+# activation state is kept briefly, as endpoints may be deactivated elsewhere
+ACTIVATION_CACHE_TTL = 10 * 60
+ACTIVATION_CACHE_MAX_ENTRIES = 1000
+
+
+def get_activation_cache() -> PersistentCache:
+    """
+    Get the cache of endpoint activation expiry times, keyed by endpoint ID.
+    """
+    return PersistentCache(
+        "activation",
+        ttl=ACTIVATION_CACHE_TTL,
+        max_entries=ACTIVATION_CACHE_MAX_ENTRIES,
+    )
+
+
+# the fields of endpoint documents which determine how an ID is used (entity type,
+# owning endpoint, GCS Manager address), which change rarely, if ever
+ENDPOINTISH_CACHE_TTL = 24 * 60 * 60
+ENDPOINTISH_CACHE_MAX_ENTRIES = 1000
+
+
+def get_endpointish_cache() -> PersistentCache:
+    """
+    Get the cache of resolved endpoint and collection data, keyed by ID.
+    """
+    return PersistentCache(
+        "endpointish",
+        ttl=ENDPOINTISH_CACHE_TTL,
+        max_entries=ENDPOINTISH_CACHE_MAX_ENTRIES,
+    )
+
+
+# the bookmark index holds the user's whole bookmark list as one entry
+BOOKMARK_INDEX_TTL = 5 * 60
+BOOKMARK_INDEX_MAX_ENTRIES = 1
+
+
+def get_bookmark_index_cache() -> PersistentCache:
+    """
+    Get the cache which holds the index of the user's bookmarks.
+    """
+    return PersistentCache(
+        "bookmarks",
+        ttl=BOOKMARK_INDEX_TTL,
+        max_entries=BOOKMARK_INDEX_MAX_ENTRIES,
+    )
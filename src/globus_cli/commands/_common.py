@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import logging
+import math
 import sys
+import time
 import typing as t
 import uuid
 
@@ -11,6 +14,49 @@ from globus_cli.termio import TextMode, display
 if t.TYPE_CHECKING:
     from ..services.transfer import CustomTransferClient
 
+log = logging.getLogger(__name__)
+
+
+# the number of task IDs to check in a single task_list call
+TASK_WAIT_BATCH_SIZE = 100
+
+_MEOW_SLEEPING = r"""
+   |\      _,,,---,,_
+   /,`.-'`'    -.  ;-;;,_
+  |,4-  ) )-,_..;\ (  `'-'
+ '---''(_/--'  `-'\_)"""
+
+_MEOW_AWAKE = r"""
+                  _..
+  /}_{\           /.-'
+ ( a a )-.___...-'/
+ ==._.==         ;
+      \ i _..._ /,
+      {_;/   {_//"""
+
+
+def _fetch_tasks(
+    transfer_client: CustomTransferClient, task_ids: list[str], *, use_task_list: bool
+) -> dict[str, dict[str, t.Any]]:
+    """
+    Get the current documents for a set of tasks, keyed by task ID.
+
+    With ``use_task_list``, tasks are fetched together with task_list calls
+    filtered by task ID. Otherwise, each task is fetched directly.
+    """
+    if not use_task_list:
+        return {task_id: transfer_client.get_task(task_id).data for task_id in task_ids}
+
+    tasks = {}
+    for start in range(0, len(task_ids), TASK_WAIT_BATCH_SIZE):
+        batch = task_ids[start : start + TASK_WAIT_BATCH_SIZE]
+        res = transfer_client.task_list(
+            filter="task_id:" + ",".join(batch), limit=len(batch)
+        )
+        for task in res:
+            tasks[task["task_id"]] = dict(task)
+    return tasks
+
 
 def transfer_task_wait_with_io(
     transfer_client: CustomTransferClient,
@@ -18,8 +64,9 @@ def transfer_task_wait_with_io(
     heartbeat: bool,
     polling_interval: int,
     timeout: int | None,
-    task_id: str | uuid.UUID,
+    task_ids: t.Sequence[str | uuid.UUID],
     timeout_exit_code: int,
+    polling_strategy: str = "fixed",
 ) -> None:
     """
     Options are the core "task wait" options, including the `--meow` easter
@@ -28,77 +75,128 @@ def transfer_task_wait_with_io(
     This does the core "task wait" loop, including all of the IO.
     It *does exit* on behalf of the caller. (We can enhance with a
     `noabort=True` param or somesuch in the future if necessary.)
+
+    All of the tasks are checked together on each poll, and only tasks which are
+    still running are checked again. When waiting on more than one task, each
+    completion is reported on stderr as it is seen.
+
+    The exit status is 0 if every task succeeded, 1 if any task failed or could
+    not be found, and otherwise ``timeout_exit_code`` if any task is still
+    running when the timeout is reached.
+
+    ``polling_strategy`` is "fixed", to poll every ``polling_interval`` seconds, or
+    "adaptive", to start at ``polling_interval`` and back off from there.
     """
+    from globus_cli.services.transfer.polling import get_polling_schedule
 
-    def timed_out(waited_time: int) -> bool:
-        if timeout is None:
-            return False
-        else:
-            return waited_time >= timeout
+    schedule = get_polling_schedule(polling_strategy, polling_interval)
+    request_count = 0
 
-    def check_completed() -> bool:
-        completed = transfer_client.task_wait(
-            task_id, timeout=polling_interval, polling_interval=polling_interval
-        )
-        if completed:
-            if heartbeat:
-                click.echo("", err=True)
-            # meowing tasks wake up!
-            if meow:
-                click.echo(
-                    r"""
-                  _..
-  /}_{\           /.-'
- ( a a )-.___...-'/
- ==._.==         ;
-      \ i _..._ /,
-      {_;/   {_//""",
-                    err=True,
-                )
+    # dedupe, preserving order
+    all_task_ids = list(dict.fromkeys(str(task_id) for task_id in task_ids))
+    multiple = len(all_task_ids) > 1
+
+    tasks: dict[str, dict[str, t.Any]] = {}
+    pending = list(all_task_ids)
+    missing: list[str] = []
 
-            # TODO: possibly update TransferClient.task_wait so that we don't
-            # need to do an extra fetch to get the task status after completion
-            res = transfer_client.get_task(task_id)
-            display(res, text_mode=TextMode.silent)
+    # heartbeat dots are written on one line, so note when one is open
+    heartbeat_line_open = False
 
-            status = res["status"]
-            if status == "SUCCEEDED":
-                click.get_current_context().exit(0)
-            else:
-                click.get_current_context().exit(1)
+    def report(message: str) -> None:
+        nonlocal heartbeat_line_open
+        if heartbeat_line_open:
+            click.echo("", err=True)
+            heartbeat_line_open = False
+        click.echo(message, err=True)
+
+    def poll() -> None:
+        nonlocal pending, request_count
+        request_count += (
+            math.ceil(len(pending) / TASK_WAIT_BATCH_SIZE) if multiple else len(pending)
+        )
+        tasks.update(_fetch_tasks(transfer_client, pending, use_task_list=multiple))
+        still_pending = []
+        for task_id in pending:
+            if task_id not in tasks:
+                missing.append(task_id)
+                report(f"Task {task_id} was not found")
+            elif tasks[task_id]["status"] in ("ACTIVE", "INACTIVE"):
+                still_pending.append(task_id)
+            elif multiple:
+                report(
+                    f"Task {task_id} completed with status {tasks[task_id]['status']}"
+                )
+        pending = still_pending
 
-        return completed
+    def timed_out(waited_time: float) -> bool:
+        if timeout is None:
+            return False
+        else:
+            return waited_time >= timeout
 
     # Tasks start out sleepy
     if meow:
-        click.echo(
-            r"""
-   |\      _,,,---,,_
-   /,`.-'`'    -.  ;-;;,_
-  |,4-  ) )-,_..;\ (  `'-'
- '---''(_/--'  `-'\_)""",
-            err=True,
-        )
+        click.echo(_MEOW_SLEEPING, err=True)
 
-    waited_time = 0
-    while not timed_out(waited_time) and not check_completed():
+    waited_time = 0.0
+    poll()
+    while pending and not timed_out(waited_time):
         if heartbeat:
             click.echo(".", err=True, nl=False)
             sys.stderr.flush()
-
-        waited_time += polling_interval
-
-    # add a trailing newline to heartbeats if we fail
+            heartbeat_line_open = True
+
+        interval = schedule.next_interval(list(tasks.values()))
+        # make the last poll at the timeout, rather than after it
+        if timeout is not None:
+            interval = min(interval, timeout - waited_time)
+        time.sleep(interval)
+        waited_time += interval
+        poll()
+
+    log.debug(
+        "task wait made %d requests for %d tasks over %.1f seconds (%s polling)",
+        request_count,
+        len(all_task_ids),
+        waited_time,
+        polling_strategy,
+    )
+
+    # add a trailing newline to heartbeats
     if heartbeat:
         click.echo("", err=True)
 
-    exit_code = 1
-    if timed_out(waited_time):
-        click.echo(f"Task has yet to complete after {timeout} seconds", err=True)
+    if pending:
         exit_code = timeout_exit_code
+        if multiple:
+            click.echo(
+                f"{len(pending)} of {len(all_task_ids)} tasks have yet to complete "
+                f"after {timeout} seconds",
+                err=True,
+            )
+        else:
+            click.echo(f"Task has yet to complete after {timeout} seconds", err=True)
+    else:
+        exit_code = 0
+        # meowing tasks wake up!
+        if meow:
+            click.echo(_MEOW_AWAKE, err=True)
+
+    if missing or any(
+        tasks[task_id]["status"] not in ("ACTIVE", "INACTIVE", "SUCCEEDED")
+        for task_id in all_task_ids
+        if task_id in tasks
+    ):
+        exit_code = 1
 
     # output json if requested, but nothing for text mode
-    res = transfer_client.get_task(task_id)
-    display(res, text_mode=TextMode.silent)
+    if multiple:
+        display(
+            {"DATA": [tasks[task_id] for task_id in all_task_ids if task_id in tasks]},
+            text_mode=TextMode.silent,
+        )
+    else:
+        display(tasks.get(all_task_ids[0]), text_mode=TextMode.silent)
 
     click.get_current_context().exit(exit_code)
@@ -1,11 +1,103 @@
 from __future__ import annotations
 
+import time
 import typing as t
 from uuid import UUID
 
 import click
 import globus_sdk
 
+from globus_cli.cache import BOOKMARK_INDEX_TTL, get_bookmark_index_cache
+
+# the fields of bookmark documents which are kept in the index
+_BOOKMARK_FIELDS = ("DATA_TYPE", "id", "name", "endpoint_id", "path", "pinned")
+_INDEX_KEY = "index"
+
+
+def _index_row(bookmark: t.Mapping[str, t.Any]) -> dict[str, t.Any]:
+    return {k: bookmark[k] for k in _BOOKMARK_FIELDS if k in bookmark}
+
+
+class BookmarkIndex:
+    """
+    A local index of the user's bookmarks, for looking them up by ID or by name.
+
+    The index is a copy of the full bookmark list, which is replaced whenever the
+    list is fetched and expires after a few minutes. Changes made by the bookmark
+    commands are applied to the index as they are made, but do not extend its
+    lifetime.
+    """
+
+    def __init__(self) -> None:
+        self._cache = get_bookmark_index_cache()
+
+    def _load(self) -> dict[str, t.Any] | None:
+        try:
+            index = self._cache[_INDEX_KEY]
+        except KeyError:
+            return None
+        if time.time() - index["fetched_at"] > BOOKMARK_INDEX_TTL:
+            return None
+        return t.cast(t.Dict[str, t.Any], index)
+
+    def lookup(self, bookmark_id_or_name: str) -> dict[str, t.Any] | None:
+        """
+        Find a bookmark by ID or by exact name. Returns None if the index is missing
+        or expired, or does not contain the bookmark.
+        """
+        index = self._load()
+        if index is None:
+            return None
+        by_id = index["by_id"]
+        row = by_id.get(bookmark_id_or_name.lower())
+        if row is None:
+            row = by_id.get(index["by_name"].get(bookmark_id_or_name))
+        return t.cast(t.Optional[t.Dict[str, t.Any]], row)
+
+    def replace(self, bookmarks: t.Iterable[t.Mapping[str, t.Any]]) -> None:
+        """
+        Replace the index with a freshly fetched bookmark list.
+        """
+        index: dict[str, t.Any] = {
+            "fetched_at": time.time(),
+            "by_id": {},
+            "by_name": {},
+        }
+        for bookmark in bookmarks:
+            row = _index_row(bookmark)
+            if "id" not in row or "name" not in row:
+                continue
+            index["by_id"][row["id"]] = row
+            index["by_name"][row["name"]] = row["id"]
+        self._cache[_INDEX_KEY] = index
+
+    def update(self, bookmark: t.Mapping[str, t.Any]) -> None:
+        """
+        Add a created or renamed bookmark to the index, if there is one.
+        """
+        index = self._load()
+        if index is None:
+            return
+        row = _index_row(bookmark)
+        old_row = index["by_id"].get(row["id"])
+        if old_row is not None:
+            index["by_name"].pop(old_row["name"], None)
+        index["by_id"][row["id"]] = row
+        index["by_name"][row["name"]] = row["id"]
+        self._cache[_INDEX_KEY] = index
+
+    def remove(self, bookmark_id: str) -> None:
+        """
+        Remove a deleted bookmark from the index, if there is one.
+        """
+        index = self._load()
+        if index is None:
+            return
+        row = index["by_id"].pop(bookmark_id, None)
+        if row is not None:
+            index["by_name"].pop(row["name"], None)
+        self._cache[_INDEX_KEY] = index
+
 
 def resolve_id_or_name(
     client: globus_sdk.TransferClient, bookmark_id_or_name: str
@@ -14,6 +106,13 @@ def resolve_id_or_name(
     # service outright forbids it for bookmark names, so we can strip it off
     bookmark_id_or_name = bookmark_id_or_name.strip()
 
+    # the local index is the fast path, but a miss may only mean that the index is
+    # out of date, so it is never treated as "not found"
+    index = BookmarkIndex()
+    indexed = index.lookup(bookmark_id_or_name)
+    if indexed is not None:
+        return indexed
+
     res = None
     try:
         UUID(bookmark_id_or_name)  # raises ValueError if argument not a UUID
@@ -28,7 +127,10 @@ def resolve_id_or_name(
     if res:
         return res
 
-    # non-UUID input or UUID not found; fallback to match by name
+    # non-UUID input or UUID not found; fallback to match by name, refreshing the
+    # index from the full list
+    bookmarks = list(client.bookmark_list())
+    index.replace(bookmarks)
     try:
         # n.b. case matters to the Transfer service for bookmark names, so
         # two bookmarks can exist whose names vary only by their case
@@ -36,7 +138,7 @@ def resolve_id_or_name(
             t.Dict[str, t.Any],
             next(
                 bookmark_row
-                for bookmark_row in client.bookmark_list()
+                for bookmark_row in bookmarks
                 if bookmark_row["name"] == bookmark_id_or_name
             ),
         )
@@ -8,6 +8,8 @@ from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import ENDPOINT_PLUS_REQPATH, command
 from globus_cli.termio import display
 
+from ._common import BookmarkIndex
+
 
 @command(
     "create",
@@ -63,4 +65,5 @@ def bookmark_create(
     submit_data = {"endpoint_id": str(endpoint_id), "path": path, "name": bookmark_name}
 
     res = transfer_client.create_bookmark(submit_data)
+    BookmarkIndex().update(res.data)
     display(res, simple_text="Bookmark ID: {}".format(res["id"]))
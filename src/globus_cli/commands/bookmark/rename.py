@@ -4,7 +4,7 @@ from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
 from globus_cli.termio import display
 
-from ._common import resolve_id_or_name
+from ._common import BookmarkIndex, resolve_id_or_name
 
 
 @command(
@@ -35,4 +35,5 @@ def bookmark_rename(
     submit_data = {"name": new_bookmark_name}
 
     res = transfer_client.update_bookmark(bookmark_id, submit_data)
+    BookmarkIndex().update(res.data)
     display(res, simple_text="Success")
@@ -1,5 +1,6 @@
 import uuid
 
+from globus_cli.endpointish import Endpointish
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import collection_id_arg, command
 from globus_cli.termio import TextMode, display
@@ -15,4 +16,5 @@ def collection_delete(login_manager: LoginManager, *, collection_id: uuid.UUID)
     """
     gcs_client = login_manager.get_gcs_client(collection_id=collection_id)
     res = gcs_client.delete_collection(collection_id)
+    Endpointish.forget(collection_id)
     display(res, text_mode=TextMode.text_raw, response_key="code")
@@ -8,7 +8,7 @@ import globus_sdk
 
 from globus_cli import utils
 from globus_cli.constants import ExplicitNullType
-from globus_cli.endpointish import EntityType
+from globus_cli.endpointish import Endpointish, EntityType
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import (
     AnnotatedOption,
@@ -216,6 +216,7 @@ def collection_update(
 
     doc = doc_class(**converted_kwargs)
     res = gcs_client.update_collection(collection_id, doc)
+    Endpointish.forget(collection_id)
     display(
         res,
         fields=[_FullDataField("code", "code")],
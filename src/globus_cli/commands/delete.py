@@ -73,6 +73,15 @@ $ globus task wait "$task_id"
 @task_submission_options
 @delete_and_rm_options
 @local_user_option
+@click.option(
+    "--collapse-batch-paths/--no-collapse-batch-paths",
+    default=True,
+    show_default=True,
+    help=(
+        "Remove repeated paths from --batch input, and, with --recursive, paths "
+        "under another path which is being deleted."
+    ),
+)
 @click.argument("endpoint_plus_path", type=ENDPOINT_PLUS_OPTPATH)
 @LoginManager.requires_login("transfer")
 def delete_command(
@@ -91,6 +100,7 @@ def delete_command(
     skip_activation_check: bool,
     notify: dict[str, bool],
     local_user: str | None,
+    collapse_batch_paths: bool,
 ):
     """
     Submits an asynchronous task that deletes files and/or directories on the target
@@ -125,9 +135,14 @@ def delete_command(
     If you use `--batch` and supply a PATH via the commandline, the commandline PATH is
     treated as a prefix to all of the paths read from the `--batch` input.
 
+    Paths which are repeated in `--batch` input are only submitted once. With
+    `--recursive`, paths under another path in the input are not submitted
+    either, because deleting that path deletes them. The number of paths removed is
+    reported on stderr. Use `--no-collapse-batch-paths` to submit every path.
+
     {AUTOMATIC_ACTIVATION}
     """
-    from globus_cli.services.transfer import autoactivate
+    from globus_cli.services.transfer import autoactivate, plan_delete_paths
 
     endpoint_id, path = endpoint_plus_path
     transfer_client = login_manager.get_transfer_client()
@@ -152,16 +167,32 @@ def delete_command(
         # although this sophisticated structure (like that in transfer)
         # isn't strictly necessary, it gives us the ability to add options in
         # the future to these lines with trivial modifications
+        batch_paths: list[str] = []
+
         @click.command()
         @click.argument("path", type=TaskPath(base_dir=path))
         def process_batch_line(path):
             """
-            Parse a line of batch input and add it to the delete submission
-            item.
+            Parse a line of batch input and add it to the list of paths to delete.
             """
-            delete_data.add_item(str(path))
+            batch_paths.append(str(path))
 
         utils.shlex_process_stream(process_batch_line, batch, "--batch")
+
+        if collapse_batch_paths:
+            plan = plan_delete_paths(
+                batch_paths, recursive=recursive, interpret_globs=enable_globs
+            )
+            if plan.removed:
+                click.echo(
+                    f"Removed {plan.removed} of {len(batch_paths)} paths from the "
+                    f"batch ({plan.duplicates} repeated, {plan.covered} under a "
+                    "recursively deleted path)",
+                    err=True,
+                )
+            batch_paths = plan.paths
+        for batch_path in batch_paths:
+            delete_data.add_item(batch_path)
     else:
         if path is None:
             raise click.UsageError("delete requires either a PATH OR --batch")
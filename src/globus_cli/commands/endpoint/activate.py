@@ -173,6 +173,7 @@ def endpoint_activate(
     from globus_cli.services.transfer import (
         activation_requirements_help_text,
         fill_delegate_proxy_activation_requirements,
+        forget_activation,
     )
 
     transfer_client = login_manager.get_transfer_client()
@@ -196,6 +197,10 @@ def endpoint_activate(
     if proxy_lifetime and not delegate_proxy:
         raise click.UsageError("--proxy-lifetime requires --delegate-proxy.")
 
+    # the activation of the endpoint is checked and may change below, so any
+    # cached activation state is discarded
+    forget_activation(endpoint_id)
+
     # check if endpoint is already activated unless --force
     if not force:
         res: (
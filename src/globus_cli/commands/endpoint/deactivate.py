@@ -22,6 +22,9 @@ def endpoint_deactivate(login_manager: LoginManager, *, endpoint_id: str) -> Non
     Remove the credential previously assigned to an endpoint via
     'globus endpoint activate' or any other form of endpoint activation
     """
+    from globus_cli.services.transfer import forget_activation
+
     transfer_client = login_manager.get_transfer_client()
     res = transfer_client.endpoint_deactivate(endpoint_id)
+    forget_activation(endpoint_id)
     display(res, text_mode=TextMode.text_raw, response_key="message")
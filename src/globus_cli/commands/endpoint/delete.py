@@ -28,4 +28,5 @@ def endpoint_delete(login_manager: LoginManager, *, endpoint_id: str) -> None:
     ).assert_is_traditional_endpoint()
 
     res = transfer_client.delete_endpoint(endpoint_id)
+    Endpointish.forget(endpoint_id)
     display(res, text_mode=TextMode.text_raw, response_key="message")
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
-from globus_cli.termio import display
+from globus_cli.termio import TextMode, display
 from globus_cli.utils import PagingWrapper
 
 
@@ -84,6 +83,8 @@ def endpoint_search(
     legacy name, description, organization, department, keywords) that match the
     search text will be returned. The result size limit is 100 endpoints.
     """
+    from globus_sdk.paging import Paginator
+
     from globus_cli.services.transfer import (
         ENDPOINT_LIST_FIELDS,
         iterable_response_to_dict,
@@ -117,6 +118,7 @@ def endpoint_search(
     display(
         search_iterator,
         fields=ENDPOINT_LIST_FIELDS,
+        text_mode=TextMode.text_table_streaming,
         json_converter=iterable_response_to_dict,
     )
 
@@ -112,4 +112,5 @@ def endpoint_update(
 
     # make the update
     res = transfer_client.update_endpoint(endpoint_id, ep_doc)
+    Endpointish.forget(endpoint_id)
     display(res, text_mode=TextMode.text_raw, response_key="message")
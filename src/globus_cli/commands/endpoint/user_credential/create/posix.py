@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import uuid
 
-from globus_sdk.services.gcs import UserCredentialDocument
-
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, endpoint_id_arg
 from globus_cli.termio import display
@@ -27,6 +25,8 @@ def posix(
     """
     Create a User Credential for a POSIX storage gateway
     """
+    from globus_sdk.services.gcs import UserCredentialDocument
+
     gcs_client = login_manager.get_gcs_client(endpoint_id=endpoint_id)
     auth_client = login_manager.get_auth_client()
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 import uuid
 
 import click
-from globus_sdk.services.gcs import UserCredentialDocument
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, endpoint_id_arg
@@ -32,6 +31,8 @@ def s3(
     """
     Create a User Credential for an S3 Storage Gateway
     """
+    from globus_sdk.services.gcs import UserCredentialDocument
+
     gcs_client = login_manager.get_gcs_client(endpoint_id=endpoint_id)
     auth_client = login_manager.get_auth_client()
 
@@ -3,11 +3,10 @@ from __future__ import annotations
 import sys
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import ColonDelimitedChoiceTuple, command
-from globus_cli.termio import Field, display, formatters
+from globus_cli.termio import Field, TextMode, display, formatters
 from globus_cli.utils import PagingWrapper
 
 if sys.version_info >= (3, 8):
@@ -97,6 +96,8 @@ def list_command(
     """
     List flows
     """
+    from globus_sdk.paging import Paginator
+
     flows_client = login_manager.get_flows_client()
     paginator = Paginator.wrap(flows_client.list_flows)
     flow_iterator = PagingWrapper(
@@ -126,5 +127,6 @@ def list_command(
     display(
         flow_iterator,
         fields=fields,
+        text_mode=TextMode.text_table_streaming,
         json_converter=flow_iterator.json_converter,
     )
@@ -3,11 +3,10 @@ from __future__ import annotations
 import uuid
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
-from globus_cli.termio import Field, display
+from globus_cli.termio import Field, TextMode, display
 from globus_cli.utils import PagingWrapper
 
 
@@ -40,6 +39,7 @@ def list_command(
     Enumerates runs visible to the current user, potentially filtered by the ID of
     the flow which was used to start the run.
     """
+    from globus_sdk.paging import Paginator
 
     flows_client = login_manager.get_flows_client()
 
@@ -57,4 +57,9 @@ def list_command(
         Field("Status", "status"),
     ]
 
-    display(run_iterator, fields=fields, json_converter=run_iterator.json_converter)
+    display(
+        run_iterator,
+        fields=fields,
+        text_mode=TextMode.text_table_streaming,
+        json_converter=run_iterator.json_converter,
+    )
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import json
+import typing as t
 import uuid
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, run_id_arg
 from globus_cli.termio import Field, TextMode, display, print_command_hint
-from globus_cli.utils import PagingWrapper
+from globus_cli.utils import PagingWrapper, RecordListConverter
 
 
 @command("show-logs")
@@ -32,6 +32,14 @@ from globus_cli.utils import PagingWrapper
     type=click.IntRange(1),
     help="The maximum number of results to return.",
 )
+@click.option(
+    "--follow",
+    is_flag=True,
+    help=(
+        "After showing recent log entries, wait for new entries and show them as "
+        "they are logged, until the run completes."
+    ),
+)
 @LoginManager.requires_login("flows")
 def show_logs_command(
     login_manager: LoginManager,
@@ -40,12 +48,20 @@ def show_logs_command(
     details: bool,
     reverse: bool,
     limit: int,
+    follow: bool,
 ) -> None:
     """
     List run logs entries
 
     Enumerates the run log entries for a given run.
+
+    With '--follow', the most recent entries (up to '--limit') are shown, and then
+    new entries are shown as they are logged, until the run completes.
     """
+    from globus_sdk.paging import Paginator
+
+    if follow and reverse:
+        raise click.UsageError("--reverse cannot be used with --follow")
 
     flows_client = login_manager.get_flows_client()
 
@@ -53,29 +69,56 @@ def show_logs_command(
     run_doc = flows_client.get_run(run_id)
 
     paginator = Paginator.wrap(flows_client.get_run_logs)
-    entry_iterator = PagingWrapper(
-        paginator(run_id=run_id, reverse_order=reverse).items(),
-        limit=limit,
-        json_conversion_key="entries",
-    )
 
+    entry_iterator: t.Iterable[dict[str, t.Any]]
+    if follow:
+        from globus_cli.services.follow import follow_event_log
+
+        def fetch_entries() -> t.Iterator[dict[str, t.Any]]:
+            return paginator(run_id=run_id, reverse_order=True).items()
+
+        def run_is_done() -> bool:
+            status = flows_client.get_run(run_id)["status"]
+            return status in ("SUCCEEDED", "FAILED", "ENDED")
+
+        entry_iterator = follow_event_log(fetch_entries, run_is_done, limit=limit)
+        json_converter = RecordListConverter("entries")
+    else:
+        entry_iterator = PagingWrapper(
+            paginator(run_id=run_id, reverse_order=reverse).items(),
+            limit=limit,
+            json_conversion_key="entries",
+        )
+        json_converter = entry_iterator.json_converter
+
+    # when following, rows are printed as they arrive, so columns cannot be sized
+    # to fit their values; the last column is left unbounded
     fields = [
-        Field("Time", "time"),
-        Field("Code", "code"),
+        Field("Time", "time", width=32 if follow else None),
+        Field("Code", "code", width=20 if follow else None),
         Field("Description", "description"),
     ]
 
     if details:
         # Display the log entries, including the details field, in text record format.
         fields.append(Field("Details", "details"))
-        entry_list = list(entry_iterator)
-        for entry in entry_list:
-            entry["details"] = json.dumps(entry["details"])
 
+        def _with_serialized_details(
+            entries: t.Iterable[dict[str, t.Any]]
+        ) -> t.Iterator[dict[str, t.Any]]:
+            for entry in entries:
+                entry["details"] = json.dumps(entry["details"])
+                yield entry
+
+        # text records are printed as entries arrive, but JSON output is a list of
+        # entries, with or without --follow
         display(
-            entry_list,
+            _with_serialized_details(entry_iterator)
+            if follow
+            else list(_with_serialized_details(entry_iterator)),
             text_mode=TextMode.text_record_list,
             fields=fields,
+            json_converter=list if follow else None,
         )
     else:
         print_command_hint(
@@ -84,9 +127,16 @@ def show_logs_command(
         )
         # Display the log entries in a table.
         display(
-            entry_iterator, fields=fields, json_converter=entry_iterator.json_converter
+            entry_iterator,
+            fields=fields,
+            text_mode=TextMode.text_table_streaming,
+            json_converter=json_converter,
         )
 
+    # a followed run has completed, so the hints below do not apply
+    if follow:
+        return
+
     if run_doc["status"] == "INACTIVE":
         print_command_hint(
             (
@@ -97,6 +147,7 @@ def show_logs_command(
         )
 
     # Check if there are more results
+    assert isinstance(entry_iterator, PagingWrapper)
     if entry_iterator.has_next():
         print_command_hint(
             f"\nResults hidden by the current limit of {limit}. "
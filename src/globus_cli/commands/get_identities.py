@@ -1,9 +1,167 @@
+from __future__ import annotations
+
+import collections
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import click
+import globus_sdk
 
 from globus_cli.login_manager import LoginManager
-from globus_cli.parsing import IdentityType, command
+from globus_cli.parsing import IdentityType, ParsedIdentity, command
 from globus_cli.termio import Field, TextMode, display, is_verbose
-from globus_cli.utils import CLIStubResponse
+from globus_cli.utils import RecordListConverter
+
+# the maximum number of ids or usernames which may be sent in one request
+IDENTITY_LOOKUP_BATCH_SIZE = 100
+# the number of lookups to run at once
+IDENTITY_LOOKUP_CONCURRENCY = 4
+
+_IDENTITY_TYPE = IdentityType(allow_b32_usernames=True)
+
+
+def _lookup_key(value: ParsedIdentity) -> tuple[str, str]:
+    # usernames are case-insensitive, and Globus Auth returns them in lowercase
+    if value.idtype == "username":
+        return (value.idtype, value.value.lower())
+    return (value.idtype, value.value)
+
+
+class _LookupBatch:
+    """
+    A batch of unique values of one type (ids or usernames), looked up in a
+    single call. Once submitted, ``future`` resolves to a dict mapping each value's
+    lookup key to its identity record.
+    """
+
+    def __init__(self, idtype: str) -> None:
+        self.idtype = idtype
+        self.values: list[str] = []
+        self.future: Future[dict[tuple[str, str], dict[str, t.Any]]] | None = None
+
+
+def _lookup(
+    auth_client: globus_sdk.AuthClient, batch: _LookupBatch, provision: bool
+) -> dict[tuple[str, str], dict[str, t.Any]]:
+    if batch.idtype == "identity":
+        res = auth_client.get_identities(ids=batch.values, provision=provision)
+        field = "id"
+    else:
+        res = auth_client.get_identities(usernames=batch.values, provision=provision)
+        field = "username"
+    return {
+        _lookup_key(ParsedIdentity(identity[field], batch.idtype)): identity
+        for identity in res["identities"]
+    }
+
+
+def _resolve_identities(
+    auth_client: globus_sdk.AuthClient,
+    values: t.Iterable[ParsedIdentity],
+    provision: bool,
+    *,
+    batch_size: int,
+    concurrency: int,
+) -> t.Iterator[tuple[ParsedIdentity, dict[str, t.Any] | None]]:
+    """
+    Look up identities for a stream of values, yielding each value with its identity
+    record (or None if there is no such identity) in input order.
+
+    Values are deduplicated and grouped into batches by type. Batches are looked up
+    concurrently as they fill, and results are yielded as soon as they and all of
+    the results before them are available.
+    """
+    # the batch which each unique value was assigned to
+    assigned: dict[tuple[str, str], _LookupBatch] = {}
+    # the batches currently being filled, by type
+    filling: dict[str, _LookupBatch] = {}
+    # values which have not been yielded yet, in input order
+    pending: collections.deque[
+        tuple[ParsedIdentity, _LookupBatch]
+    ] = collections.deque()
+    # a bound on the number of pending values, so that output keeps flowing and
+    # memory use stays flat for large inputs
+    max_pending = batch_size * concurrency * 2
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def submit(batch: _LookupBatch) -> None:
+        if filling.get(batch.idtype) is batch:
+            del filling[batch.idtype]
+        batch.future = executor.submit(_lookup, auth_client, batch, provision)
+
+    def result(
+        value: ParsedIdentity, batch: _LookupBatch
+    ) -> tuple[ParsedIdentity, dict[str, t.Any] | None]:
+        if batch.future is None:
+            submit(batch)
+        assert batch.future is not None
+        return (value, batch.future.result().get(_lookup_key(value)))
+
+    try:
+        for value in values:
+            key = _lookup_key(value)
+            if key not in assigned:
+                batch = filling.setdefault(value.idtype, _LookupBatch(value.idtype))
+                batch.values.append(value.value)
+                assigned[key] = batch
+                if len(batch.values) >= batch_size:
+                    submit(batch)
+            pending.append((value, assigned[key]))
+
+            # yield anything which is ready, and wait on the oldest value if too
+            # many are waiting
+            while pending and (
+                len(pending) > max_pending
+                or (pending[0][1].future is not None and pending[0][1].future.done())
+            ):
+                yield result(*pending.popleft())
+
+        # the input is exhausted, so look up the last, partial, batches together
+        for batch in list(filling.values()):
+            submit(batch)
+        while pending:
+            yield result(*pending.popleft())
+    finally:
+        for batch in set(assigned.values()):
+            if batch.future is not None:
+                batch.future.cancel()
+        executor.shutdown()
+
+
+def _iter_values(
+    values: tuple[ParsedIdentity, ...], batch: t.TextIO | None
+) -> t.Iterator[ParsedIdentity]:
+    yield from values
+    if batch is None:
+        return
+    for lineno, line in enumerate(batch, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield _IDENTITY_TYPE.convert(line, None, None)
+        except click.BadParameter as err:
+            raise click.UsageError(f"--batch line {lineno}: {err.message}")
+
+
+def _unique_identities(
+    resolved: t.Iterable[tuple[ParsedIdentity, dict[str, t.Any] | None]]
+) -> t.Iterator[dict[str, t.Any]]:
+    seen = set()
+    for _, identity in resolved:
+        if identity is not None and identity["id"] not in seen:
+            seen.add(identity["id"])
+            yield identity
+
+
+class _IdentityListConverter(RecordListConverter):
+    """
+    Convert resolved (value, identity) pairs to the list of unique identities found.
+    """
+
+    def iter_records(self, iterable: t.Iterable[t.Any]) -> t.Iterator[t.Any]:
+        return super().iter_records(_unique_identities(iterable))
 
 
 @command(
@@ -30,14 +188,33 @@ Resolve multiple usernames and or IDs with tabular output
 $ globus get-identities --verbose go@globusid.org clitester1a@globusid.org \
 84942ca8-17c4-4080-9036-2f58e0093869
 ----
+
+Resolve a list of usernames and IDs, read from a file
+
+[source,bash]
+----
+$ globus get-identities --batch identities.txt
+----
 """,
 )
-@click.argument(
-    "values", type=IdentityType(allow_b32_usernames=True), required=True, nargs=-1
+@click.argument("values", type=_IDENTITY_TYPE, nargs=-1)
+@click.option(
+    "--batch",
+    type=click.File("r"),
+    help=(
+        "Read usernames and IDs from a file, one per line, after any given as "
+        "arguments. Use `-` to read from stdin."
+    ),
 )
 @click.option("--provision", hidden=True, is_flag=True)
 @LoginManager.requires_login("auth")
-def get_identities_command(login_manager: LoginManager, *, values, provision):
+def get_identities_command(
+    login_manager: LoginManager,
+    *,
+    values: tuple[ParsedIdentity, ...],
+    batch: t.TextIO | None,
+    provision: bool,
+) -> None:
     """
     Lookup Globus Auth Identities given one or more uuids
     and/or usernames.
@@ -47,55 +224,49 @@ def get_identities_command(login_manager: LoginManager, *, values, provision):
     If a particular input had no corresponding identity in Globus Auth,
     "NO_SUCH_IDENTITY" is printed instead.
 
-    If more fields are desired, --verbose will give tabular output, but does not
-    guarantee order and ignores inputs with no corresponding Globus Auth identity.
+    If more fields are desired, --verbose will give tabular output, with one row
+    per identity found. Inputs with no corresponding Globus Auth identity are
+    ignored.
+
+    Large numbers of inputs may be given with --batch. Lookups are sent in batches,
+    several at a time, and output is written as results arrive.
     """
+    if not values and batch is None:
+        raise click.UsageError(
+            "Missing argument 'VALUES...'. Either VALUES or --batch must be given."
+        )
+
     auth_client = login_manager.get_auth_client()
+    resolved = _resolve_identities(
+        auth_client,
+        _iter_values(values, batch),
+        provision,
+        batch_size=IDENTITY_LOOKUP_BATCH_SIZE,
+        concurrency=IDENTITY_LOOKUP_CONCURRENCY,
+    )
 
-    # since API doesn't accept mixed ids and usernames,
-    # split input values into separate lists
-    ids = [v.value for v in values if v.idtype == "identity"]
-    usernames = [v.value for v in values if v.idtype == "username"]
-
-    # make two calls to get_identities with ids and usernames
-    # then combine the calls into one response
-    results = []
-    if len(ids):
-        results += auth_client.get_identities(ids=ids, provision=provision)[
-            "identities"
-        ]
-    if len(usernames):
-        results += auth_client.get_identities(usernames=usernames, provision=provision)[
-            "identities"
-        ]
-    res = CLIStubResponse({"identities": results})
-
-    def _custom_text_format(identities):
+    def _custom_text_format(
+        results: t.Iterable[tuple[ParsedIdentity, dict[str, t.Any] | None]]
+    ) -> None:
         """
         Non-verbose text output is customized
-        """
 
-        def resolve_identity(value):
-            """
-            helper to deal with variable inputs and uncertain response order
-            """
-            for identity in identities:
-                if identity["id"] == value:
-                    return identity["username"]
-                if identity["username"] == value:
-                    return identity["id"]
-            return "NO_SUCH_IDENTITY"
-
-        # standard output is one resolved identity per line in the same order
-        # as the inputs. A resolved identity is either a username if given a
-        # UUID vice versa, or "NO_SUCH_IDENTITY" if the identity could not be
-        # found
-        for val in values:
-            click.echo(resolve_identity(val.value))
+        standard output is one resolved identity per line in the same order as the
+        inputs. A resolved identity is either a username if given a UUID vice versa,
+        or "NO_SUCH_IDENTITY" if the identity could not be found
+        """
+        for value, identity in results:
+            if identity is None:
+                click.echo("NO_SUCH_IDENTITY")
+            elif value.idtype == "identity":
+                click.echo(identity["username"])
+            else:
+                click.echo(identity["id"])
 
+    verbose = is_verbose()
     display(
-        res,
-        response_key="identities",
+        resolved,
+        json_converter=_IdentityListConverter("identities"),
         fields=[
             Field("ID", "id"),
             Field("Username", "username"),
@@ -103,7 +274,8 @@ def get_identities_command(login_manager: LoginManager, *, values, provision):
             Field("Organization", "organization"),
             Field("Email Address", "email"),
         ],
-        # verbose output is a table. Order not guaranteed, may contain
-        # duplicates
-        text_mode=(TextMode.text_table if is_verbose() else _custom_text_format),
+        # the table lists each identity found once, while the default output has a
+        # line for each input
+        response_key=_unique_identities if verbose else None,
+        text_mode=(TextMode.text_table_streaming if verbose else _custom_text_format),
     )
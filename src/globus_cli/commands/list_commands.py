@@ -4,30 +4,14 @@ import typing as t
 
 import click
 
+from globus_cli.manifest import get_command_manifest, iter_manifest_commands
 from globus_cli.parsing import command
-from globus_cli.reflect import walk_contexts
-from globus_cli.types import ClickContextTree
 
 
-def _print_command(cmd_ctx: click.Context) -> None:
+def _print_command(command_path: str, node: dict[str, t.Any]) -> None:
     # print commands with short_help
-    short_help = cmd_ctx.command.get_short_help_str()
-    name = cmd_ctx.command_path
-
-    click.echo(f"    {name}")
-    click.echo(f"        {short_help}\n")
-
-
-def _print_tree(
-    ctx: click.Context,
-    subcommands: list[click.Context],
-    subgroups: list[ClickContextTree],
-) -> None:
-    click.echo(f"\n=== {ctx.command_path} ===\n")
-    for cmd_ctx in subcommands:
-        _print_command(cmd_ctx)
-    for subctx, subsubcommands, subsubgroups in subgroups:
-        _print_tree(subctx, subsubcommands, subsubgroups)
+    click.echo(f"    {command_path}")
+    click.echo(f"        {node['help']}\n")
 
 
 @command(
@@ -49,11 +33,11 @@ def list_commands() -> None:
     are distinct. e.g. 'globus task update' is a distinct command from
     'globus endpoint update'.
     """
-    # get the root context (the click context for the entire CLI tree)
-    root_ctx = click.get_current_context().find_root()
-    ctx, subcmds, subgroups = walk_contexts(
-        "globus", t.cast(click.MultiCommand, root_ctx.command)
-    )
-    _print_tree(ctx, subcmds, subgroups)
+    # the commands are read from the manifest, so that they need not be loaded
+    manifest = get_command_manifest()
+    for group_path, _, subcommands in iter_manifest_commands(manifest["commands"]):
+        click.echo(f"\n=== {group_path} ===\n")
+        for command_path, node in subcommands:
+            _print_command(command_path, node)
     # get an extra newline at the end
     click.echo("")
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 import click
-from globus_sdk.scopes import GCSEndpointScopeBuilder
-from globus_sdk.services.flows import SpecificFlowClient
 
 from globus_cli.login_manager import LoginManager, is_client_login
 from globus_cli.parsing import command, no_local_server_option
@@ -105,6 +103,9 @@ def login_command(no_local_server, force, gcs_servers, flow_ids: tuple[str]):
     CLI's authorization page. After consenting you will then need to copy and paste the
     given access code from the web to the CLI.
     """
+    from globus_sdk.scopes import GCSEndpointScopeBuilder
+    from globus_sdk.services.flows import SpecificFlowClient
+
     manager = LoginManager()
 
     if is_client_login():
@@ -72,6 +72,10 @@ def logout_command(login_manager: LoginManager, *, ignore_errors: bool) -> None:
 
     https://docs.globus.org/cli/environment_variables/#profile_switching_with_globus_profile
     """
+    from globus_cli.cache import get_activation_cache, get_bookmark_index_cache
+    from globus_cli.endpointish import Endpointish
+    from globus_cli.services.transfer.task_index import clear_task_index
+
     # try to get the user's preferred username from userinfo
     # if an API error is raised, they probably are not logged in
     try:
@@ -144,6 +148,12 @@ def logout_command(login_manager: LoginManager, *, ignore_errors: bool) -> None:
 
     remove_well_known_config("auth_user_data")
 
+    # the task index holds the user's task history, so it goes with their tokens
+    clear_task_index()
+    get_bookmark_index_cache().clear()
+    get_activation_cache().clear()
+    Endpointish.clear_cache()
+
     if is_client_login():
         click.echo(_CLIENT_LOGOUT_EPILOG)
     else:
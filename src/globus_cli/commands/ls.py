@@ -14,7 +14,14 @@ from globus_cli.parsing import (
     local_user_option,
     mutex_option_group,
 )
-from globus_cli.termio import Field, display, formatters, is_verbose, outformat_is_text
+from globus_cli.termio import (
+    Field,
+    TextMode,
+    display,
+    formatters,
+    is_verbose,
+    outformat_is_text,
+)
 
 if sys.version_info >= (3, 8):
     from typing import Literal
@@ -166,6 +173,18 @@ $ globus ls $ep_id:/share/godata/ --filter '~*.txt'  # done with --filter, bette
         "this should behave like a non-recursive `ls`"
     ),
 )
+@click.option(
+    "--parallel",
+    "parallelism",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    metavar="N",
+    help=(
+        "For `--recursive` listings, list up to N directories at once. "
+        "The order of the output is the same regardless of this value."
+    ),
+)
 @local_user_option
 @mutex_option_group("--recursive", "--orderby")
 @LoginManager.requires_login("transfer")
@@ -174,6 +193,7 @@ def ls_command(
     *,
     endpoint_plus_path: tuple[uuid.UUID, str | None],
     recursive_depth_limit: int,
+    parallelism: int,
     recursive: bool,
     long_output: bool,
     show_hidden: bool,
@@ -264,7 +284,10 @@ def ls_command(
         res: (
             IterableTransferResponse | RecursiveLsResponse
         ) = transfer_client.recursive_operation_ls(
-            endpoint_id, ls_params, depth=recursive_depth_limit
+            endpoint_id,
+            ls_params,
+            depth=recursive_depth_limit,
+            parallelism=parallelism,
         )
     else:
         # format filter_val into a simple filter clause which operates on name
@@ -274,7 +297,19 @@ def ls_command(
         res = transfer_client.operation_ls(endpoint_id, **ls_params)
 
     # and then print it, per formatting rules
+    # recursive listings may be very large, so print them as they are read
     pathformatter = PathItemFormatter()
+
+    def _print_names(data: t.Iterable[t.Any]) -> None:
+        for item in data:
+            click.echo(pathformatter.parse(item))
+
+    text_mode: TextMode | t.Callable[[t.Any], None]
+    if long_output or is_verbose() or not outformat_is_text():
+        text_mode = TextMode.text_table_streaming if recursive else TextMode.text_table
+    else:
+        text_mode = _print_names
+
     display(
         res,
         fields=[
@@ -286,10 +321,6 @@ def ls_command(
             Field("File Type", "type"),
             Field("Filename", "@", formatter=pathformatter),
         ],
-        simple_text=(
-            None
-            if long_output or is_verbose() or not outformat_is_text()
-            else "\n".join(pathformatter.parse(x) for x in res)
-        ),
+        text_mode=text_mode,
         json_converter=iterable_response_to_dict,
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import sys
 import uuid
 
 import click
@@ -19,6 +20,11 @@ from globus_cli.termio import Field, display, err_is_terminal, term_is_interacti
 
 from ._common import transfer_task_wait_with_io
 
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
 
 @command(
     "rm",
@@ -64,6 +70,7 @@ def rm_command(
     meow: bool,
     heartbeat: bool,
     polling_interval: int,
+    polling_strategy: Literal["fixed", "adaptive"],
     timeout: int | None,
     timeout_exit_code: int,
 ):
@@ -138,6 +145,7 @@ def rm_command(
         heartbeat,
         polling_interval,
         timeout,
-        task_id,
+        [task_id],
         timeout_exit_code,
+        polling_strategy=polling_strategy,
     )
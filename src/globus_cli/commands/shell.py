@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import shlex
+import sys
+import typing as t
+
+import click
+
+from globus_cli.inprocess import invoke_main
+from globus_cli.login_manager import LoginManager
+from globus_cli.parsing import command
+
+_PROMPT = "globus> "
+_EXIT_COMMANDS = ("exit", "quit")
+
+
+def _reads_stdin(args: list[str]) -> bool:
+    """
+    Check if a command is given "-" as an argument or option value, asking it to read
+    from stdin.
+    """
+    return any(arg == "-" or arg.endswith("=-") for arg in args)
+
+
+def _read_lines(interactive: bool) -> t.Iterator[str]:
+    if not interactive:
+        yield from sys.stdin
+        return
+
+    try:
+        # enables line editing and history for input()
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+    while True:
+        try:
+            yield input(_PROMPT)
+        except KeyboardInterrupt:
+            # discard the current line, as a shell would
+            click.echo("")
+        except EOFError:
+            click.echo("")
+            return
+
+
+@command(
+    "shell",
+    short_help="Run many commands in one session",
+    disable_options=["format", "map_http_status"],
+    adoc_examples="""Run commands from a file, stopping at the first failure:
+
+[source,bash]
+----
+$ globus shell --exit-on-error < commands.txt
+----
+
+Run commands interactively:
+
+[source,bash]
+----
+$ globus shell
+globus> whoami
+globus> ls 'ddb59aef-6d04-11e5-ba46-22000b92c6ec:/'
+globus> exit
+----
+""",
+)
+@click.option(
+    "--exit-on-error",
+    is_flag=True,
+    help="Stop at the first command which fails, and exit with its status.",
+)
+def shell_command(*, exit_on_error: bool) -> None:
+    """
+    Run Globus CLI commands, one per line, in a single session.
+
+    Commands are read from the terminal, with a prompt, or from stdin, and are
+    written as they would be on the command line, with or without the leading
+    'globus'. Blank lines and lines starting with '#' are skipped. Enter 'exit' or
+    'quit', or end the input, to end the session.
+
+    All of the commands share one login session and one set of connections to
+    Globus services, so running many commands this way is much faster than
+    running each of them separately.
+
+    When commands are read from stdin, they cannot also read their input from
+    stdin, as with '--batch -'. Such commands are rejected. Read the input from a
+    file instead.
+
+    The exit status is that of the last command run.
+    """
+    interactive = sys.stdin.isatty()
+    status = 0
+
+    with LoginManager.shared():
+        for line in _read_lines(interactive):
+            try:
+                args = shlex.split(line, comments=True)
+            except ValueError as e:
+                click.echo(f"Could not parse command: {e}", err=True)
+                status = 2
+            else:
+                if args and args[0] == "globus":
+                    args = args[1:]
+                if not args:
+                    continue
+                if args[0] in _EXIT_COMMANDS:
+                    break
+                if args[0] == "shell":
+                    click.echo("'globus shell' cannot be run in a shell", err=True)
+                    status = 2
+                elif not interactive and _reads_stdin(args):
+                    # the command would read the rest of the commands as its input
+                    click.echo(
+                        "Commands cannot read from stdin ('-') when commands are "
+                        "read from stdin",
+                        err=True,
+                    )
+                    status = 2
+                else:
+                    status = invoke_main(args)
+
+            if status != 0 and exit_on_error:
+                break
+
+    click.get_current_context().exit(status)
@@ -10,6 +10,7 @@ from globus_cli.parsing import group
         "list": (".list", "task_list"),
         "pause-info": (".pause_info", "task_pause_info"),
         "show": (".show", "show_task"),
+        "sync": (".sync", "task_sync"),
         "update": (".update", "update_task"),
         "wait": (".wait", "task_wait"),
     },
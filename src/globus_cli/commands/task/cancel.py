@@ -4,7 +4,6 @@ import typing as t
 import uuid
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
@@ -62,6 +61,7 @@ def cancel_task(login_manager: LoginManager, *, all: bool, task_id: uuid.UUID) -
 
     You must either provide the '--all' option or a 'TASK_ID'.
     """
+    from globus_sdk.paging import Paginator
 
     if bool(all) + bool(task_id) != 1:
         raise click.UsageError(
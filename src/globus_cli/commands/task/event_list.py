@@ -5,11 +5,10 @@ import typing as t
 import uuid
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
-from globus_cli.termio import Field, display, formatters
+from globus_cli.termio import Field, TextMode, display, formatters
 from globus_cli.utils import PagingWrapper
 
 from ._common import task_id_arg
@@ -63,6 +62,13 @@ class SquashedJsonFormatter(formatters.FieldFormatter[t.Tuple[t.Any, bool]]):
 ----
 $ globus task pause-info TASK_ID --format JSON
 ----
+
+Watch a task for errors, printing each one as it occurs, until the task completes:
+
+[source,bash]
+----
+$ globus task event-list TASK_ID --filter-errors --follow
+----
 """,
 )
 @task_id_arg()
@@ -71,6 +77,14 @@ $ globus task pause-info TASK_ID --format JSON
 )
 @click.option("--filter-errors", is_flag=True, help="Filter results to errors")
 @click.option("--filter-non-errors", is_flag=True, help="Filter results to non errors")
+@click.option(
+    "--follow",
+    is_flag=True,
+    help=(
+        "After showing recent events, wait for new events and show them as they "
+        "occur, until the task completes."
+    ),
+)
 @LoginManager.requires_login("transfer")
 def task_event_list(
     login_manager: LoginManager,
@@ -79,6 +93,7 @@ def task_event_list(
     limit: int,
     filter_errors: bool,
     filter_non_errors: bool,
+    follow: bool,
 ) -> None:
     """
     This command shows the recent events for a running task.
@@ -90,9 +105,14 @@ def task_event_list(
     Events may be filtered using '--filter-errors' or '--filter-non-errors', but
     these two options may not be used in tandem.
 
+    With '--follow', events are shown oldest first. After the most recent events
+    (up to '--limit'), new events are shown as they occur, until the task completes.
+
     NOTE: Tasks older than one month may no longer have event log history. In this
     case, no events will be shown.
     """
+    from globus_sdk.paging import Paginator
+
     from globus_cli.services.transfer import iterable_response_to_dict
 
     transfer_client = login_manager.get_transfer_client()
@@ -111,22 +131,38 @@ def task_event_list(
         filter_string = ""
 
     paginator = Paginator.wrap(transfer_client.task_event_list)
-    event_iterator = PagingWrapper(
-        paginator(
+
+    def fetch_events() -> t.Iterator[dict[str, t.Any]]:
+        return paginator(
             task_id,
             # TODO: convert to `filter=filter_string` when SDK support is added
             query_params={"filter": filter_string},
-        ).items(),
-        limit=limit,
-    )
+        ).items()
+
+    # when following, rows are printed as they arrive, so columns cannot be sized
+    # to fit their values; the last column is left unbounded
+    fields = [
+        Field("Time", "time", width=25 if follow else None),
+        Field("Code", "code", width=20 if follow else None),
+        Field("Is Error", "is_error", width=8 if follow else None),
+        Field("Details", "details", formatter=SquashedJsonFormatter()),
+    ]
+
+    event_iterator: t.Iterable[dict[str, t.Any]]
+    if follow:
+        from globus_cli.services.follow import follow_event_log
+
+        def task_is_done() -> bool:
+            status = transfer_client.get_task(task_id)["status"]
+            return status in ("SUCCEEDED", "FAILED")
+
+        event_iterator = follow_event_log(fetch_events, task_is_done, limit=limit)
+    else:
+        event_iterator = PagingWrapper(fetch_events(), limit=limit)
 
     display(
         event_iterator,
-        fields=[
-            Field("Time", "time"),
-            Field("Code", "code"),
-            Field("Is Error", "is_error"),
-            Field("Details", "details", formatter=SquashedJsonFormatter()),
-        ],
+        fields=fields,
+        text_mode=TextMode.text_table_streaming,
         json_converter=iterable_response_to_dict,
     )
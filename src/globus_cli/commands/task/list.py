@@ -7,11 +7,10 @@ import typing as t
 import uuid
 
 import click
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import AnnotatedOption, command
-from globus_cli.termio import Field, display
+from globus_cli.termio import Field, TextMode, display
 from globus_cli.utils import PagingWrapper
 
 if sys.version_info >= (3, 8):
@@ -82,6 +81,14 @@ for id in $(globus task list --filter-status=INACTIVE \
 done
 ----
 
+List failed tasks from the local task index, after updating it:
+
+[source,bash]
+----
+$ globus task sync
+$ globus task list --from-index --filter-status FAILED --limit 100
+----
+
 Print out task statuses with links to their pages in the web UI:
 
 [source,bash]
@@ -168,7 +175,16 @@ globus task list --format=unix --jmespath='DATA[*].[task_id, status]' | \
     cls=AnnotatedOption,
     type_annotation=str,
 )
-@LoginManager.requires_login("transfer")
+@click.option(
+    "--from-index",
+    is_flag=True,
+    help=(
+        "List tasks from the local task index, which is updated by "
+        "'globus task sync', instead of fetching them from Globus. "
+        "Times are compared in UTC."
+    ),
+)
+@LoginManager.requires_login()
 def task_list(
     login_manager: LoginManager,
     *,
@@ -183,15 +199,67 @@ def task_list(
     filter_requested_before: str,
     filter_completed_after: str,
     filter_completed_before: str,
+    from_index: bool,
 ) -> None:
     """
     List tasks for the current user.
 
     This lists your most recent tasks. The tasks displayed may be filtered by a number
     of attributes, each with a separate commandline option.
+
+    With --from-index, tasks are read from a local index instead, which answers
+    queries quickly and offline, but only knows about tasks as of the last
+    'globus task sync'.
     """
+    from globus_sdk.paging import Paginator
+    from globus_sdk.scopes import TransferScopes
+
     from globus_cli.services.transfer import iterable_response_to_dict
 
+    fields = [
+        Field("Task ID", "task_id"),
+        Field("Status", "status"),
+        Field("Type", "type"),
+        Field("Source Display Name", "source_endpoint_display_name"),
+        Field("Dest Display Name", "destination_endpoint_display_name"),
+        Field("Label", "label"),
+    ]
+
+    if from_index:
+        from globus_cli.services.transfer.task_index import TaskIndex
+
+        index = TaskIndex()
+        try:
+            if index.synced_at is None:
+                raise click.UsageError(
+                    "The task index is empty. Run 'globus task sync' to fill it."
+                )
+            tasks = index.query(
+                task_ids=[str(x) for x in filter_task_id],
+                types=[filter_type] if filter_type else [],
+                statuses=filter_status,
+                labels=filter_label,
+                not_labels=filter_not_label,
+                inexact=inexact,
+                requested_after=filter_requested_after,
+                requested_before=filter_requested_before,
+                completed_after=filter_completed_after,
+                completed_before=filter_completed_before,
+                limit=limit,
+            )
+        finally:
+            index.close()
+        display(
+            tasks,
+            fields=fields,
+            text_mode=TextMode.text_table,
+            json_converter=iterable_response_to_dict,
+        )
+        return
+
+    # the index is read offline, so a login is only needed to list tasks from Globus
+    login_manager.assert_logins(TransferScopes.resource_server)
+
     def _process_filterval(
         prefix: str,
         value: str | t.Sequence[str | uuid.UUID] | None,
@@ -244,12 +312,9 @@ def task_list(
         limit=limit,
     )
 
-    fields = [
-        Field("Task ID", "task_id"),
-        Field("Status", "status"),
-        Field("Type", "type"),
-        Field("Source Display Name", "source_endpoint_display_name"),
-        Field("Dest Display Name", "destination_endpoint_display_name"),
-        Field("Label", "label"),
-    ]
-    display(task_iterator, fields=fields, json_converter=iterable_response_to_dict)
+    display(
+        task_iterator,
+        fields=fields,
+        text_mode=TextMode.text_table_streaming,
+        json_converter=iterable_response_to_dict,
+    )
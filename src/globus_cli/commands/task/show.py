@@ -4,7 +4,6 @@ import uuid
 
 import click
 import globus_sdk
-from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, mutex_option_group
@@ -65,6 +64,8 @@ SKIPPED_PATHS_FIELDS = [
 def print_successful_transfers(
     client: globus_sdk.TransferClient, task_id: uuid.UUID
 ) -> None:
+    from globus_sdk.paging import Paginator
+
     from globus_cli.services.transfer import iterable_response_to_dict
 
     paginator = Paginator.wrap(client.task_successful_transfers)
@@ -77,6 +78,8 @@ def print_successful_transfers(
 
 
 def print_skipped_errors(client: globus_sdk.TransferClient, task_id: uuid.UUID) -> None:
+    from globus_sdk.paging import Paginator
+
     from globus_cli.services.transfer import iterable_response_to_dict
 
     paginator = Paginator.wrap(client.task_skipped_errors)
@@ -0,0 +1,65 @@
+import click
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.parsing import command
+from globus_cli.termio import Field, TextMode, display
+
+
+@command(
+    "sync",
+    short_help="Update the local index of your tasks",
+    adoc_output="""When text output is requested, the following fields are used:
+
+- 'Tasks Fetched'
+- 'Tasks Indexed'
+- 'Watermark'
+""",
+    adoc_examples="""Update the index, and then list failed tasks from it:
+
+[source,bash]
+----
+$ globus task sync
+$ globus task list --from-index --filter-status FAILED --limit 100
+----
+""",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Discard the index and fetch all of your tasks again.",
+)
+@LoginManager.requires_login("transfer")
+def task_sync(login_manager: LoginManager, *, full: bool) -> None:
+    """
+    Update the local index of your tasks, which is used by
+    'globus task list --from-index'.
+
+    The first sync fetches all of your tasks. Later syncs fetch only the tasks
+    which were requested or completed since the previous sync, and any tasks which
+    were still running.
+    """
+    from globus_cli.services.transfer.task_index import TaskIndex, sync_task_index
+
+    transfer_client = login_manager.get_transfer_client()
+    index = TaskIndex()
+    try:
+        if full:
+            index.clear()
+        fetched = sync_task_index(transfer_client, index)
+        result = {
+            "fetched": fetched,
+            "indexed": index.count(),
+            "watermark": index.watermark,
+        }
+    finally:
+        index.close()
+
+    display(
+        result,
+        text_mode=TextMode.text_record,
+        fields=[
+            Field("Tasks Fetched", "fetched"),
+            Field("Tasks Indexed", "indexed"),
+            Field("Watermark", "watermark"),
+        ],
+    )
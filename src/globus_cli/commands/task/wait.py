@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+import sys
+import typing as t
 import uuid
 
+import click
+
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, synchronous_task_wait_options
 
 from .._common import transfer_task_wait_with_io
-from ._common import task_id_arg
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+
+def _read_task_ids(batch: t.TextIO) -> t.Iterator[uuid.UUID]:
+    for lineno, line in enumerate(batch, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield uuid.UUID(line)
+        except ValueError:
+            raise click.UsageError(
+                f"--batch line {lineno}: '{line}' is not a valid task ID"
+            )
 
 
 @command(
@@ -17,7 +38,8 @@ When text output is requested, no output is written to standard out. All output
 is written to standard error.
 
 When JSON output is requested, the standard error output remains, but the task
-status after waiting will be sent to stdout.
+status after waiting will be sent to stdout. When waiting on several tasks, their
+statuses are sent to stdout as a list, under the key "DATA".
 """,
     adoc_examples="""
 Wait 30 seconds for a task to complete, printing heartbeats to stderr and
@@ -34,9 +56,25 @@ Wait for a task without limit, silently, polling every 5 minutes:
 ----
 $ globus task wait --polling-interval 300 TASK_ID
 ----
+
+Wait for all of the tasks listed in a file, one ID per line, reporting each one
+as it completes:
+
+[source,bash]
+----
+$ globus task wait --batch task_ids.txt
+----
 """,
 )
-@task_id_arg()
+@click.argument("task_ids", metavar="[TASK_ID]...", type=click.UUID, nargs=-1)
+@click.option(
+    "--batch",
+    type=click.File("r"),
+    help=(
+        "Read task IDs from a file, one per line, in addition to any given as "
+        "arguments. Use `-` to read from stdin."
+    ),
+)
 @synchronous_task_wait_options
 @LoginManager.requires_login("transfer")
 def task_wait(
@@ -45,19 +83,33 @@ def task_wait(
     meow: bool,
     heartbeat: bool,
     polling_interval: int,
+    polling_strategy: Literal["fixed", "adaptive"],
     timeout: int | None,
-    task_id: uuid.UUID,
+    task_ids: tuple[uuid.UUID, ...],
+    batch: t.TextIO | None,
     timeout_exit_code: int,
 ) -> None:
     """
-    Wait for a task to complete.
+    Wait for one or more tasks to complete.
 
     This command waits until the timeout is reached, checking every 'M' seconds
     (where 'M' is the polling interval).
 
     If the task succeeds by then, it exits with status 0. Otherwise, it exits with
     status 1.
+
+    Any number of tasks may be given, as arguments or with --batch. They are all
+    checked together on each poll, and each completion is reported on stderr as it
+    happens. The command exits with status 0 if every task succeeds, and 1 if any
+    task fails. If no task has failed but some are still running at the timeout,
+    it exits with the --timeout-exit-code status.
     """
+    all_task_ids = list(task_ids)
+    if batch is not None:
+        all_task_ids.extend(_read_task_ids(batch))
+    if not all_task_ids:
+        raise click.UsageError("Missing argument 'TASK_ID'. Give a TASK_ID or --batch.")
+
     transfer_client = login_manager.get_transfer_client()
     transfer_task_wait_with_io(
         transfer_client,
@@ -65,6 +117,7 @@ def task_wait(
         heartbeat,
         polling_interval,
         timeout,
-        task_id,
+        all_task_ids,
         timeout_exit_code,
+        polling_strategy=polling_strategy,
     )
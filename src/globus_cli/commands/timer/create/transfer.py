@@ -152,7 +152,10 @@ def transfer_command(
     If you use `--batch` and supply a SOURCE_PATH and/or DEST_PATH via the commandline,
     these paths will be used as dir prefixes to any paths read from the `--batch` input.
     """
-    from globus_cli.services.transfer import add_batch_to_transfer_data, autoactivate
+    from globus_cli.services.transfer import (
+        add_batch_to_transfer_data,
+        autoactivate_endpoints,
+    )
 
     auth_client = login_manager.get_auth_client()
     timer_client = login_manager.get_timer_client()
@@ -189,13 +192,14 @@ def transfer_command(
 
     # the autoactivate helper may present output and exit in the case of v4 endpoints
     # which need activation (e.g. OA4MP)
-    autoactivate(transfer_client, source_endpoint, if_expires_in=86400)
-    autoactivate(transfer_client, dest_endpoint, if_expires_in=86400)
+    autoactivate_endpoints(
+        transfer_client, [source_endpoint, dest_endpoint], if_expires_in=86400
+    )
 
     # check if either source or dest requires the data_access scope, and if so
     # prompt the user to go through the requisite login flow
-    source_epish = Endpointish(source_endpoint, transfer_client=transfer_client)
-    dest_epish = Endpointish(dest_endpoint, transfer_client=transfer_client)
+    source_epish = Endpointish.resolve(source_endpoint, transfer_client=transfer_client)
+    dest_epish = Endpointish.resolve(dest_endpoint, transfer_client=transfer_client)
     needs_data_access: list[str] = []
     if source_epish.requires_data_access_scope:
         needs_data_access.append(str(source_endpoint))
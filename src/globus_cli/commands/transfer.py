@@ -4,6 +4,7 @@ import datetime
 import sys
 import typing as t
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 import globus_sdk
@@ -30,6 +31,72 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import Literal
 
+# the number of tasks to submit at once when a transfer is split into several tasks
+MAX_CONCURRENT_SUBMISSIONS = 4
+
+_ITEM_FIELDS = [
+    Field("Source Path", "source_path"),
+    Field("Dest Path", "destination_path"),
+    Field("Recursive", "recursive"),
+    Field("External Checksum", "external_checksum"),
+]
+
+
+def _submit_transfer_tasks(
+    transfer_client: globus_sdk.TransferClient, task_docs: list[dict[str, t.Any]]
+) -> list[tuple[dict[str, t.Any], globus_sdk.GlobusHTTPResponse]]:
+    """
+    Submit several transfer tasks concurrently, returning each document with its
+    response in order.
+
+    If any submission fails, the tasks which were submitted are displayed before
+    the first error is raised, so that they are not lost.
+    """
+    with ThreadPoolExecutor(
+        max_workers=min(len(task_docs), MAX_CONCURRENT_SUBMISSIONS)
+    ) as executor:
+        futures = [
+            executor.submit(transfer_client.submit_transfer, doc) for doc in task_docs
+        ]
+
+    submitted = []
+    error: Exception | None = None
+    for doc, future in zip(task_docs, futures):
+        try:
+            submitted.append((doc, future.result()))
+        except Exception as err:
+            error = error or err
+    if error is not None:
+        _display_submitted_tasks(submitted)
+        raise error
+    return submitted
+
+
+def _display_submitted_tasks(
+    submitted: list[tuple[dict[str, t.Any], globus_sdk.GlobusHTTPResponse]]
+) -> None:
+    display(
+        {
+            "tasks": [
+                {
+                    "task_number": number,
+                    "items": len(doc["DATA"]),
+                    "submission_id": doc["submission_id"],
+                    "task_id": res["task_id"],
+                }
+                for number, (doc, res) in enumerate(submitted, start=1)
+            ]
+        },
+        response_key="tasks",
+        json_converter=lambda _: {"tasks": [res.data for _, res in submitted]},
+        fields=[
+            Field("Task", "task_number"),
+            Field("Items", "items"),
+            Field("Submission ID", "submission_id"),
+            Field("Task ID", "task_id"),
+        ],
+    )
+
 
 @command(
     "transfer",
@@ -208,6 +275,24 @@ fi
         "mapped collections."
     ),
 )
+@click.option(
+    "--max-items-per-task",
+    type=click.IntRange(min=1),
+    metavar="N",
+    help=(
+        "Split the transfer into several tasks, each with at most N items. "
+        "The tasks are submitted together, and a table of their task IDs is shown."
+    ),
+)
+@click.option(
+    "--plan-sync",
+    is_flag=True,
+    help=(
+        "Compare the source and destination directories before submitting, and "
+        "only transfer files which are new, differ in size, or are newer on the "
+        "source."
+    ),
+)
 @click.option("--perf-cc", type=int, hidden=True)
 @click.option("--perf-p", type=int, hidden=True)
 @click.option("--perf-pp", type=int, hidden=True)
@@ -243,6 +328,8 @@ def transfer_command(
     perf_udt: bool | None,
     source_local_user: str | None,
     destination_local_user: str | None,
+    max_items_per_task: int | None,
+    plan_sync: bool,
 ) -> None:
     """
     Copy a file or directory from one endpoint to another as an asynchronous
@@ -321,9 +408,33 @@ def transfer_command(
     For example, `globus transfer --include *.txt --exclude * ...` will
     only transfer files ending in .txt found within the directory structure.
 
+    \b
+    === Splitting Large Transfers
+
+    With `--max-items-per-task N`, the files and directories to transfer are split
+    into several tasks of at most N items each, which are otherwise identical.
+    Each task is submitted with its own submission ID, so it is safe for any one
+    of them to be retried. Use `--dry-run` to see how the items will be split.
+
+    \b
+    === Planning Sync Transfers
+
+    With `--plan-sync`, SOURCE_PATH and DEST_PATH must be directories. Both are
+    listed recursively before the task is submitted, and only files which are
+    missing from the destination, differ in size, or are newer on the source are
+    transferred. Directories which are missing from the destination are transferred
+    whole. Nothing is deleted from the destination, and if nothing has changed, no
+    task is submitted. For large directories which are mostly unchanged, this
+    submits far fewer items than `--sync-level`.
+
     {AUTOMATIC_ACTIVATION}
     """
-    from globus_cli.services.transfer import add_batch_to_transfer_data, autoactivate
+    from globus_cli.services.transfer import (
+        add_batch_to_transfer_data,
+        autoactivate_endpoints,
+        plan_sync_transfer,
+        split_transfer_data,
+    )
 
     transfer_client = login_manager.get_transfer_client()
 
@@ -338,6 +449,12 @@ def transfer_command(
             f"Instead, use {option_name} on lines of --batch input which need it."
         )
 
+    if plan_sync and (batch or recursive is False or external_checksum or delete):
+        raise click.UsageError(
+            "--plan-sync cannot be used with --batch, --no-recursive, "
+            "--external-checksum, or --delete."
+        )
+
     if external_checksum and batch:
         raise click.UsageError(
             "You cannot use --external-checksum in addition to --batch. "
@@ -374,14 +491,54 @@ def transfer_command(
         additional_fields={**perf_opts, **notify},
     )
 
-    for rule in filter_rules:
-        method, name = rule
-        transfer_data.add_filter_rule(method=method, name=name, type="file")
-
     if batch:
         add_batch_to_transfer_data(
             cmd_source_path, cmd_dest_path, checksum_algorithm, transfer_data, batch
         )
+    elif plan_sync:
+        if cmd_source_path is None or cmd_dest_path is None:
+            raise click.UsageError("--plan-sync requires SOURCE_PATH and DEST_PATH")
+        # planning lists both endpoints, so they must be activated first, even for
+        # a dry run
+        if not skip_activation_check:
+            autoactivate_endpoints(
+                transfer_client, [source_endpoint, dest_endpoint], if_expires_in=60
+            )
+        plan = plan_sync_transfer(
+            transfer_client,
+            str(source_endpoint),
+            cmd_source_path,
+            str(dest_endpoint),
+            cmd_dest_path,
+            filter_rules=filter_rules,
+            source_local_user=source_local_user,
+            destination_local_user=destination_local_user,
+        )
+        click.echo(
+            f"Planned sync: {plan.new_files} new files, {plan.changed_files} "
+            f"changed files, {plan.new_dirs} new directories, "
+            f"{plan.unchanged_files} unchanged files",
+            err=True,
+        )
+        if plan.type_conflicts:
+            for conflict in plan.type_conflicts:
+                click.echo(
+                    f"Cannot sync {conflict.source_path} to "
+                    f"{conflict.destination_path}: one is a file and the other is "
+                    "a directory",
+                    err=True,
+                )
+            click.get_current_context().exit(1)
+        if not plan.items and not dry_run:
+            click.echo("Nothing to transfer.", err=True)
+            return
+        for plan_item in plan.items:
+            transfer_data.add_item(
+                plan_item.source_path,
+                plan_item.destination_path,
+                checksum_algorithm=checksum_algorithm,
+                recursive=plan_item.recursive,
+            )
     else:
         if cmd_source_path is None or cmd_dest_path is None:
             raise click.UsageError(
@@ -402,30 +559,58 @@ def transfer_command(
     else:
         has_recursive_items = False
 
-    if filter_rules and not has_recursive_items:
+    # with --plan-sync, the filters were applied to the files compared, and only
+    # new directories are transferred recursively
+    if filter_rules and not has_recursive_items and not plan_sync:
         raise click.UsageError(
             "--include and --exclude can only be used with --recursive transfers"
         )
+    # filter rules only apply to recursive items, and the service rejects them if
+    # there are none, as may happen with --plan-sync
+    if has_recursive_items:
+        for rule in filter_rules:
+            method, name = rule
+            transfer_data.add_filter_rule(method=method, name=name, type="file")
+
+    task_docs: list[dict[str, t.Any]] | None = None
+    if max_items_per_task is not None:
+        task_docs = split_transfer_data(transfer_data, max_items_per_task)
+        if submission_id and len(task_docs) > 1:
+            raise click.UsageError(
+                "You cannot use --submission-id when --max-items-per-task splits "
+                "the transfer into several tasks. Each task gets its own "
+                "submission ID."
+            )
 
     if dry_run:
-        display(
-            transfer_data.data,
-            response_key="DATA",
-            fields=[
-                Field("Source Path", "source_path"),
-                Field("Dest Path", "destination_path"),
-                Field("Recursive", "recursive"),
-                Field("External Checksum", "external_checksum"),
-            ],
-        )
+        if task_docs is not None:
+            display(
+                {
+                    "DATA": [
+                        {"task_number": number, **item}
+                        for number, doc in enumerate(task_docs, start=1)
+                        for item in doc["DATA"]
+                    ]
+                },
+                response_key="DATA",
+                json_converter=lambda _: {"tasks": task_docs},
+                fields=[Field("Task", "task_number")] + _ITEM_FIELDS,
+            )
+        else:
+            display(transfer_data.data, response_key="DATA", fields=_ITEM_FIELDS)
         # exit safely
         return
 
     # autoactivate after parsing all args and putting things together
-    # skip this if skip-activation-check is given
-    if not skip_activation_check:
-        autoactivate(transfer_client, source_endpoint, if_expires_in=60)
-        autoactivate(transfer_client, dest_endpoint, if_expires_in=60)
+    # skip this if skip-activation-check is given, or if it was done for --plan-sync
+    if not skip_activation_check and not plan_sync:
+        autoactivate_endpoints(
+            transfer_client, [source_endpoint, dest_endpoint], if_expires_in=60
+        )
+
+    if task_docs is not None:
+        _display_submitted_tasks(_submit_transfer_tasks(transfer_client, task_docs))
+        return
 
     res = transfer_client.submit_transfer(transfer_data)
     display(
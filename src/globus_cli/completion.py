@@ -0,0 +1,163 @@
+"""
+Shell completion served from the command manifest (see `globus_cli.manifest`).
+
+Completing with click requires the command being completed, so every completion
+request would load the modules of the command tree, and with them, much of
+globus_sdk. Instead, completion requests are answered from the manifest alone.
+Requests which the manifest cannot answer, such as values for parameters with
+dynamic completion, fall back to click.
+
+This module must not import the command tree or globus_sdk at import time.
+"""
+from __future__ import annotations
+
+import os
+import typing as t
+
+import click
+from click.shell_completion import CompletionItem
+
+from globus_cli.manifest import DYNAMIC
+
+COMPLETE_VAR = "_GLOBUS_COMPLETE"
+
+# the shells for which the manifest can answer completion requests
+_SHELLS = ("bash", "zsh")
+
+
+def _find_option(node: dict[str, t.Any], name: str) -> dict[str, t.Any] | None:
+    for option in node["options"]:
+        if name in option["opts"] or name in option["secondary_opts"]:
+            return t.cast(t.Dict[str, t.Any], option)
+    return None
+
+
+def _complete_value(spec: t.Any, incomplete: str) -> list[CompletionItem] | None:
+    if spec == DYNAMIC:
+        return None
+    if spec is None:
+        return []
+    if "choices" in spec:
+        if spec["case_sensitive"]:
+            return [
+                CompletionItem(c) for c in spec["choices"] if c.startswith(incomplete)
+            ]
+        incomplete = incomplete.lower()
+        return [
+            CompletionItem(c)
+            for c in spec["choices"]
+            if c.lower().startswith(incomplete)
+        ]
+    return [CompletionItem(incomplete, type=spec["type"])]
+
+
+def complete_from_manifest(
+    root: dict[str, t.Any], args: list[str], incomplete: str
+) -> list[CompletionItem] | None:
+    """
+    Compute completions as click would, given the arguments before the word being
+    completed. Returns None if the manifest cannot answer, e.g. for a parameter with
+    dynamic completion or for arguments it does not understand.
+    """
+    # find the command being completed, the options already used with it, and the
+    # number of positional arguments it has been given
+    node = root
+    used: list[dict[str, t.Any]] = []
+    positionals = 0
+    after_separator = False
+    idx = 0
+    while idx < len(args):
+        arg = args[idx]
+        idx += 1
+        if after_separator or not arg.startswith("-") or arg == "-":
+            if "commands" in node:
+                if arg not in node["commands"]:
+                    return None
+                node = node["commands"][arg]
+                used = []
+                positionals = 0
+            else:
+                positionals += 1
+        elif arg == "--":
+            after_separator = True
+        else:
+            name, eq, _ = arg.partition("=")
+            found = _find_option(node, name)
+            # combined short options, and other forms which need click's parser
+            if found is None:
+                return None
+            used.append(found)
+            if not found["flag"] and not eq:
+                idx += found["nargs"]
+
+    if incomplete == "=":
+        incomplete = ""
+    if "=" in incomplete and incomplete.startswith("-"):
+        name, _, incomplete = incomplete.partition("=")
+        args = [*args, name]
+
+    # the value of an option
+    if not ("--" not in args and incomplete.startswith("-")):
+        for option in node["options"]:
+            if option["flag"]:
+                continue
+            last_option = None
+            for index, arg in enumerate(reversed(args)):
+                if index + 1 > option["nargs"]:
+                    break
+                if arg.startswith("-"):
+                    last_option = arg
+            if last_option is not None and last_option in option["opts"]:
+                return _complete_value(option["complete"], incomplete)
+
+        # the value of an argument
+        for argument in node["arguments"]:
+            if argument["nargs"] == -1 or positionals < argument["nargs"]:
+                return _complete_value(argument["complete"], incomplete)
+            positionals -= argument["nargs"]
+
+    # the names of subcommands and options
+    results = [
+        CompletionItem(name, help=subnode["help"])
+        for name, subnode in node.get("commands", {}).items()
+        if name.startswith(incomplete) and not subnode["hidden"]
+    ]
+    if incomplete and not incomplete[0].isalnum():
+        for option in node["options"]:
+            if option["hidden"] or (
+                not option["multiple"] and any(o is option for o in used)
+            ):
+                continue
+            results.extend(
+                CompletionItem(name, help=option["help"])
+                for name in [*option["opts"], *option["secondary_opts"]]
+                if name.startswith(incomplete)
+            )
+    return results
+
+
+def is_completion_request() -> bool:
+    shell, _, instruction = os.environ.get(COMPLETE_VAR, "").partition("_")
+    return shell in _SHELLS and instruction == "complete"
+
+
+def serve_completion(manifest: dict[str, t.Any]) -> bool:
+    """
+    Answer the completion request in the environment from the manifest, printing
+    the completions. Returns False if the manifest cannot answer the request.
+    """
+    from click.shell_completion import get_completion_class
+
+    shell = os.environ[COMPLETE_VAR].partition("_")[0]
+    comp_cls = get_completion_class(shell)
+    if comp_cls is None:
+        return False
+    # the command is only used by click to compute completions, which is done here
+    comp = comp_cls(t.cast(click.Command, None), {}, "globus", COMPLETE_VAR)
+
+    args, incomplete = comp.get_completion_args()
+    items = complete_from_manifest(manifest["commands"], args, incomplete)
+    if items is None:
+        return False
+    click.echo("\n".join(comp.format_completion(item) for item in items))
+    return True
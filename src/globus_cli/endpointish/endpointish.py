@@ -7,11 +7,24 @@ import uuid
 import click
 import globus_sdk
 
+from globus_cli.cache import get_endpointish_cache
+
 from .entity_type import EntityType
 from .errors import ExpectedCollectionError, ExpectedEndpointError, WrongEntityTypeError
 
 log = logging.getLogger(__name__)
 
+# the fields of an endpoint document which are kept in the cache, enough to resolve
+# an ID to its entity type, its owning endpoint, and its GCS Manager
+_CACHED_FIELDS = (
+    "id",
+    "entity_type",
+    "owner_id",
+    "gcs_manager_url",
+    "host_endpoint_id",
+    "high_assurance",
+)
+
 
 class Endpointish:
     def __init__(
@@ -19,19 +32,59 @@ class Endpointish:
         endpoint_id: str | uuid.UUID,
         *,
         transfer_client: globus_sdk.TransferClient,
+        data: dict[str, t.Any] | None = None,
     ):
         self._client = transfer_client
         self.endpoint_id = endpoint_id
 
-        log.debug("Endpointish getting ep data")
-        res = self._client.get_endpoint(endpoint_id)
-        self.data = res.data
+        if data is None:
+            log.debug("Endpointish getting ep data")
+            res = self._client.get_endpoint(endpoint_id)
+            data = res.data
+            # any fetch of the document refreshes the cached fields
+            get_endpointish_cache()[str(endpoint_id)] = {
+                k: data.get(k) for k in _CACHED_FIELDS
+            }
+        self.data = data
         log.debug("Endpointish.data=%s", self.data)
 
         log.debug("Endpointish determine entity type")
         self.entity_type = EntityType.determine_entity_type(self.data)
         log.debug("Endpointish.entity_type=%s", self.entity_type)
 
+    @classmethod
+    def resolve(
+        cls,
+        endpoint_id: str | uuid.UUID,
+        *,
+        transfer_client: globus_sdk.TransferClient,
+    ) -> Endpointish:
+        """
+        Get an Endpointish with the cached fields of the endpoint document, fetching
+        the document only if it is not in the cache.
+
+        The ``data`` of the result may hold only the cached fields, so this is for
+        resolving an ID (e.g. to a GCS Manager), not for displaying the document.
+        """
+        try:
+            data = get_endpointish_cache()[str(endpoint_id)]
+        except KeyError:
+            return cls(endpoint_id, transfer_client=transfer_client)
+        log.debug("Endpointish using cached data for %s", endpoint_id)
+        return cls(endpoint_id, transfer_client=transfer_client, data=data)
+
+    @staticmethod
+    def forget(endpoint_id: str | uuid.UUID) -> None:
+        """
+        Remove an endpoint or collection from the cache, after it is deleted or
+        changed.
+        """
+        get_endpointish_cache().pop(str(endpoint_id), None)
+
+    @staticmethod
+    def clear_cache() -> None:
+        get_endpointish_cache().clear()
+
     @property
     def nice_type_name(self) -> str:
         return EntityType.nice_name(self.entity_type)
@@ -0,0 +1,21 @@
+"""
+The `globus` console script.
+
+Shell completion requests are answered here, from the command manifest, before the
+command tree is loaded. Everything else is handled by the `globus` click group.
+"""
+from __future__ import annotations
+
+
+def main() -> None:
+    from globus_cli import completion
+
+    if completion.is_completion_request():
+        from globus_cli.manifest import get_command_manifest
+
+        if completion.serve_completion(get_command_manifest()):
+            return
+
+    from globus_cli.commands import main as cli_main
+
+    cli_main()
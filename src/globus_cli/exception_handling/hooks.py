@@ -6,9 +6,9 @@ import typing as t
 import click
 import globus_sdk
 
+from globus_cli import termio
 from globus_cli.endpointish import WrongEntityTypeError
 from globus_cli.login_manager import MissingLoginError
-from globus_cli.termio import PrintableErrorField, write_error_info
 from globus_cli.utils import CLIAuthRequirementsError
 
 from .registry import error_handler
@@ -130,23 +130,24 @@ def _concrete_consent_required_hook(
 
 
 @error_handler(
+    error_class="GlobusAPIError",
     condition=lambda err: (
         (
             isinstance(err, globus_sdk.TransferAPIError)
             and err.code == "ClientError.AuthenticationFailed"
         )
         or (isinstance(err, globus_sdk.AuthAPIError) and err.code == "UNAUTHORIZED")
-    )
+    ),
 )
 def authentication_hook(
     exception: globus_sdk.TransferAPIError | globus_sdk.AuthAPIError,
 ) -> None:
-    write_error_info(
+    termio.write_error_info(
         "No Authentication Error",
         [
-            PrintableErrorField("HTTP status", exception.http_status),
-            PrintableErrorField("code", exception.code),
-            PrintableErrorField("message", exception.message, multiline=True),
+            termio.PrintableErrorField("HTTP status", exception.http_status),
+            termio.PrintableErrorField("code", exception.code),
+            termio.PrintableErrorField("message", exception.message, multiline=True),
         ],
         message=(
             "Globus CLI Error: No Authentication provided. Make sure "
@@ -157,13 +158,13 @@ def authentication_hook(
 
 @error_handler(error_class="TransferAPIError")
 def transferapi_hook(exception: globus_sdk.TransferAPIError) -> None:
-    write_error_info(
+    termio.write_error_info(
         "Transfer API Error",
         [
-            PrintableErrorField("HTTP status", exception.http_status),
-            PrintableErrorField("request_id", exception.request_id),
-            PrintableErrorField("code", exception.code),
-            PrintableErrorField("message", exception.message, multiline=True),
+            termio.PrintableErrorField("HTTP status", exception.http_status),
+            termio.PrintableErrorField("request_id", exception.request_id),
+            termio.PrintableErrorField("code", exception.code),
+            termio.PrintableErrorField("message", exception.message, multiline=True),
         ],
     )
 
@@ -174,11 +175,13 @@ def transferapi_hook(exception: globus_sdk.TransferAPIError) -> None:
 )
 def searchapi_validationerror_hook(exception: globus_sdk.SearchAPIError) -> None:
     fields = [
-        PrintableErrorField("HTTP status", exception.http_status),
+        termio.PrintableErrorField("HTTP status", exception.http_status),
         # FIXME: raw_json because SDK is not exposing `request_id` as an attribute
-        PrintableErrorField("request_id", (exception.raw_json or {}).get("request_id")),
-        PrintableErrorField("code", exception.code),
-        PrintableErrorField("message", exception.message, multiline=True),
+        termio.PrintableErrorField(
+            "request_id", (exception.raw_json or {}).get("request_id")
+        ),
+        termio.PrintableErrorField("code", exception.code),
+        termio.PrintableErrorField("message", exception.message, multiline=True),
     ]
     # FIXME: type cast because error_data type is incorrect
     # (needs upstream fix in SDK)
@@ -188,35 +191,43 @@ def searchapi_validationerror_hook(exception: globus_sdk.SearchAPIError) -> None
         if messages is not None and len(messages) == 1:
             error_location, details = next(iter(messages.items()))
             fields += [
-                PrintableErrorField("location", error_location),
-                PrintableErrorField("details", _pretty_json(details), multiline=True),
+                termio.PrintableErrorField("location", error_location),
+                termio.PrintableErrorField(
+                    "details", _pretty_json(details), multiline=True
+                ),
             ]
         elif messages is not None:
             fields += [
-                PrintableErrorField("details", _pretty_json(messages), multiline=True)
+                termio.PrintableErrorField(
+                    "details", _pretty_json(messages), multiline=True
+                )
             ]
 
-    write_error_info("Search API Error", fields)
+    termio.write_error_info("Search API Error", fields)
 
 
 @error_handler(error_class="SearchAPIError")
 def searchapi_hook(exception: globus_sdk.SearchAPIError) -> None:
     fields = [
-        PrintableErrorField("HTTP status", exception.http_status),
+        termio.PrintableErrorField("HTTP status", exception.http_status),
         # FIXME: raw_json because SDK is not exposing `request_id` as an attribute
-        PrintableErrorField("request_id", (exception.raw_json or {}).get("request_id")),
-        PrintableErrorField("code", exception.code),
-        PrintableErrorField("message", exception.message, multiline=True),
+        termio.PrintableErrorField(
+            "request_id", (exception.raw_json or {}).get("request_id")
+        ),
+        termio.PrintableErrorField("code", exception.code),
+        termio.PrintableErrorField("message", exception.message, multiline=True),
     ]
     # FIXME: type cast because error_data type is incorrect
     # (needs upstream fix in SDK)
     error_data = t.cast(t.Optional[dict], exception.error_data)
     if error_data is not None:
         fields += [
-            PrintableErrorField("error_data", _pretty_json(error_data, compact=True))
+            termio.PrintableErrorField(
+                "error_data", _pretty_json(error_data, compact=True)
+            )
         ]
 
-    write_error_info("Search API Error", fields)
+    termio.write_error_info("Search API Error", fields)
 
 
 @error_handler(
@@ -224,12 +235,12 @@ def searchapi_hook(exception: globus_sdk.SearchAPIError) -> None:
     condition=lambda err: err.message == "invalid_grant",
 )
 def invalidrefresh_hook(exception: globus_sdk.AuthAPIError) -> None:
-    write_error_info(
+    termio.write_error_info(
         "Invalid Refresh Token",
         [
-            PrintableErrorField("HTTP status", exception.http_status),
-            PrintableErrorField("code", exception.code),
-            PrintableErrorField("message", exception.message, multiline=True),
+            termio.PrintableErrorField("HTTP status", exception.http_status),
+            termio.PrintableErrorField("code", exception.code),
+            termio.PrintableErrorField("message", exception.message, multiline=True),
         ],
         message=(
             "Globus CLI Error: Your credentials are no longer "
@@ -240,35 +251,35 @@ def invalidrefresh_hook(exception: globus_sdk.AuthAPIError) -> None:
 
 @error_handler(error_class="AuthAPIError")
 def authapi_hook(exception: globus_sdk.AuthAPIError) -> None:
-    write_error_info(
+    termio.write_error_info(
         "Auth API Error",
         [
-            PrintableErrorField("HTTP status", exception.http_status),
-            PrintableErrorField("code", exception.code),
-            PrintableErrorField("message", exception.message, multiline=True),
+            termio.PrintableErrorField("HTTP status", exception.http_status),
+            termio.PrintableErrorField("code", exception.code),
+            termio.PrintableErrorField("message", exception.message, multiline=True),
         ],
     )
 
 
 @error_handler(error_class="GlobusAPIError")  # catch-all
 def globusapi_hook(exception: globus_sdk.GlobusAPIError) -> None:
-    write_error_info(
+    termio.write_error_info(
         "Globus API Error",
         [
-            PrintableErrorField("HTTP status", exception.http_status),
-            PrintableErrorField("code", exception.code),
-            PrintableErrorField("message", exception.message, multiline=True),
+            termio.PrintableErrorField("HTTP status", exception.http_status),
+            termio.PrintableErrorField("code", exception.code),
+            termio.PrintableErrorField("message", exception.message, multiline=True),
         ],
     )
 
 
 @error_handler(error_class="GlobusError")
 def globus_error_hook(exception: globus_sdk.GlobusError) -> None:
-    write_error_info(
+    termio.write_error_info(
         "Globus Error",
         [
-            PrintableErrorField("error_type", exception.__class__.__name__),
-            PrintableErrorField("message", str(exception), multiline=True),
+            termio.PrintableErrorField("error_type", exception.__class__.__name__),
+            termio.PrintableErrorField("message", str(exception), multiline=True),
         ],
     )
 
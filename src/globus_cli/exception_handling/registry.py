@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import sys
 import typing as t
 
 import click
@@ -53,6 +54,10 @@ def error_handler(
 def find_handler(exception: Exception) -> HOOK_TYPE | None:
     for handler, error_class, condition in _REGISTERED_HOOKS:
         if isinstance(error_class, str):
+            # an exception cannot be an SDK error if the SDK's errors were never
+            # loaded, and loading them to check is slow (they import requests)
+            if "globus_sdk.exc" not in sys.modules:
+                continue
             error_class_: type[Exception] = getattr(globus_sdk, error_class)
             assert issubclass(error_class_, Exception)
         else:
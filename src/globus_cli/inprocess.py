@@ -0,0 +1,112 @@
+"""
+Run CLI commands from Python, in the current process.
+
+`globus_cli.run` runs a command through the `globus` group, as the console script
+would, but does not print its output. Instead, it returns the data which the command
+would have displayed, as Python objects, along with its exit code. This avoids the
+cost of starting a new process and of parsing JSON output for every command.
+
+All commands run this way share one LoginManager, and so reuse the same clients and
+connections to Globus services.
+"""
+from __future__ import annotations
+
+import atexit
+import contextlib
+import dataclasses
+import io
+import typing as t
+
+if t.TYPE_CHECKING:
+    from globus_cli.login_manager import LoginManager
+
+# the LoginManager shared by all commands run with `run`, built on first use
+_login_manager: LoginManager | None = None
+
+
+@dataclasses.dataclass
+class Result:
+    """
+    The result of running a command with `globus_cli.run`.
+
+    ``data`` holds the data which the command displayed, in the form in which it
+    would be printed with ``--format json`` (and after any ``--jmespath`` query has
+    been applied). There is one item for each time the command displayed data, which
+    is once for most commands.
+
+    ``stdout`` and ``stderr`` hold any other text which the command printed, such as
+    error messages.
+    """
+
+    exit_code: int
+    data: list[t.Any]
+    stdout: str
+    stderr: str
+
+
+def invoke_main(args: list[str], **extra: t.Any) -> int:
+    """
+    Run a command through the `globus` group, as though it were run from the command
+    line, and return its exit status. ``extra`` is passed to the root click context.
+
+    Stored tokens and config are read again for each command, as they may have been
+    changed by another process since the last one.
+    """
+    from globus_cli.commands import main
+    from globus_cli.login_manager.tokenstore import clear_token_storage_snapshot
+
+    clear_token_storage_snapshot()
+
+    try:
+        main.main(args=args, prog_name="globus", **extra)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
+
+def _get_login_manager() -> LoginManager:
+    global _login_manager
+    from globus_cli.login_manager import LoginManager
+
+    if _login_manager is None:
+        _login_manager = LoginManager()
+        atexit.register(_login_manager.close)
+    return _login_manager
+
+
+def run(argv: t.Sequence[str]) -> Result:
+    """
+    Run a command, given its arguments (with or without the leading "globus"), and
+    return its result. Nothing is printed.
+
+    Output is captured by redirecting ``sys.stdout`` and ``sys.stderr``, so commands
+    must not be run from several threads at once.
+
+    >>> result = globus_cli.run(["task", "show", task_id])
+    >>> result.exit_code
+    0
+    >>> result.data[0]["status"]
+    'SUCCEEDED'
+    """
+    from globus_cli.login_manager import LoginManager
+    from globus_cli.parsing.command_state import CommandState
+
+    args = list(argv)
+    if args and args[0] == "globus":
+        args = args[1:]
+
+    state = CommandState()
+    state.captured_output = []
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with LoginManager.shared(_get_login_manager()):
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            exit_code = invoke_main(args, obj=state)
+
+    return Result(
+        exit_code=exit_code,
+        data=state.captured_output,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
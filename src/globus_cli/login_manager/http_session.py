@@ -0,0 +1,143 @@
+"""
+A pooled HTTP session, shared by all of the service clients built by a
+LoginManager.
+
+SDK clients each create their own ``requests.Session`` by default, so a command
+which talks to several services (e.g. Transfer and Auth) opens a new connection,
+with a new TLS handshake, for each client. Sharing one session lets every client
+draw keep-alive connections from the same pools.
+
+Pool sizes may be configured with environment variables:
+
+- GLOBUS_CLI_HTTP_POOL_CONNECTIONS: the number of hosts to keep pools for
+- GLOBUS_CLI_HTTP_POOL_MAXSIZE: the number of connections to keep per host
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import threading
+import typing as t
+
+import click
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+POOL_CONNECTIONS_ENV_VAR = "GLOBUS_CLI_HTTP_POOL_CONNECTIONS"
+POOL_MAXSIZE_ENV_VAR = "GLOBUS_CLI_HTTP_POOL_MAXSIZE"
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@dataclasses.dataclass
+class ConnectionStats:
+    requests: int
+    connections: int
+    hosts: int
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+
+class _TrackingAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which counts the requests it sends and remembers the connection
+    pools it has used, so that connection reuse can be reported.
+    """
+
+    def __init__(self, **kwargs: t.Any) -> None:
+        super().__init__(**kwargs)
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._pools: dict[t.Any, t.Any] = {}
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: t.Any
+    ) -> requests.Response:
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            # pools may be evicted from the pool manager, so hold onto them in
+            # order to keep their connection counts
+            pools = self.poolmanager.pools
+            with self._stats_lock:
+                self._requests += 1
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        self._pools[key] = pool
+
+    def stats(self) -> ConnectionStats:
+        with self._stats_lock:
+            return ConnectionStats(
+                requests=self._requests,
+                connections=sum(p.num_connections for p in self._pools.values()),
+                hosts=len(self._pools),
+            )
+
+
+def _read_pool_size(env_var: str, default: int) -> int:
+    value = os.getenv(env_var)
+    if not value:
+        return default
+    try:
+        size = int(value)
+        if size < 1:
+            raise ValueError()
+    except ValueError:
+        raise click.UsageError(
+            f"Couldn't parse {env_var} environment variable. "
+            f"Expected a positive integer, got '{value}'"
+        )
+    return size
+
+
+class PooledHTTPSession(requests.Session):
+    """
+    A ``requests.Session`` with configurable connection pools, which tracks how
+    often connections are reused.
+
+    :param pool_connections: The number of hosts to keep connection pools for.
+        Defaults to GLOBUS_CLI_HTTP_POOL_CONNECTIONS, or 10
+    :param pool_maxsize: The number of connections to keep in each pool.
+        Defaults to GLOBUS_CLI_HTTP_POOL_MAXSIZE, or 10
+    """
+
+    def __init__(
+        self, *, pool_connections: int | None = None, pool_maxsize: int | None = None
+    ) -> None:
+        super().__init__()
+        self._adapter = _TrackingAdapter(
+            pool_connections=(
+                pool_connections
+                if pool_connections is not None
+                else _read_pool_size(POOL_CONNECTIONS_ENV_VAR, DEFAULT_POOL_CONNECTIONS)
+            ),
+            pool_maxsize=(
+                pool_maxsize
+                if pool_maxsize is not None
+                else _read_pool_size(POOL_MAXSIZE_ENV_VAR, DEFAULT_POOL_MAXSIZE)
+            ),
+        )
+        self.mount("https://", self._adapter)
+        self.mount("http://", self._adapter)
+
+    def connection_stats(self) -> ConnectionStats:
+        return self._adapter.stats()
+
+    def log_connection_stats(self) -> None:
+        stats = self.connection_stats()
+        if stats.requests:
+            log.debug(
+                "HTTP connection pool: %d requests to %d hosts used %d connections "
+                "(%d reused)",
+                stats.requests,
+                stats.hosts,
+                stats.connections,
+                stats.reused,
+            )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import functools
 import sys
 import typing as t
@@ -37,6 +38,7 @@ if t.TYPE_CHECKING:
     from ..services.auth import CustomAuthClient
     from ..services.gcs import CustomGCSClient
     from ..services.transfer import CustomTransferClient
+    from .http_session import PooledHTTPSession
 
 if sys.version_info >= (3, 10):
     from typing import Concatenate, ParamSpec
@@ -45,12 +47,80 @@ else:
 
 P = ParamSpec("P")
 R = t.TypeVar("R")
+ClientT = t.TypeVar("ClientT", bound="globus_sdk.BaseClient")
 
 
 class LoginManager:
+    # the LoginManager used by all commands, within `LoginManager.shared()`
+    _shared_instance: LoginManager | None = None
+
     def __init__(self) -> None:
         self._token_storage = token_storage_adapter()
         self._nonstatic_requirements: dict[str, list[str | MutableScope]] = {}
+        self._http_session: PooledHTTPSession | None = None
+        # service clients, by resource server, with the token data they were built
+        # from
+        self._clients: dict[str, tuple[t.Any, globus_sdk.BaseClient]] = {}
+        # the token data which has_login last found valid, by resource server, so that
+        # commands sharing this manager do not validate the same tokens again
+        self._valid_logins: dict[str, t.Any] = {}
+
+    @classmethod
+    @contextlib.contextmanager
+    def shared(cls, manager: LoginManager | None = None) -> t.Iterator[LoginManager]:
+        """
+        Within this context, all commands which require login use one LoginManager,
+        rather than each building their own, so that its clients and HTTP connections
+        are reused from one command to the next.
+
+        If a manager is given, it is used and left open on exit, so that it can be
+        shared again later. Otherwise, one is built and is closed on exit.
+        """
+        if cls._shared_instance is not None:
+            yield cls._shared_instance
+            return
+
+        owned = manager is None
+        if manager is None:
+            manager = cls()
+        cls._shared_instance = manager
+        try:
+            yield manager
+        finally:
+            cls._shared_instance = None
+            if owned:
+                manager.close()
+
+    @property
+    def http_session(self) -> PooledHTTPSession:
+        """
+        The HTTP session shared by all clients built by this LoginManager, so that
+        they can reuse connections. It is created on first use.
+        """
+        from .http_session import PooledHTTPSession
+
+        if self._http_session is None:
+            self._http_session = PooledHTTPSession()
+        return self._http_session
+
+    def _use_http_session(self, client: ClientT) -> ClientT:
+        session = self.http_session
+        if client.transport.session is not session:
+            # the client's own session is unused, but holds connection pools
+            client.transport.session.close()
+            client.transport.session = session
+        return client
+
+    def close(self) -> None:
+        """
+        Close the shared HTTP session, logging connection reuse statistics.
+        """
+        self._clients.clear()
+        self._valid_logins.clear()
+        if self._http_session is not None:
+            self._http_session.log_connection_stats()
+            self._http_session.close()
+            self._http_session = None
 
     def add_requirement(
         self, rs_name: str, scopes: t.Sequence[str | MutableScope]
@@ -83,7 +153,7 @@ class LoginManager:
         return all(res)
 
     def _validate_token(self, token: str) -> bool:
-        auth_client = internal_auth_client()
+        auth_client = self._use_http_session(internal_auth_client())
         try:
             res = auth_client.oauth2_validate_token(token)
         # if the instance client is invalid, an AuthAPIError will be raised
@@ -103,6 +173,9 @@ class LoginManager:
         tokens = self._token_storage.get_token_data(resource_server)
         if tokens is None or "refresh_token" not in tokens:
             return False
+        # the login was checked already, and the stored tokens have not changed since
+        if self._valid_logins.get(resource_server) == tokens:
+            return True
 
         # for resource servers in the static scope set, check that the scope
         # requirements are satisfied by the token data
@@ -134,7 +207,10 @@ class LoginManager:
                 return False
 
         rt = tokens["refresh_token"]
-        return self._validate_token(rt)
+        if not self._validate_token(rt):
+            return False
+        self._valid_logins[resource_server] = tokens
+        return True
 
     def run_login_flow(
         self,
@@ -225,9 +301,19 @@ class LoginManager:
         ) -> t.Callable[P, R]:
             @functools.wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                manager = cls._shared_instance
+                if manager is not None:
+                    # requirements added by a previous command do not apply
+                    manager._nonstatic_requirements.clear()
+                    manager.assert_logins(*resource_servers)
+                    return func(manager, *args, **kwargs)
+
                 manager = cls()
-                manager.assert_logins(*resource_servers)
-                return func(manager, *args, **kwargs)
+                try:
+                    manager.assert_logins(*resource_servers)
+                    return func(manager, *args, **kwargs)
+                finally:
+                    manager.close()
 
             return wrapper
 
@@ -259,7 +345,7 @@ class LoginManager:
                 expires_at = tokens["expires_at_seconds"]
 
             return globus_sdk.ClientCredentialsAuthorizer(
-                confidential_client=get_client_login(),
+                confidential_client=self._use_http_session(get_client_login()),
                 scopes=scopes,
                 access_token=access_token,
                 expires_at=expires_at,
@@ -279,39 +365,63 @@ class LoginManager:
 
             return globus_sdk.RefreshTokenAuthorizer(
                 tokens["refresh_token"],
-                internal_auth_client(),
+                self._use_http_session(internal_auth_client()),
                 access_token=tokens["access_token"],
                 expires_at=tokens["expires_at_seconds"],
                 on_refresh=self._token_storage.on_refresh,
             )
 
+    def _get_service_client(
+        self, resource_server: str, client_class: type[ClientT]
+    ) -> ClientT:
+        """
+        Build a client for a service, or reuse the one built earlier, if the stored
+        tokens for the service have not changed since.
+        """
+        tokens = self._token_storage.get_token_data(resource_server)
+        if resource_server in self._clients:
+            cached_tokens, client = self._clients[resource_server]
+            if cached_tokens == tokens:
+                return t.cast(ClientT, client)
+
+        authorizer = self._get_client_authorizer(resource_server)
+        client = self._use_http_session(
+            client_class(authorizer=authorizer, app_name=version.app_name)
+        )
+        self._clients[resource_server] = (tokens, client)
+        return client
+
     def get_transfer_client(self) -> CustomTransferClient:
         from ..services.transfer import CustomTransferClient
 
-        authorizer = self._get_client_authorizer(TransferScopes.resource_server)
-        return CustomTransferClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_service_client(
+            TransferScopes.resource_server, CustomTransferClient
+        )
 
     def get_auth_client(self) -> CustomAuthClient:
         from ..services.auth import CustomAuthClient
 
-        authorizer = self._get_client_authorizer(AuthScopes.resource_server)
-        return CustomAuthClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_service_client(AuthScopes.resource_server, CustomAuthClient)
 
     def get_groups_client(self) -> globus_sdk.GroupsClient:
-        authorizer = self._get_client_authorizer(GroupsScopes.resource_server)
-        return globus_sdk.GroupsClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_service_client(
+            GroupsScopes.resource_server, globus_sdk.GroupsClient
+        )
 
     def get_flows_client(self) -> globus_sdk.FlowsClient:
-        authorizer = self._get_client_authorizer(FlowsScopes.resource_server)
-        return globus_sdk.FlowsClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_service_client(
+            FlowsScopes.resource_server, globus_sdk.FlowsClient
+        )
 
     def get_search_client(self) -> globus_sdk.SearchClient:
-        authorizer = self._get_client_authorizer(SearchScopes.resource_server)
-        return globus_sdk.SearchClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_service_client(
+            SearchScopes.resource_server, globus_sdk.SearchClient
+        )
 
     def get_timer_client(self) -> globus_sdk.TimerClient:
-        authorizer = self._get_client_authorizer(TimerScopes.resource_server)
-        return globus_sdk.TimerClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_service_client(
+            TimerScopes.resource_server, globus_sdk.TimerClient
+        )
 
     def _get_gcs_info(
         self,
@@ -325,10 +435,10 @@ class LoginManager:
         transfer_client = self.get_transfer_client()
 
         if collection_id is not None:
-            epish = Endpointish(collection_id, transfer_client=transfer_client)
+            epish = Endpointish.resolve(collection_id, transfer_client=transfer_client)
             resolved_ep_id = epish.get_collection_endpoint_id()
         elif endpoint_id is not None:
-            epish = Endpointish(endpoint_id, transfer_client=transfer_client)
+            epish = Endpointish.resolve(endpoint_id, transfer_client=transfer_client)
             epish.assert_entity_type(EntityType.GCSV5_ENDPOINT)
             resolved_ep_id = str(endpoint_id)
         else:  # pragma: no cover
@@ -341,7 +451,9 @@ class LoginManager:
     ) -> globus_sdk.SpecificFlowClient:
         # Create a SpecificFlowClient without an authorizer
         # to take advantage of its scope creation code.
-        client = globus_sdk.SpecificFlowClient(flow_id, app_name=version.app_name)
+        client = self._use_http_session(
+            globus_sdk.SpecificFlowClient(flow_id, app_name=version.app_name)
+        )
         assert client.scopes is not None
         self.add_requirement(client.scopes.resource_server, [client.scopes.user])
         self.assert_logins(client.scopes.resource_server, assume_flow=True)
@@ -382,9 +494,11 @@ class LoginManager:
                 f"Try login with '--gcs {gcs_id}' to fix."
             ),
         )
-        return CustomGCSClient(
-            epish.get_gcs_address(),
-            source_epish=epish,
-            authorizer=authorizer,
-            app_name=version.app_name,
+        return self._use_http_session(
+            CustomGCSClient(
+                epish.get_gcs_address(),
+                source_epish=epish,
+                authorizer=authorizer,
+                app_name=version.app_name,
+            )
         )
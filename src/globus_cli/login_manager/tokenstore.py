@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import dataclasses
+import json
 import os
 import sys
 import typing as t
 
 import globus_sdk
 
+from globus_cli.utils import ensure_data_dir
+
 from .client_login import get_client_login, is_client_login
 from .scopes import CURRENT_SCOPE_CONTRACT_VERSION
 
@@ -49,43 +53,16 @@ def internal_native_client() -> globus_sdk.NativeAppAuthClient:
     )
 
 
-def _get_data_dir() -> str:
-    # get the dir to store Globus CLI data
-    #
-    # on Windows, the datadir is typically
-    #   ~\AppData\Local\globus\cli
-    #
-    # on Linux and macOS, we use
-    #   ~/.globus/cli/
-    #
-    # This is not necessarily a match with XDG_DATA_HOME or macOS use of
-    # '~/Library/Application Support'. The simplified directories for non-Windows
-    # platforms will allow easier access to the dir if necessary in support of users
-    if sys.platform == "win32":
-        # try to get the app data dir, preferring the local appdata
-        datadir = os.getenv("LOCALAPPDATA", os.getenv("APPDATA"))
-        if not datadir:
-            home = os.path.expanduser("~")
-            datadir = os.path.join(home, "AppData", "Local")
-        return os.path.join(datadir, "globus", "cli")
-    else:
-        return os.path.expanduser("~/.globus/cli/")
-
-
-def _ensure_data_dir() -> str:
-    dirname = _get_data_dir()
-    try:
-        os.makedirs(dirname)
-    except FileExistsError:
-        pass
-    return dirname
-
-
 def _get_storage_filename() -> str:
-    datadir = _ensure_data_dir()
+    datadir = ensure_data_dir()
     return os.path.join(datadir, "storage.db")
 
 
+def _get_cache_filename() -> str:
+    datadir = ensure_data_dir()
+    return os.path.join(datadir, "cache.db")
+
+
 def _resolve_namespace() -> str:
     """
     expected user namespaces are:
@@ -110,17 +87,106 @@ def _resolve_namespace() -> str:
         return "userprofile/" + env + (f"/{profile}" if profile else "")
 
 
+# all token and config data for a namespace, read in one query
+_SNAPSHOT_QUERY = """\
+SELECT 'token', resource_server, token_data_json FROM token_storage
+WHERE namespace = ?
+UNION ALL
+SELECT 'config', config_name, config_data_json FROM config_storage
+WHERE namespace = ?
+"""
+
+
+@dataclasses.dataclass
+class _StorageSnapshot:
+    # JSON documents, by resource server and by config name, which are decoded on
+    # each read so that callers never share (and mutate) the cached data
+    tokens: dict[str, str]
+    config: dict[str, str]
+
+
 def build_storage_adapter(fname: str) -> SQLiteAdapter:
     """
     Customize the SQLiteAdapter with extra storage operation steps
     In order to avoid eager imports, which have a perf impact on the CLI, we need to
     define the class dynamically in this function.
+
+    The adapter reads all of the token and config data for its namespace in one
+    query, on first use, and answers later reads from that in-process snapshot.
+    Writes go to the database and to the snapshot. The snapshot is cleared with
+    `clear_snapshot`, so that data written by other processes is read again.
     """
     from globus_sdk.tokenstorage import SQLiteAdapter
 
     class GeneratedAdapterClass(SQLiteAdapter):
+        _snapshot: _StorageSnapshot | None = None
+
+        def _load_snapshot(self) -> _StorageSnapshot:
+            if self._snapshot is None:
+                snapshot = _StorageSnapshot(tokens={}, config={})
+                for kind, name, data_json in self._connection.execute(
+                    _SNAPSHOT_QUERY, (self.namespace, self.namespace)
+                ):
+                    if kind == "token":
+                        snapshot.tokens[name] = data_json
+                    else:
+                        snapshot.config[name] = data_json
+                self._snapshot = snapshot
+            return self._snapshot
+
+        def clear_snapshot(self) -> None:
+            self._snapshot = None
+
+        def get_token_data(self, resource_server: str) -> dict[str, t.Any] | None:
+            token_data_json = self._load_snapshot().tokens.get(resource_server)
+            if token_data_json is None:
+                return None
+            val = json.loads(token_data_json)
+            if not isinstance(val, dict):
+                raise ValueError("data error: token data was not saved as a dict")
+            return val
+
+        def get_by_resource_server(self) -> dict[str, t.Any]:
+            return {
+                resource_server: json.loads(token_data_json)
+                for resource_server, token_data_json in (
+                    self._load_snapshot().tokens.items()
+                )
+            }
+
+        def read_config(self, config_name: str) -> dict[str, t.Any] | None:
+            config_data_json = self._load_snapshot().config.get(config_name)
+            if config_data_json is None:
+                return None
+            val = json.loads(config_data_json)
+            if not isinstance(val, dict):
+                raise ValueError("reading config data and got non-dict result")
+            return val
+
+        def store_config(
+            self, config_name: str, config_dict: t.Mapping[str, t.Any]
+        ) -> None:
+            super().store_config(config_name, config_dict)
+            if self._snapshot is not None:
+                self._snapshot.config[config_name] = json.dumps(config_dict)
+
+        def remove_config(self, config_name: str) -> bool:
+            if self._snapshot is not None:
+                self._snapshot.config.pop(config_name, None)
+            return super().remove_config(config_name)
+
+        def remove_tokens_for_resource_server(self, resource_server: str) -> bool:
+            if self._snapshot is not None:
+                self._snapshot.tokens.pop(resource_server, None)
+            return super().remove_tokens_for_resource_server(resource_server)
+
         def store(self, token_response: globus_sdk.OAuthTokenResponse) -> None:
+            # n.b. refreshed tokens are also stored here, via `on_refresh`
             super().store(token_response)
+            if self._snapshot is not None:
+                for rs_name, token_data in token_response.by_resource_server.items():
+                    self._snapshot.tokens[rs_name] = json.dumps(token_data)
+
             # store contract versions for all of the tokens which were acquired
             # this could overwrite data from another CLI version *earlier or later* than
             # the current one
@@ -161,6 +227,20 @@ def token_storage_adapter() -> SQLiteAdapter:
     return as_proto._instance
 
 
+def clear_token_storage_snapshot() -> None:
+    """
+    If the token storage adapter has been built, make it read the stored data again on
+    next use, rather than answering from its snapshot.
+
+    This is done before each command run in a long-lived process, such as
+    `globus shell`, so that logins and logouts made elsewhere are seen.
+    """
+    instance = getattr(token_storage_adapter, "_instance", None)
+    clear_snapshot = getattr(instance, "clear_snapshot", None)
+    if clear_snapshot is not None:
+        clear_snapshot()
+
+
 def internal_auth_client() -> globus_sdk.ConfidentialAppAuthClient:
     """
     Pull template client credentials from storage and use them to create a
@@ -0,0 +1,197 @@
+"""
+A precomputed manifest of the command tree.
+
+Walking the command tree with click loads the module of every command, and with
+them, much of globus_sdk. Instead, the names, short help, options, arguments, and
+hidden flags of all commands are recorded in a manifest, stamped with the CLI version.
+Shell completion, `globus list-commands`, and the reference docs index are built from
+the manifest alone.
+
+The manifest is generated at build time and shipped in the package, see
+`scripts/generate_command_manifest.py`. If the packaged manifest is missing or was
+built for another version (as for a development build), one is built on first use and
+stored in the CLI data directory.
+
+This module must not import the command tree or globus_sdk at import time.
+"""
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+
+import click
+
+from globus_cli.utils import ensure_data_dir
+from globus_cli.version import __version__
+
+PACKAGED_MANIFEST_FILENAME = os.path.join(
+    os.path.dirname(__file__), "command_manifest.json"
+)
+
+# a parameter whose completions can only be computed by click
+DYNAMIC = "dynamic"
+
+
+def _get_cached_manifest_filename() -> str:
+    return os.path.join(ensure_data_dir(), "command_manifest.json")
+
+
+def _param_completion(param: click.Parameter) -> t.Any:
+    """
+    Describe how to complete the value of a parameter: with no completions, with a
+    fixed list of choices, with a file or dir completion, or dynamically.
+    """
+    if param._custom_shell_complete is not None:
+        return DYNAMIC
+
+    param_type = param.type
+    complete_method = type(param_type).shell_complete
+    if complete_method is click.ParamType.shell_complete:
+        return None
+    if complete_method is click.Choice.shell_complete:
+        assert isinstance(param_type, click.Choice)
+        return {
+            "choices": [str(c) for c in param_type.choices],
+            "case_sensitive": param_type.case_sensitive,
+        }
+    if complete_method is click.Path.shell_complete:
+        assert isinstance(param_type, click.Path)
+        dir_only = param_type.dir_okay and not param_type.file_okay
+        return {"type": "dir" if dir_only else "file"}
+    if complete_method is click.File.shell_complete:
+        return {"type": "file"}
+    return DYNAMIC
+
+
+def _command_node(ctx: click.Context) -> dict[str, t.Any]:
+    cmd = ctx.command
+    node: dict[str, t.Any] = {
+        "help": cmd.get_short_help_str(),
+        "hidden": cmd.hidden,
+        "options": [],
+        "arguments": [],
+    }
+    for param in cmd.get_params(ctx):
+        if isinstance(param, click.Option):
+            node["options"].append(
+                {
+                    "opts": param.opts,
+                    "secondary_opts": param.secondary_opts,
+                    "help": param.help,
+                    "hidden": param.hidden,
+                    "flag": bool(param.is_flag or param.count),
+                    "nargs": param.nargs,
+                    "multiple": param.multiple,
+                    "complete": _param_completion(param),
+                }
+            )
+        elif isinstance(param, click.Argument):
+            node["arguments"].append(
+                {"nargs": param.nargs, "complete": _param_completion(param)}
+            )
+    return node
+
+
+def _tree_node(tree: t.Any) -> dict[str, t.Any]:
+    ctx, subcmds, subgroups = tree
+    node = _command_node(ctx)
+
+    subnodes: dict[str, dict[str, t.Any]] = {}
+    for subctx in subcmds:
+        subnodes[subctx.info_name] = _command_node(subctx)
+    for subtree in subgroups:
+        subnodes[subtree[0].info_name] = _tree_node(subtree)
+    # keep the order in which the group lists its commands
+    node["commands"] = {
+        name: subnodes[name]
+        for name in ctx.command.list_commands(ctx)
+        if name in subnodes
+    }
+    return node
+
+
+def build_command_manifest(
+    cli_main: click.MultiCommand | None = None,
+) -> dict[str, t.Any]:
+    """
+    Build the manifest by walking the command tree. This loads every command.
+    """
+    from globus_cli.reflect import load_main_entrypoint, walk_contexts
+
+    if cli_main is None:
+        cli_main = load_main_entrypoint()
+    return {
+        "version": __version__,
+        "commands": _tree_node(walk_contexts("globus", cli_main, skip_hidden=False)),
+    }
+
+
+def _read_manifest(filename: str) -> dict[str, t.Any] | None:
+    try:
+        with open(filename, encoding="utf-8") as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != __version__:
+        return None
+    return manifest
+
+
+def load_command_manifest() -> dict[str, t.Any] | None:
+    """
+    Load the packaged manifest, or failing that, the one stored in the data dir.
+    Returns None if neither exists or was built for this version of the CLI.
+    """
+    manifest = _read_manifest(PACKAGED_MANIFEST_FILENAME)
+    if manifest is None:
+        manifest = _read_manifest(_get_cached_manifest_filename())
+    return manifest
+
+
+def save_command_manifest(manifest: dict[str, t.Any]) -> None:
+    """
+    Store a manifest in the data dir. Failures are ignored, as the manifest can
+    always be rebuilt.
+    """
+    try:
+        filename = _get_cached_manifest_filename()
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as fp:
+            json.dump(manifest, fp, separators=(",", ":"))
+        os.replace(tmp_filename, filename)
+    except OSError:
+        pass
+
+
+def get_command_manifest() -> dict[str, t.Any]:
+    """
+    Load the manifest, building and storing it if there is no usable one.
+    """
+    manifest = load_command_manifest()
+    if manifest is None:
+        manifest = build_command_manifest()
+        save_command_manifest(manifest)
+    return manifest
+
+
+def iter_manifest_commands(
+    node: dict[str, t.Any], command_path: str = "globus"
+) -> t.Iterator[tuple[str, dict[str, t.Any], list[tuple[str, dict[str, t.Any]]]]]:
+    """
+    Walk the visible groups of a manifest, as `reflect.walk_contexts` would, yielding
+    the path of each group, its node, and the paths and nodes of the (non-group)
+    commands in it.
+    """
+    subcommands, subgroups = [], []
+    for name, subnode in node["commands"].items():
+        if subnode["hidden"]:
+            continue
+        if "commands" in subnode:
+            subgroups.append((f"{command_path} {name}", subnode))
+        else:
+            subcommands.append((f"{command_path} {name}", subnode))
+
+    yield command_path, node, subcommands
+    for subgroup_path, subgroup in subgroups:
+        yield from iter_manifest_commands(subgroup, subgroup_path)
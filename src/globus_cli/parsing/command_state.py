@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import logging.config
 import typing as t
 import warnings
 
@@ -9,6 +8,7 @@ import click
 # Format Enum for output formatting
 # could use a namedtuple, but that's overkill
 JSON_FORMAT = "json"
+JSONL_FORMAT = "jsonl"
 TEXT_FORMAT = "text"
 UNIX_FORMAT = "unix"
 
@@ -16,6 +16,9 @@ F = t.TypeVar("F", bound=t.Union[t.Callable, click.Command])
 
 
 def _setup_logging(level="DEBUG"):
+    # logging.config is slow to import, and only needed when logging is enabled
+    import logging.config
+
     conf = {
         "version": 1,
         "formatters": {
@@ -52,6 +55,10 @@ class CommandState:
         self.verbosity: int = 0
         self.http_status_map: dict[int, int] = {}
         self.show_server_timing: bool = False
+        self.use_identity_cache: bool = True
+        # when set, `display` adds the data it is given to this list rather than
+        # printing it (see `globus_cli.run`)
+        self.captured_output: list[t.Any] | None = None
 
     def outformat_is_text(self) -> bool:
         return self.output_format == TEXT_FORMAT
@@ -59,6 +66,9 @@ class CommandState:
     def outformat_is_json(self) -> bool:
         return self.output_format == JSON_FORMAT
 
+    def outformat_is_jsonl(self) -> bool:
+        return self.output_format == JSONL_FORMAT
+
     def outformat_is_unix(self) -> bool:
         return self.output_format == UNIX_FORMAT
 
@@ -95,9 +105,13 @@ def format_option(f: F) -> F:
         "-F",
         "--format",
         type=click.Choice(
-            [UNIX_FORMAT, JSON_FORMAT, TEXT_FORMAT], case_sensitive=False
+            [UNIX_FORMAT, JSON_FORMAT, JSONL_FORMAT, TEXT_FORMAT],
+            case_sensitive=False,
+        ),
+        help=(
+            "Output format for stdout. Defaults to text. "
+            "JSONL prints lists of results with one JSON document per line."
         ),
-        help="Output format for stdout. Defaults to text.",
         expose_value=False,
         callback=callback,
     )(f)
@@ -231,6 +245,23 @@ def map_http_status_option(f: F) -> F:
     )(f)
 
 
+def no_identity_cache_option(f: F) -> F:
+    def callback(ctx, param, value):
+        if not value:
+            return
+        state = ctx.ensure_object(CommandState)
+        state.use_identity_cache = False
+
+    return click.option(
+        "--no-identity-cache",
+        is_flag=True,
+        hidden=True,
+        expose_value=False,
+        callback=callback,
+        help="Look up identities from Globus Auth, ignoring the local cache.",
+    )(f)
+
+
 def show_server_timing_option(f: F) -> F:
     def callback(ctx, param, value):
         if not value:
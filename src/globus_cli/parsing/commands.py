@@ -7,6 +7,7 @@ and all other components will be hidden internals.
 """
 from __future__ import annotations
 
+import functools
 import importlib
 import logging
 import sys
@@ -14,8 +15,7 @@ from shutil import get_terminal_size
 
 import click
 
-from globus_cli.exception_handling import custom_except_hook
-from globus_cli.termio import env_interactive
+from globus_cli import termio
 
 from .shared_options import common_options
 from .shell_completion import print_completer_option
@@ -23,6 +23,16 @@ from .shell_completion import print_completer_option
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_content_width() -> int | None:
+    # the terminal size is checked once, rather than once per command
+    try:
+        cols = get_terminal_size(fallback=(80, 20)).columns
+    except OSError:
+        return None
+    return cols if cols < 100 else int(0.8 * cols)
+
+
 class GlobusCommand(click.Command):
     """
     A custom command class which stores the special attributes
@@ -76,12 +86,9 @@ class GlobusCommand(click.Command):
         if "context_settings" not in kwargs:
             kwargs["context_settings"] = {}
         if "max_content_width" not in kwargs["context_settings"]:
-            try:
-                cols = get_terminal_size(fallback=(80, 20)).columns
-                content_width = cols if cols < 100 else int(0.8 * cols)
+            content_width = _get_content_width()
+            if content_width is not None:
                 kwargs["context_settings"]["max_content_width"] = content_width
-            except OSError:
-                pass
         super().__init__(*args, **kwargs)
 
     def invoke(self, ctx):
@@ -127,7 +134,7 @@ class GlobusCommand(click.Command):
 
 class GlobusCommandEnvChecks(GlobusCommand):
     def invoke(self, ctx):
-        env_interactive(raising=True)
+        termio.env_interactive(raising=True)
         return super().invoke(ctx)
 
 
@@ -212,6 +219,9 @@ class TopLevelGroup(GlobusCommandGroup):
         try:
             return super().invoke(ctx)
         except Exception:
+            # imported here, as exception_handling imports from this package
+            from globus_cli.exception_handling import custom_except_hook
+
             custom_except_hook(sys.exc_info())
 
 
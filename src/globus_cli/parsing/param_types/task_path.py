@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import re
+
 import click
 
+# matches any empty, "." or ".." path segment, which normalization would change
+_DENORMALIZED_SEGMENT = re.compile(r"//|(?:^|/)\.\.?(?:/|$)")
+
 
 def _normpath(path: str) -> str:
     """
@@ -21,6 +26,10 @@ def _normpath(path: str) -> str:
     Also, unlike normpath, we want to preserve trailing slashes because they may be
     required
     """
+    # most paths are already normalized, and can be returned as-is
+    if not _DENORMALIZED_SEGMENT.search(path):
+        return path
+
     initial_slash = 1 if path.startswith("/") else 0
     trailing_slash = 1 if path.endswith("/") and path != "/" else 0
     parts = path.split("/")
@@ -90,6 +99,20 @@ class TaskPath(click.ParamType):
     def get_type_annotation(self, param: click.Parameter) -> type:
         return TaskPath
 
+    def resolve(self, value: str) -> str:
+        """
+        Compute the path for a value, as ``convert`` would, but without validating
+        it or storing it on this object.
+        """
+        path = value
+        if self.base_dir:
+            path = _pathjoin(self.base_dir, path)
+        if self.coerce_to_dir and not path.endswith("/"):
+            path += "/"
+        if self.normalize:
+            path = _normpath(path)
+        return path
+
     def convert(
         self,
         value: str | TaskPath,
@@ -101,14 +124,8 @@ class TaskPath(click.ParamType):
         if isinstance(value, TaskPath):
             return value
 
-        self.orig_path = self.path = value
-
-        if self.base_dir:
-            self.path = _pathjoin(self.base_dir, self.path)
-        if self.coerce_to_dir and not self.path.endswith("/"):
-            self.path += "/"
-        if self.normalize:
-            self.path = _normpath(self.path)
+        self.orig_path = value
+        self.path = self.resolve(value)
 
         if self.require_absolute and not (
             self.path.startswith("/") or self.path.startswith("~")
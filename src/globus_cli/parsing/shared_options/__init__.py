@@ -10,6 +10,7 @@ from globus_cli.parsing.command_state import (
     debug_option,
     format_option,
     map_http_status_option,
+    no_identity_cache_option,
     show_server_timing_option,
     verbose_option,
 )
@@ -49,6 +50,7 @@ def common_options(
 
     f = debug_option(f)
     f = show_server_timing_option(f)
+    f = no_identity_cache_option(f)
     f = verbose_option(f)
     f = click.help_option("-h", "--help")(f)
 
@@ -221,7 +223,22 @@ def synchronous_task_wait_options(f):
         type=int,
         show_default=True,
         callback=polling_interval_callback,
-        help="Number of seconds between Task status checks.",
+        help=(
+            "Number of seconds between Task status checks. With "
+            "'--polling-strategy adaptive', the number of seconds before the "
+            "first check."
+        ),
+    )(f)
+    f = click.option(
+        "--polling-strategy",
+        type=click.Choice(("fixed", "adaptive")),
+        default="fixed",
+        show_default=True,
+        help=(
+            "How often to check Task status. 'fixed' checks every polling "
+            "interval. 'adaptive' checks often at first and less often as Tasks "
+            "keep running, with some randomness."
+        ),
     )(f)
     f = click.option(
         "--heartbeat",
@@ -0,0 +1,112 @@
+"""
+Following event logs, for commands with a ``--follow`` mode.
+
+Event logs (Transfer task events, Flows run logs) are read newest-first, and each
+poll stops reading as soon as it reaches events which were seen on a previous poll.
+Polling is adaptive: it is frequent while new events are arriving, and slows down
+when the log is quiet.
+"""
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+
+from globus_cli.services.transfer.polling import AdaptivePollingSchedule
+
+# the shortest interval between polls, used while events are arriving
+FOLLOW_POLLING_INTERVAL = 2.0
+# the longest interval between polls, reached when the log has been quiet
+FOLLOW_MAX_POLLING_INTERVAL = 60.0
+
+
+class EventTracker:
+    """
+    Pick out the events which have not been seen before from a log which is read
+    newest-first.
+
+    Events have no IDs, so the tracker remembers the latest event time seen and the
+    events seen with that time. Any event older than that time has been seen.
+    """
+
+    def __init__(self, time_key: str = "time") -> None:
+        self.time_key = time_key
+        self._last_time: str | None = None
+        self._seen_at_last_time: set[str] = set()
+
+    def new_events(
+        self, events: t.Iterable[dict[str, t.Any]], *, limit: int | None = None
+    ) -> list[dict[str, t.Any]]:
+        """
+        Read events, newest-first, until reaching events which have been seen, and
+        return the new events oldest-first. At most ``limit`` events are read.
+        """
+        new: list[dict[str, t.Any]] = []
+        for event in events:
+            if limit is not None and len(new) >= limit:
+                break
+            event_time = event.get(self.time_key) or ""
+            if self._last_time is not None:
+                if event_time < self._last_time:
+                    break
+                if event_time == self._last_time and (
+                    _event_key(event) in self._seen_at_last_time
+                ):
+                    continue
+            new.append(event)
+
+        for event in new:
+            event_time = event.get(self.time_key) or ""
+            if self._last_time is None or event_time > self._last_time:
+                self._last_time = event_time
+                self._seen_at_last_time = set()
+            if event_time == self._last_time:
+                self._seen_at_last_time.add(_event_key(event))
+
+        new.reverse()
+        return new
+
+
+def _event_key(event: dict[str, t.Any]) -> str:
+    return json.dumps(event, sort_keys=True)
+
+
+def follow_event_log(
+    fetch_events: t.Callable[[], t.Iterable[dict[str, t.Any]]],
+    is_done: t.Callable[[], bool],
+    *,
+    limit: int | None = None,
+    interval: float = FOLLOW_POLLING_INTERVAL,
+    max_interval: float = FOLLOW_MAX_POLLING_INTERVAL,
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Yield events from a log, oldest-first, as they arrive.
+
+    The first poll yields up to ``limit`` of the most recent events. Polling stops
+    once ``is_done`` reports that no more events will be added, after the events
+    logged up to that point have been yielded.
+
+    :param fetch_events: A callable which reads the event log, newest-first
+    :param is_done: A callable which checks if the log is finished, e.g. because its
+        task has completed
+    :param limit: The number of existing events to yield on the first poll
+    :param interval: The shortest interval between polls
+    :param max_interval: The longest interval between polls
+    """
+    tracker = EventTracker()
+    schedule = AdaptivePollingSchedule(interval, max_interval=max_interval)
+
+    first_poll = True
+    while True:
+        # check for completion before reading the log, so that no events which
+        # were logged before completion are missed
+        done = is_done()
+        events = tracker.new_events(fetch_events(), limit=limit if first_poll else None)
+        first_poll = False
+
+        yield from events
+        if done:
+            return
+        if events:
+            schedule.reset()
+        time.sleep(schedule.next_interval(()))
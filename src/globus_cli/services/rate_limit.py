@@ -0,0 +1,214 @@
+"""
+Client-side rate limiting for commands which make many API calls.
+
+A ``RateLimiter`` is a token bucket whose fill rate adapts to the service using
+AIMD (additive-increase, multiplicative-decrease): every successful request nudges
+the rate up, and every throttling response (429 or 503) cuts it down.
+
+Limiters are shared by key (e.g. by endpoint ID) via ``get_rate_limiter``, so that
+all of the requests a command makes against one endpoint draw from the same bucket.
+"""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+import time
+import typing as t
+
+import click
+from globus_sdk.transport import RetryCheckResult, RetryContext
+
+log = logging.getLogger(__name__)
+
+# status codes which indicate that the service wants clients to slow down
+THROTTLING_STATUS_CODES = (429, 503)
+
+# the environment variable used to configure rates, e.g.
+#   GLOBUS_CLI_RATE_LIMIT="20,<endpoint_id>=5"
+RATE_LIMIT_ENV_VAR = "GLOBUS_CLI_RATE_LIMIT"
+
+# defaults, in requests per second
+DEFAULT_RATE = 20.0
+DEFAULT_MAX_RATE = 100.0
+DEFAULT_MIN_RATE = 0.5
+
+# a thread-local record of the limiter (if any) governing the request currently
+# being made by each thread, so that the transport can report throttling to it
+_active = threading.local()
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket with an adaptive fill rate.
+
+    Callers wrap each request in ``with limiter.request(): ...``. Requests above the
+    current rate are delayed, rather than rejected.
+
+    :param rate: The initial rate, in requests per second
+    :param burst: The bucket capacity, i.e. how many requests may be made at once
+        before the rate applies. Defaults to the initial rate.
+    :param min_rate: The rate will never be reduced below this value
+    :param max_rate: The rate will never be increased above this value
+    :param increase: The amount by which the rate grows on each success
+    :param decrease_factor: The factor applied to the rate on each throttle
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        *,
+        burst: float | None = None,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float = DEFAULT_MAX_RATE,
+        increase: float = 0.1,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self._lock = threading.Lock()
+        self._min_rate = min(min_rate, rate)
+        self._max_rate = max(max_rate, rate)
+        self._rate = rate
+        self._burst = burst if burst is not None else max(rate, 1.0)
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._last_refill, 0.0)
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """
+        Take a token from the bucket, sleeping until it would have been available if
+        the bucket is empty.
+
+        Tokens are reserved under the lock and the sleep happens outside of it, so a
+        thread never waits more than once per request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(-self._tokens / self._rate, self._blocked_until - now, 0.0)
+
+        if delay > 0:
+            log.debug("rate limiter sleeping %.3f seconds", delay)
+            time.sleep(delay)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._increase)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+            # drain any saved-up burst capacity
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(
+                    self._blocked_until, time.monotonic() + retry_after
+                )
+            log.debug("rate limiter throttled, rate reduced to %.3f/s", self._rate)
+
+    @contextlib.contextmanager
+    def request(self) -> t.Iterator[None]:
+        """
+        A context manager which wraps a single request (including any retries the
+        transport makes) with rate limiting.
+        """
+        self.acquire()
+        previous = getattr(_active, "limiter", None)
+        _active.limiter = self
+        try:
+            yield
+        finally:
+            _active.limiter = previous
+        self.record_success()
+
+
+def observe_throttling(ctx: RetryContext) -> RetryCheckResult:
+    """
+    A retry check which never makes a retry decision, but reports throttling
+    responses to the active rate limiter of the current thread.
+
+    It must run ahead of the transport's default checks, which stop evaluation on
+    429 and 503 responses.
+    """
+    limiter: RateLimiter | None = getattr(_active, "limiter", None)
+    if (
+        limiter is not None
+        and ctx.response is not None
+        and ctx.response.status_code in THROTTLING_STATUS_CODES
+    ):
+        retry_after: float | None
+        try:
+            retry_after = float(ctx.response.headers.get("Retry-After", ""))
+        except ValueError:
+            retry_after = None
+        limiter.record_throttle(retry_after)
+    return RetryCheckResult.no_decision
+
+
+def _parse_rate_config(value: str) -> dict[str | None, float]:
+    """
+    Parse a comma-delimited rate configuration. Each element is either a rate, which
+    sets the default, or KEY=RATE, which sets the rate for a specific key.
+
+    The default is stored under the key ``None``.
+    """
+    config: dict[str | None, float] = {}
+    for part in (x.strip() for x in value.split(",")):
+        if not part:
+            continue
+        key, _, rate_str = part.rpartition("=")
+        rate = float(rate_str)
+        if rate <= 0:
+            raise ValueError("rates must be positive")
+        config[key.strip().lower() or None] = rate
+    return config
+
+
+def _configured_rate(key: str | None) -> float:
+    value = os.getenv(RATE_LIMIT_ENV_VAR)
+    if not value:
+        return DEFAULT_RATE
+    try:
+        config = _parse_rate_config(value)
+    except ValueError:
+        raise click.UsageError(
+            f"Couldn't parse {RATE_LIMIT_ENV_VAR} environment variable. "
+            f"Expected a comma-delimited list of RATE or KEY=RATE, got '{value}'"
+        )
+    if key is not None and key.lower() in config:
+        return config[key.lower()]
+    return config.get(None, DEFAULT_RATE)
+
+
+_limiters: dict[str | None, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str | None = None) -> RateLimiter:
+    """
+    Get the shared rate limiter for a key (e.g. an endpoint ID), creating it if
+    necessary. Initial rates are read from the GLOBUS_CLI_RATE_LIMIT environment
+    variable.
+    """
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(_configured_rate(key))
+        return _limiters[key]
@@ -5,6 +5,8 @@ from globus_cli.termio import Field, formatters
 from .activation import (
     activation_requirements_help_text,
     autoactivate,
+    autoactivate_endpoints,
+    forget_activation,
     supported_activation_methods,
 )
 from .client import CustomTransferClient
@@ -13,9 +15,12 @@ from .data import (
     assemble_generic_doc,
     display_name_or_cname,
     iterable_response_to_dict,
+    split_transfer_data,
 )
 from .delegate_proxy import fill_delegate_proxy_activation_requirements
+from .delete_plan import DeletePlan, plan_delete_paths
 from .recursive_ls import RecursiveLsResponse
+from .sync_plan import SyncPlan, SyncPlanItem, plan_sync_transfer
 
 
 class _NameFormatter(formatters.StrFormatter):
@@ -39,9 +44,17 @@ __all__ = (
     "supported_activation_methods",
     "activation_requirements_help_text",
     "autoactivate",
+    "autoactivate_endpoints",
+    "forget_activation",
     "fill_delegate_proxy_activation_requirements",
     "display_name_or_cname",
     "iterable_response_to_dict",
     "assemble_generic_doc",
     "add_batch_to_transfer_data",
+    "split_transfer_data",
+    "DeletePlan",
+    "plan_delete_paths",
+    "SyncPlan",
+    "SyncPlanItem",
+    "plan_sync_transfer",
 )
@@ -1,5 +1,19 @@
+from __future__ import annotations
+
+import logging
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 
+from globus_cli.cache import PersistentCache, get_activation_cache
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+
+log = logging.getLogger(__name__)
+
 
 def supported_activation_methods(res):
     """
@@ -76,27 +90,107 @@ def activation_requirements_help_text(res, ep_id):
     return "".join(lines)
 
 
+def _cached_activation_is_valid(
+    cache: PersistentCache, endpoint_id: str, if_expires_in: int | None
+) -> bool:
+    """
+    Check if the cache shows that an endpoint is activated, and will stay activated
+    for more than ``if_expires_in`` seconds.
+    """
+    try:
+        entry = cache[endpoint_id]
+    except KeyError:
+        return False
+    expires_at = entry.get("expires_at")
+    # activation which never expires
+    if expires_at is None:
+        return True
+    return bool(expires_at - time.time() > (if_expires_in or 0))
+
+
+def _autoactivate_request(
+    client: globus_sdk.TransferClient,
+    endpoint_id: str,
+    if_expires_in: int | None,
+    cache: PersistentCache,
+) -> globus_sdk.GlobusHTTPResponse | None:
+    """
+    Autoactivate an endpoint, unless the cache shows that it is already activated.
+
+    Successful activations are cached, with their expiry times. Returns the
+    autoactivation response, or None if the request was skipped.
+    """
+    if _cached_activation_is_valid(cache, endpoint_id, if_expires_in):
+        log.debug("skipping autoactivation of %s: activation is cached", endpoint_id)
+        return None
+
+    res = client.endpoint_autoactivate(endpoint_id, if_expires_in=if_expires_in)
+    if res["code"] != "AutoActivationFailed":
+        expires_in = res.get("expires_in")
+        if isinstance(expires_in, int):
+            cache[endpoint_id] = {
+                "expires_at": time.time() + expires_in if expires_in >= 0 else None
+            }
+    return res
+
+
+def _exit_with_activation_help(
+    res: globus_sdk.GlobusHTTPResponse, endpoint_id: str
+) -> None:
+    message = (
+        "The endpoint could not be auto-activated and must be "
+        "activated before it can be used.\n\n"
+        + activation_requirements_help_text(res, endpoint_id)
+    )
+
+    click.echo(message, err=True)
+    click.get_current_context().exit(1)
+
+
 def autoactivate(client, endpoint_id, if_expires_in=None):
     """
     Attempts to auto-activate the given endpoint with the given client
     If auto-activation fails, parses the returned activation requirements
     to determine which methods of activation are supported, then tells
     the user to use 'globus endpoint activate' with the correct options(s)
+
+    Activation is cached briefly, and the request is skipped (returning None) if
+    the cache shows that the endpoint will stay activated for more than
+    ``if_expires_in`` seconds.
+    """
+    res = _autoactivate_request(
+        client, str(endpoint_id), if_expires_in, get_activation_cache()
+    )
+    if res is not None and res["code"] == "AutoActivationFailed":
+        _exit_with_activation_help(res, endpoint_id)
+    return res
+
+
+def autoactivate_endpoints(client, endpoint_ids, if_expires_in=None):
+    """
+    Auto-activate several endpoints at once, as with ``autoactivate``.
+
+    If any endpoint cannot be auto-activated, help for the first such endpoint (in
+    the order given) is shown.
+    """
+    endpoint_ids = list(dict.fromkeys(str(x) for x in endpoint_ids))
+    cache = get_activation_cache()
+    with ThreadPoolExecutor(max_workers=max(len(endpoint_ids), 1)) as executor:
+        futures = [
+            executor.submit(
+                _autoactivate_request, client, endpoint_id, if_expires_in, cache
+            )
+            for endpoint_id in endpoint_ids
+        ]
+    results = [future.result() for future in futures]
+    for endpoint_id, res in zip(endpoint_ids, results):
+        if res is not None and res["code"] == "AutoActivationFailed":
+            _exit_with_activation_help(res, endpoint_id)
+    return results
+
+
+def forget_activation(endpoint_id):
+    """
+    Remove an endpoint from the activation cache, after its activation changes.
     """
-    kwargs = {}
-    if if_expires_in is not None:
-        kwargs["if_expires_in"] = if_expires_in
-
-    res = client.endpoint_autoactivate(endpoint_id, **kwargs)
-    if res["code"] == "AutoActivationFailed":
-        message = (
-            "The endpoint could not be auto-activated and must be "
-            "activated before it can be used.\n\n"
-            + activation_requirements_help_text(res, endpoint_id)
-        )
-
-        click.echo(message, err=True)
-        click.get_current_context().exit(1)
-
-    else:
-        return res
+    get_activation_cache().pop(str(endpoint_id), None)
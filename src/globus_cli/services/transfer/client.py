@@ -15,6 +15,7 @@ from globus_sdk.transport import (
 )
 
 from globus_cli.login_manager import get_client_login, is_client_login
+from globus_cli.services.rate_limit import observe_throttling
 
 from .data import display_name_or_cname
 from .recursive_ls import RecursiveLsResponse
@@ -47,6 +48,9 @@ class CustomTransferClient(globus_sdk.TransferClient):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.transport.register_retry_check(_retry_client_consent)
+        # throttling must be observed before the default checks, which decide to
+        # retry 429s and 503s (ending evaluation of the checks)
+        self.transport.retry_checks.insert(0, observe_throttling)
 
     # TODO: Remove this function when endpoints natively support recursive ls
     def recursive_operation_ls(
@@ -54,6 +58,8 @@ class CustomTransferClient(globus_sdk.TransferClient):
         endpoint_id: str | uuid.UUID,
         params: dict[str, t.Any],
         depth: int = 3,
+        *,
+        parallelism: int = 1,
     ) -> RecursiveLsResponse:
         """
         Makes recursive calls to ``GET /operation/endpoint/<endpoint_id>/ls``
@@ -67,15 +73,20 @@ class CustomTransferClient(globus_sdk.TransferClient):
             in params, the start path is determined by this endpoint.
         :param params: Parameters that will be passed through as query params.
         :param depth: The maximum file depth the recursive ls will go to.
+        :param parallelism: The maximum number of ls calls to make concurrently.
+            The order of results does not depend on this value.
         """
         endpoint_id = str(endpoint_id)
         log.info(
-            "TransferClient.recursive_operation_ls(%s, %s, %s)",
+            "TransferClient.recursive_operation_ls(%s, %s, %s, parallelism=%s)",
             endpoint_id,
             depth,
             params,
+            parallelism,
+        )
+        return RecursiveLsResponse(
+            self, endpoint_id, params, max_depth=depth, parallelism=parallelism
         )
-        return RecursiveLsResponse(self, endpoint_id, params, max_depth=depth)
 
     def get_endpoint_w_server_list(
         self, endpoint_id
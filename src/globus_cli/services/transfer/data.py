@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import typing as t
 import uuid
 
@@ -8,7 +9,13 @@ import globus_sdk
 
 from globus_cli.constants import ExplicitNullType
 from globus_cli.parsing import TaskPath, mutex_option_group
-from globus_cli.utils import shlex_process_stream
+from globus_cli.utils import RecordListConverter, shlex_process_stream
+
+# a line of batch input which is exactly two paths, with no quoting, escaping,
+# comments, or options -- such lines are parsed without shlex or click
+_SIMPLE_BATCH_LINE = re.compile(
+    r"[ \t]*([^\s'\"\\#-][^\s'\"\\#]*)[ \t]+([^\s'\"\\#-][^\s'\"\\#]*)[ \t\r\n]*"
+)
 
 
 def add_batch_to_transfer_data(
@@ -37,23 +44,71 @@ def add_batch_to_transfer_data(
             recursive=recursive,
         )
 
-    shlex_process_stream(process_batch_line, batch, "--batch")
+    source_path_type = TaskPath(base_dir=source_base_path)
+    dest_path_type = TaskPath(base_dir=dest_base_path)
+
+    def process_simple_line(line: str) -> bool:
+        """
+        Handle blank lines, comments, and lines which contain only a source and
+        destination path, returning False for any other line.
+        """
+        stripped = line.strip(" \t\r\n")
+        if not stripped or stripped.startswith("#"):
+            return True
+        match = _SIMPLE_BATCH_LINE.fullmatch(line)
+        if match is None:
+            return False
+        source_path, dest_path = match.groups()
+        transfer_data.add_item(
+            source_path_type.resolve(source_path),
+            dest_path_type.resolve(dest_path),
+            checksum_algorithm=checksum_algorithm,
+        )
+        return True
+
+    shlex_process_stream(
+        process_batch_line, batch, "--batch", fast_path=process_simple_line
+    )
+
+
+def split_transfer_data(
+    transfer_data: globus_sdk.TransferData, max_items: int
+) -> list[dict[str, t.Any]]:
+    """
+    Split a transfer document into documents of at most ``max_items`` items each,
+    with the same options.
+
+    If there is more than one document and the transfer is labeled, each label gets
+    a suffix showing its place in the sequence, e.g. "my label (2/3)".
+
+    Filter rules only apply to recursive items, and are rejected by the service when
+    there are none, so they are dropped from documents without recursive items.
+    """
+    items = transfer_data["DATA"]
+    options = {k: v for k, v in transfer_data.items() if k != "DATA"}
+    if not items:
+        return [{**options, "DATA": []}]
+
+    chunks = [
+        {**options, "DATA": items[start : start + max_items]}
+        for start in range(0, len(items), max_items)
+    ]
+    for chunk in chunks:
+        if "filter_rules" in chunk and not any(
+            item.get("recursive") for item in chunk["DATA"]
+        ):
+            del chunk["filter_rules"]
+    if len(chunks) > 1 and options.get("label"):
+        for index, chunk in enumerate(chunks, start=1):
+            chunk["label"] = f"{options['label']} ({index}/{len(chunks)})"
+    return chunks
 
 
 def display_name_or_cname(ep_doc: dict | globus_sdk.GlobusHTTPResponse) -> str:
     return t.cast(str, ep_doc["display_name"] or ep_doc["canonical_name"])
 
 
-def iterable_response_to_dict(iterator):
-    output_dict = {"DATA": []}
-    for item in iterator:
-        dat = item
-        try:
-            dat = item.data
-        except AttributeError:
-            pass
-        output_dict["DATA"].append(dat)
-    return output_dict
+iterable_response_to_dict = RecordListConverter("DATA")
 
 
 def assemble_generic_doc(datatype, **kwargs):
@@ -0,0 +1,115 @@
+"""
+Planning the items of a batch delete.
+
+Batch input often names a directory for recursive deletion along with paths under
+it, and may name the same path more than once. Those items make the submitted
+document larger without deleting anything more, so they are removed before
+submission.
+
+Paths are compared by their segments, with trailing slashes ignored, and are placed
+in a trie so that each path is checked against all of its ancestors in one walk.
+"""
+from __future__ import annotations
+
+import dataclasses
+import re
+import typing as t
+
+# characters which Transfer interprets in a path when globs are enabled
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+@dataclasses.dataclass
+class DeletePlan:
+    """
+    The paths to delete, in input order, and counts of the paths removed.
+
+    :ivar paths: The paths to submit
+    :ivar duplicates: The number of paths removed as repeats of earlier paths
+    :ivar covered: The number of paths removed because an ancestor directory is
+        deleted recursively
+    """
+
+    paths: list[str]
+    duplicates: int = 0
+    covered: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.duplicates + self.covered
+
+
+def _segments(path: str) -> tuple[str, ...]:
+    # absolute paths start with an empty segment, so "/" is ("",), an ancestor of
+    # every absolute path, and "~/foo" is ("~", "foo")
+    stripped = path.rstrip("/")
+    if not stripped:
+        return ("",) if path else ()
+    return tuple(stripped.split("/"))
+
+
+class _TrieNode:
+    __slots__ = ("children", "deleted")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # True if the path ending at this node is deleted
+        self.deleted = False
+
+
+def _has_deleted_ancestor(root: _TrieNode, segments: tuple[str, ...]) -> bool:
+    node = root
+    for segment in segments[:-1]:
+        child = node.children.get(segment)
+        if child is None:
+            return False
+        if child.deleted:
+            return True
+        node = child
+    return False
+
+
+def plan_delete_paths(
+    paths: t.Iterable[str], *, recursive: bool, interpret_globs: bool = False
+) -> DeletePlan:
+    """
+    Remove the redundant items from a list of paths to delete.
+
+    Repeated paths are always removed. When the deletion is recursive, paths under
+    another path in the list are also removed. If globs are interpreted, a path
+    containing glob characters may name many paths, so it is never treated as the
+    ancestor of another path.
+
+    Paths should already be normalized, e.g. with ``TaskPath``.
+    """
+    root = _TrieNode()
+    unique: list[tuple[str, tuple[str, ...]]] = []
+    seen: set[tuple[str, ...]] = set()
+    duplicates = 0
+
+    for path in paths:
+        segments = _segments(path)
+        if segments in seen:
+            duplicates += 1
+            continue
+        seen.add(segments)
+        unique.append((path, segments))
+
+        if recursive and not (interpret_globs and _GLOB_CHARS.search(path)):
+            node = root
+            for segment in segments:
+                node = node.children.setdefault(segment, _TrieNode())
+            node.deleted = True
+
+    if not recursive:
+        return DeletePlan([path for path, _ in unique], duplicates=duplicates)
+
+    kept = []
+    covered = 0
+    for path, segments in unique:
+        if _has_deleted_ancestor(root, segments):
+            covered += 1
+        else:
+            kept.append(path)
+
+    return DeletePlan(kept, duplicates=duplicates, covered=covered)
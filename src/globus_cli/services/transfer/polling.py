@@ -0,0 +1,117 @@
+"""
+Polling schedules for waiting on Transfer tasks.
+
+A schedule decides how long to sleep between polls, given the task documents seen
+on the latest poll.
+"""
+from __future__ import annotations
+
+import random
+import typing as t
+
+# the interval, in seconds, beyond which adaptive polling will not grow
+ADAPTIVE_MAX_INTERVAL = 300.0
+# the factor by which the adaptive polling interval grows after each poll
+ADAPTIVE_GROWTH = 1.5
+# the fraction by which each adaptive interval is randomly lengthened or shortened
+ADAPTIVE_JITTER = 0.2
+
+
+class PollingSchedule:
+    """
+    Poll at a fixed interval.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+    def next_interval(self, tasks: t.Sequence[t.Mapping[str, t.Any]]) -> float:
+        return self.interval
+
+    def reset(self) -> None:
+        """
+        Note activity which should be followed closely.
+        """
+
+
+class AdaptivePollingSchedule(PollingSchedule):
+    """
+    Poll often at first, and less often as tasks keep running.
+
+    The interval starts at ``interval`` and grows by ``growth`` after each poll, up
+    to ``max_interval``. Every interval is jittered by up to ``jitter`` (as a
+    fraction) in either direction, so that many waiters started together do not
+    poll in lockstep.
+
+    Progress reported as ``bytes_transferred`` guides the schedule. While data is
+    moving, the interval grows as usual. When data which was moving stops, the
+    tasks are often finishing up (e.g. verifying checksums), so the interval drops
+    back to its starting value in order to notice completion promptly.
+
+    :param interval: The first, and shortest, interval
+    :param max_interval: The longest interval, before jitter
+    :param growth: The factor by which the interval grows after each poll
+    :param jitter: The largest fraction by which an interval is randomly adjusted
+    :param rng: A function returning random floats in [0, 1). Defaults to
+        ``random.random``
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        *,
+        max_interval: float = ADAPTIVE_MAX_INTERVAL,
+        growth: float = ADAPTIVE_GROWTH,
+        jitter: float = ADAPTIVE_JITTER,
+        rng: t.Callable[[], float] | None = None,
+    ) -> None:
+        super().__init__(interval)
+        self.max_interval = max(max_interval, interval)
+        self.growth = growth
+        self.jitter = jitter
+        self._rng = rng or random.random
+
+        self._current = interval
+        self._last_bytes: int | None = None
+        self._data_moving = False
+
+    def _observe_progress(self, tasks: t.Sequence[t.Mapping[str, t.Any]]) -> bool:
+        """
+        Record the bytes transferred by the tasks, returning True if data had been
+        moving but has now stopped.
+        """
+        counts = [
+            task["bytes_transferred"]
+            for task in tasks
+            if isinstance(task.get("bytes_transferred"), int)
+        ]
+        if not counts:
+            return False
+
+        total = sum(counts)
+        last, self._last_bytes = self._last_bytes, total
+        if last is None:
+            return False
+        if total > last:
+            self._data_moving = True
+            return False
+        if self._data_moving:
+            self._data_moving = False
+            return True
+        return False
+
+    def reset(self) -> None:
+        self._current = self.interval
+
+    def next_interval(self, tasks: t.Sequence[t.Mapping[str, t.Any]]) -> float:
+        if self._observe_progress(tasks):
+            self._current = self.interval
+        base = self._current
+        self._current = min(self._current * self.growth, self.max_interval)
+        return base * (1 + self.jitter * (2 * self._rng() - 1))
+
+
+def get_polling_schedule(strategy: str, interval: float) -> PollingSchedule:
+    if strategy == "adaptive":
+        return AdaptivePollingSchedule(interval)
+    return PollingSchedule(interval)
@@ -3,35 +3,23 @@
 from __future__ import annotations
 
 import logging
-import time
 import typing as t
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import globus_sdk
 
+from globus_cli.services.rate_limit import RateLimiter, get_rate_limiter
+
 log = logging.getLogger(__name__)
 
 ITEM_T = t.Dict[str, t.Any]
 QUEUE_T = t.Deque[t.Tuple[t.Optional[str], str, int]]
-
-# constants for controlling client-side rate limiting
-SLEEP_FREQUENCY = 25
-SLEEP_LEN = 1
-
-
-def _client_side_limiter() -> t.Iterator[None]:
-    counter = 0
-    while True:
-        counter += 1
-        # rate limit based on number of ls calls we have made
-        if counter % SLEEP_FREQUENCY == 0:
-            log.debug(
-                "recursive_operation_ls sleeping %s seconds to rate limit itself.",
-                SLEEP_LEN,
-            )
-            time.sleep(SLEEP_LEN)
-
-        yield
+# a queue entry in parallel mode also carries the (possibly not yet submitted)
+# future for the listing of that directory
+PARALLEL_QUEUE_T = t.List[
+    t.Tuple[t.Optional[str], str, int, t.Optional["Future[t.Dict[str, t.Any]]"]]
+]
 
 
 class RecursiveLsResponse:
@@ -43,12 +31,21 @@ class RecursiveLsResponse:
 
     Uses an internal queue for BFS of the filesystem.
 
-    Rate limits calls to reduce the changes of connection errors.
+    Rate limits calls to reduce the changes of connection errors. By default, the
+    limiter is the one shared by all requests to the endpoint, which slows down if
+    the service responds with throttling errors.
+
+    When ``parallelism`` is greater than 1, listings are fetched ahead of time by a
+    bounded pool of worker threads. Results are still yielded in exactly the same
+    order as a serial traversal, and at most ``parallelism`` listings are held in
+    memory or in flight at any time.
 
     :param client: `TransferClient`` used for making the operation_ls calls.
     :param endpoint_id: The endpoint that will be recursively ls'ed.
     :param ls_params: Query params sent to operation_ls
     :param max_depth: The maximum depth the recursive ls will go into the filesys
+    :param parallelism: The maximum number of operation_ls calls to run at once
+    :param rate_limiter: The rate limiter used to pace operation_ls calls
     """
 
     def __init__(
@@ -58,11 +55,20 @@ class RecursiveLsResponse:
         ls_params: dict[str, t.Any],
         *,
         max_depth: int = 3,
+        parallelism: int = 1,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
+        if parallelism < 1:
+            raise ValueError("parallelism must be a positive integer")
+
         self._client = client
         self._endpoint_id = endpoint_id
         self._ls_params = ls_params
         self._max_depth = max_depth
+        self._parallelism = parallelism
+        self._rate_limiter = (
+            rate_limiter if rate_limiter is not None else get_rate_limiter(endpoint_id)
+        )
 
         start_path = t.cast(t.Optional[str], ls_params.get("path"))
         log.info(
@@ -72,7 +78,10 @@ class RecursiveLsResponse:
         )
 
         # call the iterable_func method to convert it to a generator expression
-        self._generator = self._iterable_func(start_path)
+        if parallelism > 1:
+            self._generator = self._parallel_iterable_func(start_path)
+        else:
+            self._generator = self._iterable_func(start_path)
 
         # grab the first element out of the internal iteration function
         # because this could raise a StopIteration exception, we need to be
@@ -99,9 +108,6 @@ class RecursiveLsResponse:
         We rely on the implicit StopIteration built into this type of function
         to propagate through the final `next()` call.
         """
-        # iterator used for client-side limiting
-        limiter = _client_side_limiter()
-
         # queue of (absolute_path, relative_path, depth) tuples.
         dir_queue: QUEUE_T = deque()
         # initialized with the start path (if any) and a depth of 0
@@ -109,7 +115,6 @@ class RecursiveLsResponse:
 
         # BFS is not done until the queue is empty
         while dir_queue:
-            next(limiter)
             log.debug(
                 "recursive_operation_ls BFS queue not empty, getting next path now."
             )
@@ -122,29 +127,116 @@ class RecursiveLsResponse:
                 self._ls_params["path"] = abs_path
 
             # do the operation_ls with the updated params
-            res = self._client.operation_ls(self._endpoint_id, **self._ls_params)
-            res_data = res["DATA"]
+            with self._rate_limiter.request():
+                res = self._client.operation_ls(
+                    self._endpoint_id, **self._ls_params
+                ).data
 
             # add to the queue if there are additional listings to do
             # and we are not at the depth limit
             if depth < self._max_depth:
-                # queue data includes the dir's name in the absolute and relative paths
-                # and increases the depth by one.
-                dir_queue.extend(
-                    [
-                        (
-                            res["path"] + item["name"],
-                            (rel_path + "/" if rel_path else "") + item["name"],
-                            depth + 1,
+                dir_queue.extend(_subdir_queue_entries(res, rel_path, depth))
+
+            yield from _relative_items(res, rel_path)
+
+    def _parallel_iterable_func(self, start_path: str | None) -> t.Iterator[ITEM_T]:
+        """
+        A variant of `_iterable_func` which submits operation_ls calls to a pool of
+        worker threads.
+
+        The traversal uses the same stack as the serial version, so the order of
+        results is identical. The difference is that every time a directory is
+        consumed, the next few directories on the stack (the ones which will be
+        consumed soonest) are submitted to the pool, so that their listings are
+        ready by the time they are needed.
+        """
+        # stack of (absolute_path, relative_path, depth, future) tuples
+        # the top of the stack is the end of the list
+        dir_stack: PARALLEL_QUEUE_T = [(start_path, "", 0, None)]
+        # the number of submitted listings which have not yet been consumed
+        # this bounds both the number of requests in flight and the number of
+        # completed listings held in memory
+        outstanding = 0
+
+        def _do_ls(abs_path: str | None) -> dict[str, t.Any]:
+            # copy params, as they are shared between threads
+            params = dict(self._ls_params)
+            if abs_path is not None:
+                params["path"] = abs_path
+            # the limiter is applied in the worker, so that it paces requests as
+            # they are actually sent
+            with self._rate_limiter.request():
+                res = self._client.operation_ls(self._endpoint_id, **params)
+            return t.cast(t.Dict[str, t.Any], res.data)
+
+        with ThreadPoolExecutor(max_workers=self._parallelism) as executor:
+            try:
+                while dir_stack:
+                    # prefetch, walking down from the top of the stack
+                    window_start = max(len(dir_stack) - self._parallelism, 0)
+                    for idx in reversed(range(window_start, len(dir_stack))):
+                        if outstanding >= self._parallelism:
+                            break
+                        abs_path, rel_path, depth, future = dir_stack[idx]
+                        if future is None:
+                            dir_stack[idx] = (
+                                abs_path,
+                                rel_path,
+                                depth,
+                                executor.submit(_do_ls, abs_path),
+                            )
+                            outstanding += 1
+
+                    abs_path, rel_path, depth, future = dir_stack.pop()
+                    assert future is not None
+                    # waiting on the result will raise any error from the worker
+                    # thread in the main thread, in traversal order
+                    res = future.result()
+                    outstanding -= 1
+
+                    if depth < self._max_depth:
+                        dir_stack.extend(
+                            (sub_abs_path, sub_rel_path, sub_depth, None)
+                            for (
+                                sub_abs_path,
+                                sub_rel_path,
+                                sub_depth,
+                            ) in _subdir_queue_entries(res, rel_path, depth)
                         )
-                        # data is reversed to maintain any "orderby" ordering
-                        for item in reversed(res_data)
-                        if item["type"] == "dir"
-                    ]
-                )
-
-            # for each item in the response data update the item's name with
-            # the relative path popped from the queue, and yield the item
-            for item in res_data:
-                item["name"] = (rel_path + "/" if rel_path else "") + item["name"]
-                yield t.cast(ITEM_T, item)
+
+                    yield from _relative_items(res, rel_path)
+            finally:
+                # if iteration stops early (error or the consumer stopped reading)
+                # don't run any listings which have not yet started
+                for *_, future in dir_stack:
+                    if future is not None:
+                        future.cancel()
+
+
+def _subdir_queue_entries(
+    res: dict[str, t.Any], rel_path: str, depth: int
+) -> list[tuple[str, str, int]]:
+    """
+    Given an operation_ls response, get the (absolute_path, relative_path, depth)
+    queue entries for its subdirectories.
+    """
+    # queue data includes the dir's name in the absolute and relative paths
+    # and increases the depth by one.
+    return [
+        (
+            res["path"] + item["name"],
+            (rel_path + "/" if rel_path else "") + item["name"],
+            depth + 1,
+        )
+        # data is reversed to maintain any "orderby" ordering
+        for item in reversed(res["DATA"])
+        if item["type"] == "dir"
+    ]
+
+
+def _relative_items(res: dict[str, t.Any], rel_path: str) -> t.Iterator[ITEM_T]:
+    # for each item in the response data update the item's name with
+    # the relative path popped from the queue, and yield the item
+    for item in res["DATA"]:
+        item["name"] = (rel_path + "/" if rel_path else "") + item["name"]
+        yield t.cast(ITEM_T, item)
@@ -0,0 +1,302 @@
+"""
+Client-side planning for sync transfers.
+
+A sync transfer with ``--sync-level`` enumerates every file of the source tree into
+the task, and leaves the service to skip the unchanged ones. For a large, mostly
+unchanged tree, it is much cheaper to find the changes before submitting.
+
+The planner walks the source and destination trees together. Each directory is
+listed on both sides at once (several directories at a time), and the two
+listings, sorted by name, are merge-joined:
+
+- files which are new, or which differ in size, or are newer on the source, are
+  transferred
+- directories which are missing from the destination are transferred as single
+  recursive items, without listing them any further
+- directories present on both sides are walked
+- anything only on the destination is left alone
+- a file over a directory of the same name, or a directory over a file, cannot be
+  synced, and is reported as a conflict
+"""
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import fnmatch
+import logging
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from globus_cli.services.rate_limit import get_rate_limiter
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+
+log = logging.getLogger(__name__)
+
+# the number of directories to list at once, on each side
+PLAN_SYNC_PARALLELISM = 4
+
+_LISTING_T = t.List[t.Dict[str, t.Any]]
+
+
+@dataclasses.dataclass
+class SyncPlanItem:
+    source_path: str
+    destination_path: str
+    recursive: bool
+
+
+@dataclasses.dataclass
+class SyncPlan:
+    """
+    The items to transfer, and counts describing how they were chosen.
+
+    :ivar items: The items to transfer
+    :ivar changed_files: The number of files which differ from the destination
+    :ivar new_files: The number of files missing from the destination
+    :ivar new_dirs: The number of directories missing from the destination
+    :ivar unchanged_files: The number of files which were skipped
+    :ivar type_conflicts: Paths which are a file on one side and a directory on the
+        other, and so cannot be synced
+    """
+
+    items: list[SyncPlanItem] = dataclasses.field(default_factory=list)
+    changed_files: int = 0
+    new_files: int = 0
+    new_dirs: int = 0
+    unchanged_files: int = 0
+    type_conflicts: list[SyncPlanItem] = dataclasses.field(default_factory=list)
+
+
+def _dir_path(base: str, rel_path: str) -> str:
+    path = base.rstrip("/") + "/"
+    if rel_path:
+        path += rel_path + "/"
+    return path
+
+
+def _mtime(item: dict[str, t.Any]) -> datetime.datetime | None:
+    value = item.get("last_modified")
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _file_differs(source: dict[str, t.Any], destination: dict[str, t.Any]) -> bool:
+    if destination["type"] != "file":
+        return True
+    if source.get("size") != destination.get("size"):
+        return True
+    source_mtime, destination_mtime = _mtime(source), _mtime(destination)
+    if source_mtime is None or destination_mtime is None:
+        return True
+    return source_mtime > destination_mtime
+
+
+def _is_excluded(name: str, filter_rules: t.Sequence[tuple[str, str]]) -> bool:
+    # the first matching rule applies, and files are included by default
+    for method, pattern in filter_rules:
+        if fnmatch.fnmatchcase(name, pattern):
+            return method == "exclude"
+    return False
+
+
+class _Lister:
+    """
+    Lists directories on one endpoint, sharing the endpoint's rate limiter.
+    """
+
+    def __init__(
+        self,
+        client: globus_sdk.TransferClient,
+        endpoint_id: str,
+        local_user: str | None,
+        *,
+        missing_ok: bool,
+    ) -> None:
+        self._client = client
+        self._endpoint_id = endpoint_id
+        self._local_user = local_user
+        self._missing_ok = missing_ok
+        self._rate_limiter = get_rate_limiter(endpoint_id)
+
+    def __call__(self, path: str) -> _LISTING_T | None:
+        """
+        List a directory, sorted by name. If the directory is missing and
+        ``missing_ok`` is set, return None.
+        """
+        import globus_sdk
+
+        try:
+            with self._rate_limiter.request():
+                res = self._client.operation_ls(
+                    self._endpoint_id,
+                    path=path,
+                    show_hidden=True,
+                    local_user=self._local_user,
+                )
+        except globus_sdk.TransferAPIError as err:
+            if self._missing_ok and err.http_status == 404:
+                return None
+            raise
+        return sorted(res["DATA"], key=lambda item: t.cast(str, item["name"]))
+
+
+def plan_sync_transfer(
+    client: globus_sdk.TransferClient,
+    source_endpoint: str,
+    source_path: str,
+    destination_endpoint: str,
+    destination_path: str,
+    *,
+    filter_rules: t.Sequence[tuple[str, str]] = (),
+    source_local_user: str | None = None,
+    destination_local_user: str | None = None,
+    parallelism: int = PLAN_SYNC_PARALLELISM,
+) -> SyncPlan:
+    """
+    Compare a source directory with a destination directory, and plan the items
+    needed to bring the destination up to date.
+
+    :param filter_rules: (method, pattern) pairs, evaluated as for the
+        ``--include`` and ``--exclude`` options, which select the files to consider
+    :param parallelism: The number of directories to list at once
+    """
+    list_source = _Lister(client, source_endpoint, source_local_user, missing_ok=False)
+    list_destination = _Lister(
+        client, destination_endpoint, destination_local_user, missing_ok=True
+    )
+    plan = SyncPlan()
+
+    def make_item(rel_path: str, name: str, recursive: bool) -> SyncPlanItem:
+        suffix = name + "/" if recursive else name
+        return SyncPlanItem(
+            _dir_path(source_path, rel_path) + suffix,
+            _dir_path(destination_path, rel_path) + suffix,
+            recursive,
+        )
+
+    def add_item(rel_path: str, name: str, recursive: bool) -> None:
+        plan.items.append(make_item(rel_path, name, recursive))
+
+    # directories to walk, which have not been listed yet
+    to_walk: deque[str] = deque([""])
+    # directories being listed, with the futures for their listings
+    listing: deque[
+        tuple[str, Future[_LISTING_T | None], Future[_LISTING_T | None]]
+    ] = deque()
+
+    with ThreadPoolExecutor(max_workers=parallelism * 2) as executor:
+        try:
+            while to_walk or listing:
+                while to_walk and len(listing) < parallelism:
+                    rel_path = to_walk.popleft()
+                    listing.append(
+                        (
+                            rel_path,
+                            executor.submit(
+                                list_source, _dir_path(source_path, rel_path)
+                            ),
+                            executor.submit(
+                                list_destination,
+                                _dir_path(destination_path, rel_path),
+                            ),
+                        )
+                    )
+
+                rel_path, source_future, destination_future = listing.popleft()
+                source_items = source_future.result() or []
+                destination_items = destination_future.result()
+
+                if destination_items is None:
+                    # the whole directory is missing from the destination
+                    if rel_path:
+                        parent, _, name = rel_path.rpartition("/")
+                        add_item(parent, name, recursive=True)
+                    else:
+                        plan.items.append(
+                            SyncPlanItem(source_path, destination_path, True)
+                        )
+                    plan.new_dirs += 1
+                    continue
+
+                for source_item, destination_item in _merge_join(
+                    source_items, destination_items
+                ):
+                    name = source_item["name"]
+                    if source_item["type"] == "dir":
+                        if destination_item is None:
+                            add_item(rel_path, name, recursive=True)
+                            plan.new_dirs += 1
+                        elif destination_item["type"] == "file":
+                            plan.type_conflicts.append(
+                                make_item(rel_path, name, recursive=True)
+                            )
+                        else:
+                            to_walk.append(_join(rel_path, name))
+                    elif source_item["type"] == "file":
+                        if _is_excluded(name, filter_rules):
+                            continue
+                        if destination_item is not None and (
+                            destination_item["type"] == "dir"
+                        ):
+                            plan.type_conflicts.append(
+                                make_item(rel_path, name, recursive=False)
+                            )
+                        elif destination_item is None:
+                            add_item(rel_path, name, recursive=False)
+                            plan.new_files += 1
+                        elif _file_differs(source_item, destination_item):
+                            add_item(rel_path, name, recursive=False)
+                            plan.changed_files += 1
+                        else:
+                            plan.unchanged_files += 1
+        finally:
+            for _, source_future, destination_future in listing:
+                source_future.cancel()
+                destination_future.cancel()
+
+    log.debug(
+        "sync plan: %d items (%d changed files, %d new files, %d new dirs), "
+        "%d unchanged files",
+        len(plan.items),
+        plan.changed_files,
+        plan.new_files,
+        plan.new_dirs,
+        plan.unchanged_files,
+    )
+    return plan
+
+
+def _join(rel_path: str, name: str) -> str:
+    return f"{rel_path}/{name}" if rel_path else name
+
+
+def _merge_join(
+    source_items: _LISTING_T, destination_items: _LISTING_T
+) -> t.Iterator[tuple[dict[str, t.Any], dict[str, t.Any] | None]]:
+    """
+    Pair each source item with the destination item of the same name, if any. Both
+    listings must be sorted by name.
+    """
+    dest_idx = 0
+    for source_item in source_items:
+        name = source_item["name"]
+        while (
+            dest_idx < len(destination_items)
+            and destination_items[dest_idx]["name"] < name
+        ):
+            dest_idx += 1
+        if (
+            dest_idx < len(destination_items)
+            and destination_items[dest_idx]["name"] == name
+        ):
+            yield source_item, destination_items[dest_idx]
+            dest_idx += 1
+        else:
+            yield source_item, None
@@ -0,0 +1,390 @@
+"""
+A local index of the current user's Transfer tasks.
+
+The index is stored in the cache database (see ``globus_cli.cache``), partitioned by
+the token storage namespace. It is filled by ``globus task sync``, which fetches
+only the tasks which were requested or completed since the previous sync, and is
+read by ``globus task list --from-index`` to answer queries without contacting
+Transfer.
+
+Times are stored in UTC, as ``YYYY-MM-DD HH:MM:SS`` strings, so that they sort and
+compare correctly as text.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import sqlite3
+import typing as t
+
+from globus_cli import cache
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+
+log = logging.getLogger(__name__)
+
+# the number of tasks which Transfer returns for one task_list query, across all
+# pages; a query which reaches this limit is continued with a narrower filter
+TASK_LIST_MAX_RESULTS = 1000
+# the number of task IDs to refresh in a single task_list call
+TASK_REFRESH_BATCH_SIZE = 100
+
+_TERMINAL_STATUSES = ("SUCCEEDED", "FAILED")
+
+_SCHEMA = (
+    """\
+CREATE TABLE IF NOT EXISTS task_index_task (
+    namespace TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    type TEXT,
+    status TEXT,
+    label TEXT,
+    request_time TEXT,
+    completion_time TEXT,
+    document TEXT NOT NULL,
+    PRIMARY KEY (namespace, task_id)
+)
+""",
+    """\
+CREATE INDEX IF NOT EXISTS task_index_task_request_time
+ON task_index_task (namespace, request_time)
+""",
+    """\
+CREATE TABLE IF NOT EXISTS task_index_sync (
+    namespace TEXT NOT NULL PRIMARY KEY,
+    watermark TEXT,
+    synced_at TEXT NOT NULL
+)
+""",
+)
+
+
+def _normalize_time(value: str | None) -> str | None:
+    """
+    Convert a time from a task document (ISO 8601, with an offset) to a UTC time in
+    the format used by the index.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _label_pattern(label: str, inexact: bool) -> tuple[str, str]:
+    """
+    Get the SQL condition and parameter for a label filter.
+
+    Inexact patterns use '*' as a wildcard and ignore case, as Transfer does.
+    """
+    if not inexact:
+        return ("label = ?", label)
+    escaped = label.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return ("label LIKE ? ESCAPE '\\'", escaped.replace("*", "%"))
+
+
+class TaskIndex:
+    """
+    A local index of task documents.
+
+    :param filename: The database file to use. Defaults to ``cache.db`` in the CLI
+        data directory
+    :param namespace: The namespace of the index. Defaults to the namespace used for
+        token storage
+    """
+
+    def __init__(
+        self, *, filename: str | None = None, namespace: str | None = None
+    ) -> None:
+        self._filename = filename
+        self._namespace = namespace if namespace is not None else cache._get_namespace()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self._filename is None:
+                self._filename = cache._get_cache_filename()
+            conn = sqlite3.connect(self._filename, timeout=5)
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _sync_state(self) -> tuple[str | None, str | None]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT watermark, synced_at FROM task_index_sync WHERE namespace = ?",
+                (self._namespace,),
+            )
+            .fetchone()
+        )
+        return (row[0], row[1]) if row else (None, None)
+
+    @property
+    def watermark(self) -> str | None:
+        """
+        The latest request or completion time seen by a sync, as reported by
+        Transfer, or None if no tasks have been synced.
+        """
+        return self._sync_state()[0]
+
+    @property
+    def synced_at(self) -> str | None:
+        """
+        The time of the last sync, or None if the index has never been synced.
+        """
+        return self._sync_state()[1]
+
+    def set_watermark(self, watermark: str | None) -> None:
+        synced_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO task_index_sync "
+                "(namespace, watermark, synced_at) VALUES (?, ?, ?)",
+                (self._namespace, watermark, synced_at),
+            )
+
+    def upsert(self, tasks: t.Iterable[t.Mapping[str, t.Any]]) -> int:
+        """
+        Add or replace task documents, returning the number written.
+        """
+        rows = [
+            (
+                self._namespace,
+                task["task_id"],
+                task.get("type"),
+                task.get("status"),
+                task.get("label"),
+                _normalize_time(task.get("request_time")),
+                _normalize_time(task.get("completion_time")),
+                json.dumps(dict(task)),
+            )
+            for task in tasks
+        ]
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO task_index_task "
+                "(namespace, task_id, type, status, label, request_time, "
+                "completion_time, document) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def count(self) -> int:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM task_index_task WHERE namespace = ?",
+                (self._namespace,),
+            )
+            .fetchone()
+        )
+        return int(row[0])
+
+    def unfinished_task_ids(self) -> list[str]:
+        """
+        Get the IDs of indexed tasks which had not completed when last synced.
+        """
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT task_id FROM task_index_task "
+                "WHERE namespace = ? AND status NOT IN (?, ?)",
+                (self._namespace, *_TERMINAL_STATUSES),
+            )
+            .fetchall()
+        )
+        return [row[0] for row in rows]
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM task_index_task WHERE namespace = ?", (self._namespace,)
+            )
+            conn.execute(
+                "DELETE FROM task_index_sync WHERE namespace = ?", (self._namespace,)
+            )
+
+    def query(
+        self,
+        *,
+        task_ids: t.Sequence[str] = (),
+        types: t.Sequence[str] = (),
+        statuses: t.Sequence[str] = (),
+        labels: t.Sequence[str] = (),
+        not_labels: t.Sequence[str] = (),
+        inexact: bool = True,
+        requested_after: str | None = None,
+        requested_before: str | None = None,
+        completed_after: str | None = None,
+        completed_before: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, t.Any]]:
+        """
+        Get the indexed task documents matching filters, most recently requested
+        first.
+
+        A task matches if its label matches any of ``labels`` (when given) and none
+        of ``not_labels``. Times are UTC, in ``YYYY-MM-DD HH:MM:SS`` format.
+        """
+        conditions = ["namespace = ?"]
+        params: list[t.Any] = [self._namespace]
+
+        for column, values in (
+            ("task_id", task_ids),
+            ("type", types),
+            ("status", statuses),
+        ):
+            if values:
+                conditions.append(
+                    "{} IN ({})".format(column, ", ".join("?" for _ in values))
+                )
+                params.extend(values)
+
+        if labels:
+            label_conditions = []
+            for label in labels:
+                condition, param = _label_pattern(label, inexact)
+                label_conditions.append(condition)
+                params.append(param)
+            conditions.append("({})".format(" OR ".join(label_conditions)))
+        for label in not_labels:
+            condition, param = _label_pattern(label, inexact)
+            conditions.append(f"(label IS NULL OR NOT {condition})")
+            params.append(param)
+
+        for column, operator, value in (
+            ("request_time", ">=", requested_after),
+            ("request_time", "<=", requested_before),
+            ("completion_time", ">=", completed_after),
+            ("completion_time", "<=", completed_before),
+        ):
+            if value:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+
+        query = (
+            "SELECT document FROM task_index_task WHERE {} "
+            "ORDER BY request_time DESC, task_id".format(" AND ".join(conditions))
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        rows = self._connection().execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+def clear_task_index() -> None:
+    """
+    Remove all indexed tasks for the current namespace, ignoring any errors.
+    """
+    index = TaskIndex()
+    try:
+        index.clear()
+    except (OSError, sqlite3.Error) as err:
+        log.debug("failed to clear the task index: %s", err)
+    finally:
+        index.close()
+
+
+def _fetch_tasks_since(
+    transfer_client: globus_sdk.TransferClient, field: str, start: str | None
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Fetch the tasks whose ``field`` (request_time or completion_time) is at or after
+    ``start``, or all tasks if ``start`` is None.
+
+    A task_list query returns at most TASK_LIST_MAX_RESULTS tasks, so tasks are
+    fetched in ascending order, and a query which reaches the limit is continued
+    from the last time seen.
+    """
+    from globus_sdk.paging import Paginator
+
+    paginator = Paginator.wrap(transfer_client.task_list)
+    while True:
+        # Transfer time filters are ranges, written as "start,end"
+        filter_string = "type:TRANSFER,DELETE"
+        if start is not None:
+            filter_string += f"/{field}:{start},"
+        seen = 0
+        last_time = None
+        for task in paginator(
+            query_params={"filter": filter_string, "orderby": f"{field} ASC"}
+        ).items():
+            seen += 1
+            last_time = task.get(field) or last_time
+            yield dict(task)
+        if seen < TASK_LIST_MAX_RESULTS or last_time is None or last_time == start:
+            return
+        start = last_time
+
+
+def _fetch_tasks_by_id(
+    transfer_client: globus_sdk.TransferClient, task_ids: t.Sequence[str]
+) -> t.Iterator[dict[str, t.Any]]:
+    for offset in range(0, len(task_ids), TASK_REFRESH_BATCH_SIZE):
+        batch = task_ids[offset : offset + TASK_REFRESH_BATCH_SIZE]
+        res = transfer_client.task_list(
+            filter="task_id:" + ",".join(batch), limit=len(batch)
+        )
+        for task in res:
+            yield dict(task)
+
+
+def sync_task_index(
+    transfer_client: globus_sdk.TransferClient, index: TaskIndex
+) -> int:
+    """
+    Bring an index up to date, returning the number of task documents fetched.
+
+    If the index has been synced before, only tasks requested or completed since
+    its watermark are fetched, along with any indexed tasks which had not yet
+    completed. Otherwise, all tasks are fetched.
+    """
+    watermark = index.watermark
+    unfinished = index.unfinished_task_ids()
+
+    fetched: dict[str, dict[str, t.Any]] = {}
+    sources = [_fetch_tasks_since(transfer_client, "request_time", watermark)]
+    if watermark is not None:
+        sources.append(
+            _fetch_tasks_since(transfer_client, "completion_time", watermark)
+        )
+    sources.append(_fetch_tasks_by_id(transfer_client, unfinished))
+
+    new_watermark = watermark
+    for source in sources:
+        for task in source:
+            fetched[task["task_id"]] = task
+            for field in ("request_time", "completion_time"):
+                value = task.get(field)
+                if value and (
+                    new_watermark is None
+                    or (_normalize_time(value) or "")
+                    > (_normalize_time(new_watermark) or "")
+                ):
+                    new_watermark = value
+
+    index.upsert(fetched.values())
+    index.set_watermark(new_watermark)
+    log.debug(
+        "task index sync fetched %d tasks (watermark: %s -> %s)",
+        len(fetched),
+        watermark,
+        new_watermark,
+    )
+    return len(fetched)
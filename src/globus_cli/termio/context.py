@@ -19,6 +19,15 @@ def outformat_is_json() -> bool:
     return state.outformat_is_json()
 
 
+def outformat_is_jsonl() -> bool:
+    """
+    Only safe to call within a click context.
+    """
+    ctx = click.get_current_context()
+    state = ctx.ensure_object(CommandState)
+    return state.outformat_is_jsonl()
+
+
 def outformat_is_unix() -> bool:
     """
     Only safe to call within a click context.
@@ -73,6 +82,27 @@ def should_show_server_timing() -> bool:
     return state.show_server_timing
 
 
+def should_use_identity_cache() -> bool:
+    """
+    Check whether or not identity lookups may use the local cache.
+    When called outside of a click context, this is always true.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return True
+    state = ctx.ensure_object(CommandState)
+    return state.use_identity_cache
+
+
+def get_captured_output() -> list[t.Any] | None:
+    """
+    Only safe to call within a click context.
+    """
+    ctx = click.get_current_context()
+    state = ctx.ensure_object(CommandState)
+    return state.captured_output
+
+
 def out_is_terminal() -> bool:
     return sys.stdout.isatty()
 
@@ -2,7 +2,7 @@ import json
 
 import click
 
-from .context import outformat_is_json
+from .context import outformat_is_json, outformat_is_jsonl
 
 
 class PrintableErrorField:
@@ -53,6 +53,18 @@ def write_error_info(error_name, fields, message=None):
             ),
             fg="yellow",
         )
+    elif outformat_is_jsonl():
+        message = click.style(
+            json.dumps(
+                dict(
+                    [("error_name", error_name)]
+                    + [(f.name, f.raw_value) for f in fields]
+                ),
+                separators=(",", ":"),
+                sort_keys=True,
+            ),
+            fg="yellow",
+        )
     if not message:
         message = "A{} {} Occurred.\n{}".format(
             "n" if error_name[0] in "aeiouAEIOU" else "",
@@ -1,9 +1,41 @@
 from __future__ import annotations
 
+import re
 import typing as t
 
 from . import formatters
 
+# keys which are a dotted sequence of plain identifiers, like "foo" or "foo.bar",
+# can be evaluated without jmespath
+_SIMPLE_KEY_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+class _DottedKeyLookup:
+    """
+    A minimal stand-in for a compiled jmespath expression, for simple dotted keys.
+
+    Each part of the key is looked up with `.get()`, and data which does not support
+    `.get()` produces `None`. This matches jmespath's semantics for field access.
+    """
+
+    def __init__(self, key: str) -> None:
+        self._parts = key.split(".")
+
+    def search(self, data: t.Any) -> t.Any:
+        for part in self._parts:
+            try:
+                data = data.get(part)
+            except AttributeError:
+                return None
+        return data
+
+
+class _IdentityLookup:
+    """A stand-in for the jmespath expression "@"."""
+
+    def search(self, data: t.Any) -> t.Any:
+        return data
+
 
 class Field:
     """A field which will be shown in record or table output.
@@ -13,6 +45,9 @@ class Field:
         name for table output
     :param key: a jmespath expression for indexing into print data
     :param wrap_enabled: in record output, is this field allowed to wrap
+    :param width: in table output, a fixed width for the column. When not given, the
+        column is sized to fit its values, unless it is the last column and all
+        of the others have a width, in which case it is unbounded
     """
 
     def __init__(
@@ -22,16 +57,30 @@ class Field:
         *,
         wrap_enabled: bool = False,
         formatter: formatters.FieldFormatter = formatters.Str,
+        width: int | None = None,
     ):
         self.name = name
         self.key = key
         self.wrap_enabled = wrap_enabled
         self.formatter = formatter
+        self.width = width
+        # the compiled form of `key`, built on first use
+        self._expression: t.Any = None
+
+    def _compile(self) -> t.Any:
+        if self.key == "@":
+            return _IdentityLookup()
+        if _SIMPLE_KEY_PATTERN.fullmatch(self.key):
+            return _DottedKeyLookup(self.key)
 
-    def get_value(self, data: t.Any) -> t.Any:
         import jmespath
 
-        return jmespath.search(self.key, data)
+        return jmespath.compile(self.key)
+
+    def get_value(self, data: t.Any) -> t.Any:
+        if self._expression is None:
+            self._expression = self._compile()
+        return self._expression.search(data)
 
     def format(self, value: t.Any) -> str:
         return self.formatter.format(value)
@@ -5,6 +5,9 @@ import typing as t
 
 import globus_sdk
 
+from globus_cli.cache import get_identity_cache
+
+from ..context import should_use_identity_cache
 from .base import FieldFormatter
 
 _IDENTITY_URN_PREFIX = "urn:globus:auth:identity:"
@@ -29,7 +32,11 @@ class PrincipalFormatter(FieldFormatter[t.Tuple[str, str]]):
 
     def __init__(self, auth_client: globus_sdk.AuthClient):
         self.auth_client = auth_client
-        self.resolved_ids = globus_sdk.IdentityMap(auth_client)
+        # unless disabled, identities are resolved via the local cache first
+        cache: t.MutableMapping[str, t.Any] = {}
+        if should_use_identity_cache():
+            cache = get_identity_cache()
+        self.resolved_ids = globus_sdk.IdentityMap(auth_client, cache=cache)
 
     def render_identity_id(self, identity_id: str) -> str:
         try:
@@ -1,29 +1,37 @@
 from __future__ import annotations
 
+import collections.abc
 import enum
+import itertools
 import json
 import textwrap
 
 import click
 import globus_sdk
 
-from globus_cli.utils import CLIStubResponse
+from globus_cli.utils import CLIStubResponse, RecordListConverter
 
 from .awscli_text import unix_display
 from .context import (
+    get_captured_output,
     get_jmespath_expression,
     outformat_is_json,
+    outformat_is_jsonl,
     outformat_is_text,
     outformat_is_unix,
 )
 from .field import Field
 from .server_timing import maybe_show_server_timing
 
+# the number of rows used to size the columns of a streaming table
+STREAMING_TABLE_LOOKAHEAD = 100
+
 
 class TextMode(enum.Enum):
     silent = enum.auto()
     json = enum.auto()
     text_table = enum.auto()
+    text_table_streaming = enum.auto()
     text_record = enum.auto()
     text_record_list = enum.auto()
     text_raw = enum.auto()
@@ -49,6 +57,38 @@ def print_json_response(res, *, sort_keys=True):
     click.echo(res)
 
 
+def print_json_record_stream(key, records, *, sort_keys=True):
+    """
+    Print a stream of records as a JSON document of the form ``{key: [...]}``,
+    writing each record as soon as it is read.
+
+    The output is identical to that of ``print_json_response`` on the equivalent
+    dict.
+    """
+    click.echo(f"{{\n  {json.dumps(key)}: [", nl=False)
+    first = True
+    for record in records:
+        if not first:
+            click.echo(",", nl=False)
+        first = False
+        doc = json.dumps(record, indent=2, separators=(",", ": "), sort_keys=sort_keys)
+        click.echo("\n" + textwrap.indent(doc, "    "), nl=False)
+    click.echo("]\n}" if first else "\n  ]\n}")
+
+
+def print_jsonl_response(res, *, sort_keys=True):
+    res = _jmespath_preprocess(res)
+    click.echo(json.dumps(res, separators=(",", ":"), sort_keys=sort_keys))
+
+
+def print_jsonl_record_stream(records, *, sort_keys=True):
+    """
+    Print a stream of records as JSON Lines, one compact document per line.
+    """
+    for record in records:
+        click.echo(json.dumps(record, separators=(",", ":"), sort_keys=sort_keys))
+
+
 def print_unix_response(res):
     res = _jmespath_preprocess(res)
     try:
@@ -96,39 +136,53 @@ def _colon_display(data, fields):
         click.echo("{}{}".format((field.name + ":").ljust(maxlen), value))
 
 
-def print_table(iterable, fields, print_headers=True):
+def print_table(iterable, fields, print_headers=True, *, lookahead=None):
+    """
+    Print an iterable of records as a table, with one row per record.
+
+    By default, every row is read before printing so that each column can be sized
+    to fit its widest value. If ``lookahead`` is given, only that many rows are read
+    to size the columns, and the remaining rows are printed as they are produced by
+    the iterable. Values wider than their column are printed in full, pushing the
+    rest of their row to the right.
+
+    In either mode, fields with a declared ``width`` use that width. The last column
+    is not padded, so if every other field has a width, no rows are read ahead, and
+    the last column is left unbounded.
+    """
     # the iterable may not be safe to walk multiple times, so we must walk it
-    # only once -- however, to let us write things naturally, convert it to a
-    # list and we can assume it is safe to walk repeatedly
-    iterable = list(iterable)
+    # only once -- format each row as it is read, so that the fields are only
+    # evaluated once per row
+    iterator = iter(iterable)
 
     # extract headers and keys as separate lists
     headers = [f.name for f in fields]
 
-    # use the iterable to find the max width of an element for each column
-    # use a special function to handle empty iterable
-    def get_max_colwidth(f):
-        def _safelen(x):
-            try:
-                return len(x)
-            except TypeError:
-                return len(str(x))
-
-        lengths = [_safelen(f(i)) for i in iterable]
-        if not lengths:
-            return 0
-        else:
-            return max(lengths)
-
-    widths = [get_max_colwidth(f) for f in fields]
-    # handle the case in which the column header is the widest thing
-    widths = [max(w, len(h)) for w, h in zip(widths, headers)]
-
     def none_to_null(val):
         if val is None:
             return "NULL"
         return val
 
+    def format_row(item):
+        return [str(none_to_null(f(item))) for f in fields]
+
+    fixed_widths = [f.width is not None for f in fields]
+    if any(fixed_widths) and all(fixed_widths[:-1]):
+        sizing_rows = []
+    elif lookahead is None:
+        sizing_rows = [format_row(i) for i in iterator]
+    else:
+        sizing_rows = [format_row(i) for i in itertools.islice(iterator, lookahead)]
+
+    # use the rows read so far to find the max width of an element for each column
+    # handle the case in which the column header is the widest thing
+    widths = [
+        f.width
+        if f.width is not None
+        else max([len(h)] + [len(row[idx]) for row in sizing_rows])
+        for idx, (f, h) in enumerate(zip(fields, headers))
+    ]
+
     def format_line(inputs):
         out = ""
         last_offset = 3
@@ -148,9 +202,13 @@ def print_table(iterable, fields, print_headers=True):
             format_line(["-" * w if h else " " * w for w, h in zip(widths, headers)])
         )
 
-    # print the rows of data
-    for i in iterable:
-        click.echo(format_line([none_to_null(f(i)) for f in fields]))
+    # print the rows of data, first any which were used for sizing and then any
+    # which are still to be read
+    for row in sizing_rows:
+        click.echo(format_line(row))
+    del sizing_rows
+    for i in iterator:
+        click.echo(format_line(format_row(i)))
 
 
 def display(
@@ -179,11 +237,14 @@ def display(
     ``text_epilog`` is text which prints after normal printing (text output
     only)
     ``text_mode`` is a TextMode OR a callable which takes ``response_data`` and prints
-    output. Note that when a callable is given, it does the actual printing
+    output. Note that when a callable is given, it does the actual printing.
+    ``TextMode.text_table_streaming`` prints a table without reading all of the data
+    first, sizing columns from the first ``STREAMING_TABLE_LOOKAHEAD`` rows
 
     ``json_converter`` is a callable that does preprocessing of JSON output. It
     must take ``response_data`` and produce another dict or dict-like object
-    (json/unix output only)
+    (json/unix output only). If it is a ``RecordListConverter``, JSON and JSONL
+    output is written one record at a time, unless a JMESPath expression is used
 
     ``fields`` is an iterable of fields. They may be expressed as Field
     objects, (fieldname, key_string) tuples, or (fieldname, key_func) tuples.
@@ -200,6 +261,16 @@ def display(
     if isinstance(response_data, globus_sdk.GlobusHTTPResponse):
         maybe_show_server_timing(response_data)
 
+    # when output is captured, keep the data as it would be printed as JSON
+    captured_output = get_captured_output()
+    if captured_output is not None:
+        captured_output.append(
+            _jmespath_preprocess(
+                json_converter(response_data) if json_converter else response_data
+            )
+        )
+        return
+
     def _assert_fields():
         if fields is None:
             raise ValueError(
@@ -207,12 +278,37 @@ def display(
                 "You can workaround this error by using `--format JSON`"
             )
 
+    # a stream of records can be printed incrementally, but a jmespath expression
+    # must be applied to the whole document
+    can_stream_records = (
+        isinstance(json_converter, RecordListConverter)
+        and get_jmespath_expression() is None
+    )
+
     def _print_as_json(*, sort_keys=True):
+        if can_stream_records:
+            print_json_record_stream(
+                json_converter.key,
+                json_converter.iter_records(response_data),
+                sort_keys=sort_keys,
+            )
+            return
         print_json_response(
             json_converter(response_data) if json_converter else response_data,
             sort_keys=sort_keys,
         )
 
+    def _print_as_jsonl(*, sort_keys=True):
+        if can_stream_records:
+            print_jsonl_record_stream(
+                json_converter.iter_records(response_data), sort_keys=sort_keys
+            )
+            return
+        print_jsonl_response(
+            json_converter(response_data) if json_converter else response_data,
+            sort_keys=sort_keys,
+        )
+
     def _print_as_unix():
         print_unix_response(
             json_converter(response_data) if json_converter else response_data
@@ -241,13 +337,18 @@ def display(
         if text_mode == TextMode.text_table:
             _assert_fields()
             print_table(data, fields)
+        elif text_mode == TextMode.text_table_streaming:
+            _assert_fields()
+            print_table(data, fields, lookahead=STREAMING_TABLE_LOOKAHEAD)
         elif text_mode == TextMode.text_record:
             _assert_fields()
             _colon_display(data, fields)
         elif text_mode == TextMode.text_record_list:
             _assert_fields()
-            if not isinstance(data, list):
-                raise ValueError("only lists can be output in text record list format")
+            if not isinstance(data, (list, collections.abc.Iterator)):
+                raise ValueError(
+                    "only lists and iterators can be output in text record list format"
+                )
             first = True
             for record in data:
                 # add empty line between records after the first
@@ -274,6 +375,8 @@ def display(
 
     if outformat_is_json() or (outformat_is_text() and text_mode == TextMode.json):
         _print_as_json(sort_keys=sort_json_keys)
+    elif outformat_is_jsonl():
+        _print_as_jsonl(sort_keys=sort_json_keys)
     elif outformat_is_unix():
         _print_as_unix()
     else:
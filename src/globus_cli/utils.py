@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import sys
 import typing as t
 
 import click
@@ -112,6 +114,27 @@ class CLIStubResponse:
         return self.data[key]
 
 
+class RecordListConverter:
+    """
+    A json_converter for iterables of records, converting them to a dict of the form
+    ``{key: [record, ...]}``.
+
+    Because the shape of the output is known, printers can use ``iter_records`` to
+    write the records out one at a time, rather than building the whole list.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def iter_records(self, iterable: t.Iterable[t.Any]) -> t.Iterator[t.Any]:
+        for item in iterable:
+            # unwrap response objects to their data
+            yield getattr(item, "data", item)
+
+    def __call__(self, iterable: t.Iterable[t.Any]) -> dict[str, list[t.Any]]:
+        return {self.key: list(self.iter_records(iterable))}
+
+
 # wrap to add a `has_next()` method and `limit` param to a naive iterator
 class PagingWrapper:
     def __init__(
@@ -144,21 +167,18 @@ class PagingWrapper:
             yielded += 1
 
     @property
-    def json_converter(
-        self,
-    ) -> t.Callable[[t.Iterator[t.Any]], dict[str, list[t.Any]]]:
+    def json_converter(self) -> RecordListConverter:
         if self.json_conversion_key is None:
             raise NotImplementedError("does not support json_converter")
-        key: str = self.json_conversion_key
-
-        def converter(it: t.Iterator[t.Any]) -> dict[str, list[t.Any]]:
-            return {key: list(it)}
-
-        return converter
+        return RecordListConverter(self.json_conversion_key)
 
 
 def shlex_process_stream(
-    process_command: click.Command, stream: t.TextIO, name: str
+    process_command: click.Command,
+    stream: t.TextIO,
+    name: str,
+    *,
+    fast_path: t.Callable[[str], bool] | None = None,
 ) -> None:
     """
     Use shlex to process stdin line-by-line.
@@ -167,13 +187,18 @@ def shlex_process_stream(
     Requires that @process_command be a Click command object, used for
     processing single lines of input. helptext is prepended to the standard
     message printed to interactive sessions.
+
+    If ``fast_path`` is given, it is called on each line first. If it returns True,
+    it has fully handled the line, and the line is not parsed by shlex or click.
+
+    The stream is read one line at a time, so large inputs are never held in
+    memory all at once.
     """
     import shlex
 
-    # use readlines() rather than implicit file read line looping to force
-    # python to properly capture EOF (otherwise, EOF acts as a flush and
-    # things get weird)
-    for lineno, line in enumerate(stream.readlines()):
+    for lineno, line in enumerate(stream):
+        if fast_path is not None and fast_path(line):
+            continue
         # get the argument vector:
         # do a shlex split to handle quoted paths with spaces in them
         # also lets us have comments with #
@@ -204,3 +229,35 @@ class CLIAuthRequirementsError(Exception):
     ) -> None:
         self.message = message
         self.required_scopes = required_scopes
+
+
+def get_data_dir() -> str:
+    # get the dir to store Globus CLI data
+    #
+    # on Windows, the datadir is typically
+    #   ~\AppData\Local\globus\cli
+    #
+    # on Linux and macOS, we use
+    #   ~/.globus/cli/
+    #
+    # This is not necessarily a match with XDG_DATA_HOME or macOS use of
+    # '~/Library/Application Support'. The simplified directories for non-Windows
+    # platforms will allow easier access to the dir if necessary in support of users
+    if sys.platform == "win32":
+        # try to get the app data dir, preferring the local appdata
+        datadir = os.getenv("LOCALAPPDATA", os.getenv("APPDATA"))
+        if not datadir:
+            home = os.path.expanduser("~")
+            datadir = os.path.join(home, "AppData", "Local")
+        return os.path.join(datadir, "globus", "cli")
+    else:
+        return os.path.expanduser("~/.globus/cli/")
+
+
+def ensure_data_dir() -> str:
+    dirname = get_data_dir()
+    try:
+        os.makedirs(dirname)
+    except FileExistsError:
+        pass
+    return dirname
@@ -19,6 +19,7 @@ from globus_sdk.transport import RequestsTransport
 from ruamel.yaml import YAML
 
 import globus_cli
+import globus_cli.cache
 from globus_cli.login_manager.tokenstore import build_storage_adapter
 
 yaml = YAML()
@@ -167,6 +168,14 @@ def patch_tokenstorage(monkeypatch, test_token_storage):
     )
 
 
+@pytest.fixture(autouse=True)
+def patch_cache_storage(monkeypatch, tmp_path):
+    """Put local caches in a per-test file, rather than the user's data dir."""
+    cache_filename = str(tmp_path / "cache.db")
+    monkeypatch.setattr(globus_cli.cache, "_get_cache_filename", lambda: cache_filename)
+    return cache_filename
+
+
 @pytest.fixture
 def add_gcs_login(test_token_storage):
     def func(gcs_id):
@@ -1,3 +1,4 @@
+import responses
 from globus_sdk._testing import load_response_set
 
 
@@ -59,3 +60,29 @@ def test_collection_delete_on_gcp(run_line):
         "Please run the following command instead:\n\n"
         f"    globus endpoint delete {epid}"
     ) in result.stderr
+
+
+def _count_get_endpoint_calls(collection_id):
+    return sum(
+        1
+        for call in responses.calls
+        if call.request.method == "GET"
+        and call.request.url.endswith(f"/endpoint/{collection_id}")
+    )
+
+
+def test_collection_resolution_is_cached(run_line, add_gcs_login):
+    meta = load_response_set("cli.collection_operations").metadata
+    epid = meta["endpoint_id"]
+    cid = meta["mapped_collection_id"]
+    add_gcs_login(epid)
+
+    run_line(f"globus collection show {cid}")
+    run_line(f"globus collection show {cid}")
+    # the second command found the GCS Manager without fetching the collection
+    assert _count_get_endpoint_calls(cid) == 1
+
+    # deletion discards the cached collection
+    run_line(f"globus collection delete {cid}")
+    run_line(f"globus collection show {cid}")
+    assert _count_get_endpoint_calls(cid) == 2
@@ -1,5 +1,6 @@
 import datetime
 import json
+import uuid
 
 import pytest
 from globus_sdk._testing import (
@@ -147,3 +148,76 @@ def test_run_show_logs_paginated_response(run_line, limit):
         time, code, _ = (value.strip() for value in line.split("|"))
         assert isinstance(datetime.datetime.fromisoformat(time), datetime.datetime)
         assert code in EXPECTED_EVENT_CODES
+
+
+@pytest.mark.parametrize("details", (False, True))
+def test_run_show_logs_follow(run_line, mocksleep, details):
+    run_id = str(uuid.uuid1())
+    entries = [
+        {"code": "FlowStarted", "description": "started", "details": {}, "time": "T1"},
+        {"code": "FlowSucceeded", "description": "done", "details": {}, "time": "T2"},
+    ]
+    for count in (1, 1, 2):
+        load_response(
+            RegisteredResponse(
+                service="flows",
+                path=f"/runs/{run_id}/log",
+                json={"entries": entries[:count][::-1], "has_next_page": False},
+                match=[query_param_matcher({"reverse_order": "True"})],
+            )
+        )
+    # the first lookup checks that the run exists
+    for status in ("ACTIVE", "ACTIVE", "ACTIVE", "SUCCEEDED"):
+        _setup_get_response(run_id, status=status)
+
+    args = ["globus", "flows", "run", "show-logs", "--follow", run_id]
+    if details:
+        args.append("--details")
+    result = run_line(args)
+
+    assert mocksleep.call_count == 2
+    if details:
+        assert result.output.count("Code:") == 2
+        assert result.output.index("FlowStarted") < result.output.index("FlowSucceeded")
+    else:
+        rows = [line.split("|")[1].strip() for line in result.output.splitlines()[2:]]
+        assert rows == ["FlowStarted", "FlowSucceeded"]
+
+
+@pytest.mark.parametrize("follow", (False, True))
+def test_run_show_logs_details_json(run_line, mocksleep, follow):
+    run_id = str(uuid.uuid1())
+    entries = [
+        {"code": "FlowStarted", "description": "started", "details": {}, "time": "T1"},
+        {"code": "FlowSucceeded", "description": "done", "details": {}, "time": "T2"},
+    ]
+    load_response(
+        RegisteredResponse(
+            service="flows",
+            path=f"/runs/{run_id}/log",
+            json={
+                "entries": entries[::-1] if follow else entries,
+                "has_next_page": False,
+            },
+        )
+    )
+    for status in ("SUCCEEDED", "SUCCEEDED"):
+        _setup_get_response(run_id, status=status)
+
+    args = ["globus", "flows", "run", "show-logs", "--details", "-Fjson", run_id]
+    if follow:
+        args.append("--follow")
+    result = run_line(args)
+
+    # the output is a list of entries either way
+    output = json.loads(result.output)
+    assert isinstance(output, list)
+    assert [entry["code"] for entry in output] == ["FlowStarted", "FlowSucceeded"]
+
+
+def test_run_show_logs_follow_cannot_reverse(run_line):
+    result = run_line(
+        f"globus flows run show-logs --follow --reverse {uuid.uuid1()}",
+        assert_exit_code=2,
+    )
+    assert "--reverse cannot be used with --follow" in result.stderr
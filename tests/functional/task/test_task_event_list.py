@@ -1,3 +1,7 @@
+import json
+import uuid
+
+import responses
 from globus_sdk._testing import load_response_set
 
 
@@ -6,3 +10,48 @@ def test_task_event_list_success(run_line):
     task_id = meta["task_id"]
     result = run_line(f"globus task event-list {task_id}")
     assert "Canceled by the task owner" in result.output
+
+
+def test_task_event_list_follow(run_line, mocksleep):
+    task_id = str(uuid.uuid1())
+    base_url = f"https://transfer.api.globus.org/v0.10/task/{task_id}"
+    events = [
+        {"code": "STARTED", "is_error": False, "details": "{}", "time": "T1"},
+        {"code": "PROGRESS", "is_error": False, "details": "a", "time": "T2"},
+        {"code": "SUCCEEDED", "is_error": False, "details": "b", "time": "T3"},
+    ]
+    # each poll sees more of the event log, which is listed newest first
+    for count in (1, 1, 2, 3):
+        page = events[:count][::-1]
+        responses.add(
+            responses.GET,
+            f"{base_url}/event_list",
+            json={"DATA": page, "offset": 0, "limit": 10, "total": len(page)},
+        )
+    for status in ("ACTIVE", "ACTIVE", "ACTIVE", "SUCCEEDED"):
+        responses.add(responses.GET, base_url, json={"status": status})
+
+    result = run_line(f"globus task event-list --follow {task_id}")
+
+    rows = [line.split("|")[1].strip() for line in result.output.splitlines()[2:]]
+    assert rows == ["STARTED", "PROGRESS", "SUCCEEDED"]
+    assert mocksleep.call_count == 3
+
+
+def test_task_event_list_follow_json(run_line):
+    task_id = str(uuid.uuid1())
+    base_url = f"https://transfer.api.globus.org/v0.10/task/{task_id}"
+    page = [
+        {"code": "SUCCEEDED", "is_error": False, "details": "", "time": "T2"},
+        {"code": "STARTED", "is_error": False, "details": "", "time": "T1"},
+    ]
+    responses.add(
+        responses.GET,
+        f"{base_url}/event_list",
+        json={"DATA": page, "offset": 0, "limit": 10, "total": 2},
+    )
+    responses.add(responses.GET, base_url, json={"status": "SUCCEEDED"})
+
+    result = run_line(f"globus task event-list --follow --limit 1 -Fjson {task_id}")
+
+    assert [x["code"] for x in json.loads(result.stdout)["DATA"]] == ["SUCCEEDED"]
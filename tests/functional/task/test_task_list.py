@@ -1,10 +1,14 @@
+import json
 import urllib.parse
 import uuid
+from unittest import mock
 
 import pytest
 import responses
 from globus_sdk._testing import get_last_request, load_response_set
 
+from globus_cli.login_manager import LoginManager
+
 
 def _get_last_request_filter_string():
     last_req = get_last_request()
@@ -194,3 +198,102 @@ def test_task_list_control_filter_task_id(run_line, number_of_ids):
             uuid.UUID(task_id)
         except ValueError:  # clearer failure mode than a "dirty" ValueError
             pytest.fail(f"task_id filter contained non-uuid value: {task_id}")
+
+
+def test_task_list_jsonl(run_line):
+    load_response_set("cli.task_list")
+    json_result = run_line("globus task list -F json")
+    jsonl_result = run_line("globus task list -F jsonl")
+
+    expect_tasks = json.loads(json_result.output)["DATA"]
+    assert expect_tasks
+    lines = jsonl_result.output.splitlines()
+    assert [json.loads(line) for line in lines] == expect_tasks
+
+
+@pytest.fixture
+def indexed_tasks():
+    from globus_cli.services.transfer.task_index import TaskIndex
+
+    tasks = [
+        {
+            "task_id": str(uuid.UUID(int=i)),
+            "type": task_type,
+            "status": status,
+            "label": label,
+            "request_time": f"2022-01-0{i + 1}T12:00:00+00:00",
+            "completion_time": (
+                f"2022-01-0{i + 1}T13:00:00+00:00" if status != "ACTIVE" else None
+            ),
+        }
+        for i, (task_type, status, label) in enumerate(
+            [
+                ("TRANSFER", "SUCCEEDED", "Nightly Backup"),
+                ("DELETE", "FAILED", "cleanup"),
+                ("TRANSFER", "FAILED", "nightly backup"),
+                ("TRANSFER", "ACTIVE", None),
+            ]
+        )
+    ]
+    index = TaskIndex()
+    index.upsert(tasks)
+    index.set_watermark(tasks[-1]["request_time"])
+    index.close()
+    return tasks
+
+
+@pytest.mark.parametrize(
+    "args, expect_indices",
+    (
+        ([], [3, 2, 1, 0]),
+        (["--limit", "2"], [3, 2]),
+        (["--filter-status", "FAILED"], [2, 1]),
+        (["--filter-type", "DELETE"], [1]),
+        (["--filter-label", "nightly*"], [2, 0]),
+        (["--filter-label", "Nightly Backup", "--exact"], [0]),
+        (["--filter-not-label", "*backup"], [3, 1]),
+        (["--filter-label", "clean*", "--filter-label", "*backup"], [2, 1, 0]),
+        (["--filter-requested-after", "2022-01-02"], [3, 2, 1]),
+        (["--filter-completed-before", "2022-01-02 13:00:00"], [1, 0]),
+        (
+            [
+                "--filter-completed-after",
+                "2022-01-02",
+                "--filter-requested-before",
+                "2022-01-03",
+            ],
+            [1],
+        ),
+    ),
+)
+def test_task_list_from_index(run_line, indexed_tasks, args, expect_indices):
+    result = run_line(["globus", "task", "list", "--from-index", "-Fjson", *args])
+    assert [x["task_id"] for x in json.loads(result.stdout)["DATA"]] == [
+        indexed_tasks[i]["task_id"] for i in expect_indices
+    ]
+    # no requests are sent
+    assert len(responses.calls) == 0
+
+
+def test_task_list_from_index_filter_task_id(run_line, indexed_tasks):
+    task_id = indexed_tasks[1]["task_id"]
+    result = run_line(f"globus task list --from-index --filter-task-id {task_id}")
+    assert task_id in result.output
+    assert indexed_tasks[0]["task_id"] not in result.output
+
+
+def test_task_list_from_empty_index(run_line):
+    result = run_line("globus task list --from-index", assert_exit_code=2)
+    assert "Run 'globus task sync'" in result.stderr
+
+
+def test_task_list_from_index_does_not_check_login(
+    run_line, indexed_tasks, disable_login_manager_validate_token
+):
+    # the login check would validate the refresh token with Globus Auth
+    disable_login_manager_validate_token.undo()
+    with mock.patch.object(LoginManager, "has_login") as m:
+        result = run_line("globus task list --from-index -Fjson")
+    m.assert_not_called()
+    assert len(json.loads(result.stdout)["DATA"]) == len(indexed_tasks)
+    assert len(responses.calls) == 0
@@ -1,7 +1,9 @@
 import json
+import urllib.parse
 
 import globus_sdk
 import pytest
+import responses
 from globus_sdk._testing import get_last_request, load_response, load_response_set
 
 
@@ -212,3 +214,332 @@ def test_recursion_options_in_batch_input(run_line, go_ep1_id, go_ep2_id, option
         assert item["recursive"] is False
     else:  # option == ""
         assert "recursive" not in item
+
+
+SPLIT_BATCH_INPUT = "a1 b1\na2 b2\n--recursive a3 b3\na4 b4\na5 b5\n"
+
+
+def test_max_items_per_task_dry_run(run_line, go_ep1_id):
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--dry-run",
+            "--max-items-per-task",
+            "2",
+            "--label",
+            "big transfer",
+            "--batch",
+            "-",
+            f"{go_ep1_id}:/src/",
+            f"{go_ep1_id}:/dst/",
+        ],
+        stdin=SPLIT_BATCH_INPUT,
+    )
+    rows = [line.split(" | ") for line in result.output.splitlines()[2:]]
+    assert [(row[0].strip(), row[1].strip()) for row in rows] == [
+        ("1", "/src/a1"),
+        ("1", "/src/a2"),
+        ("2", "/src/a3"),
+        ("2", "/src/a4"),
+        ("3", "/src/a5"),
+    ]
+
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--dry-run",
+            "-Fjson",
+            "--max-items-per-task",
+            "2",
+            "--label",
+            "big transfer",
+            "--batch",
+            "-",
+            f"{go_ep1_id}:/src/",
+            f"{go_ep1_id}:/dst/",
+        ],
+        stdin=SPLIT_BATCH_INPUT,
+    )
+    tasks = json.loads(result.output)["tasks"]
+    assert [len(task["DATA"]) for task in tasks] == [2, 2, 1]
+    assert [task["label"] for task in tasks] == [
+        "big transfer (1/3)",
+        "big transfer (2/3)",
+        "big transfer (3/3)",
+    ]
+    assert tasks[1]["DATA"][0]["recursive"] is True
+
+
+def test_max_items_per_task_drops_filter_rules_without_recursive_items(
+    run_line, go_ep1_id
+):
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--dry-run",
+            "-Fjson",
+            "--max-items-per-task",
+            "2",
+            "--include",
+            "*.txt",
+            "--exclude",
+            "*",
+            "--batch",
+            "-",
+            f"{go_ep1_id}:/src/",
+            f"{go_ep1_id}:/dst/",
+        ],
+        stdin=SPLIT_BATCH_INPUT,
+    )
+    tasks = json.loads(result.output)["tasks"]
+    # only the second task has a recursive item, so only it has the filter rules
+    assert ["filter_rules" in task for task in tasks] == [False, True, False]
+    assert [rule["name"] for rule in tasks[1]["filter_rules"]] == ["*.txt", "*"]
+
+
+def test_max_items_per_task_submits_each_task(run_line, go_ep1_id, go_ep2_id):
+    load_response_set("cli.transfer_activate_success")
+    submit_meta = load_response(globus_sdk.TransferClient.submit_transfer).metadata
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "-Fjson",
+            "--max-items-per-task",
+            "2",
+            "--batch",
+            "-",
+            f"{go_ep1_id}:/",
+            f"{go_ep2_id}:/",
+        ],
+        stdin=SPLIT_BATCH_INPUT,
+    )
+
+    submissions = [
+        json.loads(call.request.body)
+        for call in responses.calls
+        if call.request.method == "POST" and call.request.url.endswith("/transfer")
+    ]
+    assert sorted(len(doc["DATA"]) for doc in submissions) == [1, 2, 2]
+    assert all(doc["submission_id"] for doc in submissions)
+    submitted_paths = sorted(
+        item["source_path"] for doc in submissions for item in doc["DATA"]
+    )
+    assert submitted_paths == ["/a1", "/a2", "/a3", "/a4", "/a5"]
+
+    tasks = json.loads(result.output)["tasks"]
+    assert [task["task_id"] for task in tasks] == [submit_meta["task_id"]] * 3
+
+
+def test_max_items_per_task_text_summary(run_line, go_ep1_id, go_ep2_id):
+    load_response_set("cli.transfer_activate_success")
+    submit_meta = load_response(globus_sdk.TransferClient.submit_transfer).metadata
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--max-items-per-task",
+            "3",
+            "--batch",
+            "-",
+            f"{go_ep1_id}:/",
+            f"{go_ep2_id}:/",
+        ],
+        stdin=SPLIT_BATCH_INPUT,
+    )
+    lines = result.output.splitlines()
+    assert lines[0].split(" | ")[:2] == ["Task", "Items"]
+    assert len(lines) == 4
+    assert all(submit_meta["task_id"] in line for line in lines[2:])
+
+
+def test_max_items_per_task_rejects_submission_id(run_line, go_ep1_id):
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--max-items-per-task",
+            "2",
+            "--submission-id",
+            "5902daab-ffea-4e83-84f6-f69e5f8b7bb3",
+            "--batch",
+            "-",
+            f"{go_ep1_id}:/",
+            f"{go_ep1_id}:/",
+        ],
+        stdin=SPLIT_BATCH_INPUT,
+        assert_exit_code=2,
+    )
+    assert "You cannot use --submission-id" in result.stderr
+
+
+def test_delete_batch_collapses_paths(run_line, go_ep1_id):
+    load_response_set("cli.get_submission_id")
+    result = run_line(
+        f"globus delete -F json --dry-run -r --batch - {go_ep1_id}:/base",
+        stdin="dir/\ndir/file1\ndir/sub/file2\nother\nother\n",
+    )
+
+    json_output = json.loads(result.stdout)
+    assert [item["path"] for item in json_output["DATA"]] == [
+        "/base/dir/",
+        "/base/other",
+    ]
+    assert (
+        "Removed 3 of 5 paths from the batch (1 repeated, 2 under a recursively "
+        "deleted path)"
+    ) in result.stderr
+
+
+@pytest.mark.parametrize("option", ("--no-collapse-batch-paths", None))
+def test_delete_batch_without_collapsing(run_line, go_ep1_id, option):
+    load_response_set("cli.get_submission_id")
+    line = f"globus delete -F json --dry-run --batch - {go_ep1_id}:/base"
+    if option:
+        line += f" {option} -r"
+    result = run_line(line, stdin="dir/\ndir/file1\n")
+
+    # either collapsing is disabled, or the deletion is not recursive
+    json_output = json.loads(result.stdout)
+    assert [item["path"] for item in json_output["DATA"]] == [
+        "/base/dir/",
+        "/base/dir/file1",
+    ]
+    assert "Removed" not in result.stderr
+
+
+def _register_ls_trees(trees):
+    """
+    Register operation_ls responses which list directories from ``trees``, a dict
+    mapping endpoint IDs to {directory path: [items]}. Other paths are not found.
+    """
+
+    def callback(request):
+        endpoint_id = request.url.split("/operation/endpoint/")[1].split("/")[0]
+        path = request.params["path"]
+        items = trees.get(endpoint_id, {}).get(path)
+        if items is None:
+            body = {"code": "ClientError.NotFound", "message": f"{path} not found"}
+            return (404, {}, json.dumps(body))
+        return (200, {}, json.dumps({"DATA": items, "path": path}))
+
+    base_url = "https://transfer.api.globus.org/v0.10/operation/endpoint"
+    for endpoint_id in trees:
+        responses.add_callback(
+            responses.GET, f"{base_url}/{endpoint_id}/ls", callback=callback
+        )
+
+
+def test_transfer_plan_sync(run_line, go_ep1_id, go_ep2_id):
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.get_submission_id")
+    mtime = "2022-01-01 00:00:00+00:00"
+    _register_ls_trees(
+        {
+            go_ep1_id: {
+                "/src/": [
+                    {"name": "same", "type": "file", "size": 1, "last_modified": mtime},
+                    {"name": "diff", "type": "file", "size": 2, "last_modified": mtime},
+                    {"name": "newdir", "type": "dir", "size": 0},
+                ]
+            },
+            go_ep2_id: {
+                "/dst/": [
+                    {"name": "same", "type": "file", "size": 1, "last_modified": mtime},
+                    {"name": "diff", "type": "file", "size": 1, "last_modified": mtime},
+                ]
+            },
+        }
+    )
+
+    result = run_line(
+        "globus transfer -F json --dry-run --plan-sync "
+        f"{go_ep1_id}:/src {go_ep2_id}:/dst"
+    )
+
+    items = json.loads(result.stdout)["DATA"]
+    assert [
+        (x["source_path"], x["destination_path"], x["recursive"]) for x in items
+    ] == [
+        ("/src/diff", "/dst/diff", False),
+        ("/src/newdir/", "/dst/newdir/", True),
+    ]
+    assert (
+        "Planned sync: 0 new files, 1 changed files, 1 new directories, "
+        "1 unchanged files"
+    ) in result.stderr
+
+
+def test_transfer_plan_sync_up_to_date(run_line, go_ep1_id, go_ep2_id):
+    load_response_set("cli.transfer_activate_success")
+    item = {"name": "f", "type": "file", "size": 1, "last_modified": "2022-01-01"}
+    _register_ls_trees({go_ep1_id: {"/src/": [item]}, go_ep2_id: {"/dst/": [item]}})
+
+    result = run_line(f"globus transfer --plan-sync {go_ep1_id}:/src {go_ep2_id}:/dst")
+
+    assert "Nothing to transfer." in result.stderr
+    # the endpoints were activated before they were listed, and no task was submitted
+    paths = [urllib.parse.urlparse(call.request.url).path for call in responses.calls]
+    assert paths[0].endswith("/autoactivate")
+    assert not any(path.endswith("/transfer") for path in paths)
+
+
+def test_transfer_plan_sync_type_conflict(run_line, go_ep1_id, go_ep2_id):
+    load_response_set("cli.transfer_activate_success")
+    _register_ls_trees(
+        {
+            go_ep1_id: {"/src/": [{"name": "x", "type": "file", "size": 1}]},
+            go_ep2_id: {"/dst/": [{"name": "x", "type": "dir", "size": 0}]},
+        }
+    )
+
+    result = run_line(
+        f"globus transfer --plan-sync {go_ep1_id}:/src {go_ep2_id}:/dst",
+        assert_exit_code=1,
+    )
+    assert (
+        "Cannot sync /src/x to /dst/x: one is a file and the other is a directory"
+    ) in result.stderr
+
+
+def test_transfer_plan_sync_without_recursive_items_drops_filters(
+    run_line, go_ep1_id, go_ep2_id
+):
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.get_submission_id")
+    _register_ls_trees(
+        {
+            go_ep1_id: {"/src/": [{"name": "a.txt", "type": "file", "size": 1}]},
+            go_ep2_id: {"/dst/": []},
+        }
+    )
+
+    result = run_line(
+        "globus transfer -F json --dry-run --plan-sync --exclude '*.log' "
+        f"{go_ep1_id}:/src {go_ep2_id}:/dst"
+    )
+    data = json.loads(result.stdout)
+    assert [x["source_path"] for x in data["DATA"]] == ["/src/a.txt"]
+    assert "filter_rules" not in data
+
+
+@pytest.mark.parametrize(
+    "add_args",
+    (["--batch", "-"], ["--no-recursive"], ["--external-checksum", "x"], ["--delete"]),
+)
+def test_transfer_plan_sync_conflicting_options(
+    run_line, go_ep1_id, go_ep2_id, add_args
+):
+    result = run_line(
+        ["globus", "transfer", "--plan-sync", f"{go_ep1_id}:/a", f"{go_ep2_id}:/b"]
+        + add_args,
+        assert_exit_code=2,
+    )
+    assert "--plan-sync cannot be used with" in result.stderr
@@ -0,0 +1,161 @@
+import datetime
+import json
+import urllib.parse
+import uuid
+
+import pytest
+import responses
+
+TASK_LIST_URL = "https://transfer.api.globus.org/v0.10/task_list"
+
+
+def _make_task(minute, status="SUCCEEDED", label=None, completed_minute=None):
+    start = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    request_time = start + datetime.timedelta(minutes=minute)
+    completion_time = None
+    if status in ("SUCCEEDED", "FAILED"):
+        completion_time = start + datetime.timedelta(
+            minutes=completed_minute if completed_minute is not None else minute + 1
+        )
+    return {
+        "task_id": str(uuid.uuid1()),
+        "type": "TRANSFER",
+        "status": status,
+        "label": label,
+        "request_time": request_time.isoformat(),
+        "completion_time": completion_time.isoformat() if completion_time else None,
+        "source_endpoint_display_name": "src",
+        "destination_endpoint_display_name": "dst",
+    }
+
+
+@pytest.fixture
+def task_service():
+    """
+    A fake task_list API, which serves the documents in ``tasks`` and applies the
+    task_id, request_time, and completion_time filters used by `task sync`.
+    """
+
+    class TaskService:
+        def __init__(self):
+            self.tasks = []
+            self.queries = []
+
+        def callback(self, request):
+            params = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+            clauses = dict(
+                clause.split(":", 1) for clause in params["filter"][0].split("/")
+            )
+            self.queries.append(clauses)
+
+            data = list(self.tasks)
+            if "task_id" in clauses:
+                task_ids = clauses["task_id"].split(",")
+                data = [x for x in data if x["task_id"] in task_ids]
+            for field in ("request_time", "completion_time"):
+                if field in clauses:
+                    start = clauses[field].split(",")[0]
+                    data = [x for x in data if x[field] and x[field] >= start]
+            if "orderby" in params:
+                field, _ = params["orderby"][0].split()
+                data.sort(key=lambda x: x[field] or "")
+
+            offset = int(params.get("offset", ["0"])[0])
+            limit = int(params.get("limit", ["1000"])[0])
+            page = data[offset : offset + limit]
+            body = {"DATA": page, "offset": offset, "limit": limit, "total": len(data)}
+            return (200, {}, json.dumps(body))
+
+    service = TaskService()
+    responses.add_callback(responses.GET, TASK_LIST_URL, callback=service.callback)
+    return service
+
+
+def test_first_sync_fetches_all_tasks(run_line, task_service):
+    task_service.tasks = [_make_task(i) for i in range(3)]
+
+    result = run_line("globus task sync -Fjson")
+
+    output = json.loads(result.stdout)
+    assert output["fetched"] == 3
+    assert output["indexed"] == 3
+    assert output["watermark"] == task_service.tasks[-1]["completion_time"]
+    # no time filter was used
+    assert task_service.queries == [{"type": "TRANSFER,DELETE"}]
+
+
+def test_sync_fetches_only_new_and_unfinished_tasks(run_line, task_service):
+    old = [_make_task(i) for i in range(3)]
+    running = _make_task(5, status="ACTIVE")
+    task_service.tasks = old + [running]
+    run_line("globus task sync")
+    # the running task was requested after the others completed
+    watermark = running["request_time"]
+
+    # the running task finishes, and a new one is submitted
+    running.update(
+        status="SUCCEEDED", completion_time=_make_task(10)["completion_time"]
+    )
+    new = _make_task(20, label="new")
+    task_service.tasks.append(new)
+    task_service.queries.clear()
+
+    result = run_line("globus task sync -Fjson")
+
+    output = json.loads(result.stdout)
+    assert output["indexed"] == 5
+    # the running task is found by its completion time and by its ID
+    assert output["fetched"] == 2
+    assert output["watermark"] == new["completion_time"]
+    assert task_service.queries == [
+        {"type": "TRANSFER,DELETE", "request_time": f"{watermark},"},
+        {"type": "TRANSFER,DELETE", "completion_time": f"{watermark},"},
+        {"task_id": running["task_id"]},
+    ]
+
+    result = run_line("globus task list --from-index -Fjson")
+    tasks = json.loads(result.stdout)["DATA"]
+    assert [x["task_id"] for x in tasks] == [
+        new["task_id"],
+        running["task_id"],
+        *(x["task_id"] for x in reversed(old)),
+    ]
+    assert tasks[1]["status"] == "SUCCEEDED"
+
+
+def test_sync_continues_past_the_task_list_result_limit(run_line, task_service):
+    task_service.tasks = [_make_task(i) for i in range(1200)]
+
+    result = run_line("globus task sync -Fjson")
+
+    assert json.loads(result.stdout)["indexed"] == 1200
+    assert task_service.queries == [
+        {"type": "TRANSFER,DELETE"},
+        {
+            "type": "TRANSFER,DELETE",
+            "request_time": f"{task_service.tasks[999]['request_time']},",
+        },
+    ]
+
+
+def test_full_sync_discards_the_index(run_line, task_service):
+    task_service.tasks = [_make_task(i) for i in range(3)]
+    run_line("globus task sync")
+
+    # a task which is no longer visible (e.g. its history was deleted)
+    task_service.tasks.pop(0)
+    result = run_line("globus task sync --full -Fjson")
+
+    output = json.loads(result.stdout)
+    assert output["fetched"] == 2
+    assert output["indexed"] == 2
+
+
+def test_sync_text_output(run_line, task_service):
+    task_service.tasks = [_make_task(0)]
+
+    result = run_line("globus task sync")
+
+    assert "Tasks Fetched: 1" in result.output
+    assert "Tasks Indexed: 1" in result.output
+    assert task_service.tasks[0]["completion_time"] in result.output
@@ -0,0 +1,171 @@
+import json
+import urllib.parse
+import uuid
+
+import pytest
+import responses
+from globus_sdk._testing import RegisteredResponse, load_response
+
+TASK_LIST_URL = "https://transfer.api.globus.org/v0.10/task_list"
+
+
+def _register_task_list(statuses_by_poll):
+    """
+    Register a task_list response which returns task documents based on the
+    filtered task IDs. ``statuses_by_poll`` maps each task ID to the statuses it
+    reports on successive polls (the last status repeats).
+    """
+    polls = {task_id: 0 for task_id in statuses_by_poll}
+    requested = []
+
+    def callback(request):
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        filter_ = params["filter"][0]
+        assert filter_.startswith("task_id:")
+        task_ids = filter_[len("task_id:") :].split(",")
+        requested.append(task_ids)
+
+        data = []
+        for task_id in task_ids:
+            if task_id not in statuses_by_poll:
+                continue
+            statuses = statuses_by_poll[task_id]
+            status = statuses[min(polls[task_id], len(statuses) - 1)]
+            polls[task_id] += 1
+            data.append({"task_id": task_id, "status": status})
+        return (200, {}, json.dumps({"DATA": data, "length": len(data)}))
+
+    responses.add_callback(responses.GET, TASK_LIST_URL, callback=callback)
+    return requested
+
+
+def test_wait_multiple_tasks_success(run_line):
+    ids = [str(uuid.uuid1()) for _ in range(3)]
+    requested = _register_task_list(
+        {
+            ids[0]: ["ACTIVE", "ACTIVE", "SUCCEEDED"],
+            ids[1]: ["SUCCEEDED"],
+            ids[2]: ["ACTIVE", "SUCCEEDED"],
+        }
+    )
+
+    result = run_line(["globus", "task", "wait", "-Fjson", *ids])
+
+    # every poll covers all of the tasks still running, in one call
+    assert requested == [ids, [ids[0], ids[2]], [ids[0]]]
+    assert result.stderr.splitlines() == [
+        f"Task {ids[1]} completed with status SUCCEEDED",
+        f"Task {ids[2]} completed with status SUCCEEDED",
+        f"Task {ids[0]} completed with status SUCCEEDED",
+    ]
+    output = json.loads(result.stdout)
+    assert [task["task_id"] for task in output["DATA"]] == ids
+
+
+def test_wait_multiple_tasks_from_stdin(run_line):
+    ids = [str(uuid.uuid1()) for _ in range(2)]
+    requested = _register_task_list({ids[0]: ["SUCCEEDED"], ids[1]: ["SUCCEEDED"]})
+
+    run_line(
+        "globus task wait --batch -",
+        stdin=f"{ids[0]}\n\n# a comment\n{ids[1]}\n{ids[0]}\n",
+    )
+    assert requested == [ids]
+
+
+def test_wait_multiple_tasks_failure(run_line):
+    ids = [str(uuid.uuid1()) for _ in range(2)]
+    _register_task_list({ids[0]: ["SUCCEEDED"], ids[1]: ["ACTIVE", "FAILED"]})
+
+    result = run_line(["globus", "task", "wait", *ids], assert_exit_code=1)
+    assert f"Task {ids[1]} completed with status FAILED" in result.stderr
+
+
+@pytest.mark.parametrize("other_status", ["SUCCEEDED", "FAILED"])
+def test_wait_multiple_tasks_timeout(run_line, other_status):
+    ids = [str(uuid.uuid1()) for _ in range(2)]
+    _register_task_list({ids[0]: [other_status], ids[1]: ["ACTIVE"]})
+
+    # a failure takes precedence over the timeout exit code
+    expect_exit_code = 50 if other_status == "SUCCEEDED" else 1
+    result = run_line(
+        ["globus", "task", "wait", "--timeout", "3", "--timeout-exit-code", "50"] + ids,
+        assert_exit_code=expect_exit_code,
+    )
+    assert "1 of 2 tasks have yet to complete after 3 seconds" in result.stderr
+
+
+def test_wait_multiple_tasks_not_found(run_line):
+    ids = [str(uuid.uuid1()) for _ in range(2)]
+    _register_task_list({ids[0]: ["SUCCEEDED"]})
+
+    result = run_line(["globus", "task", "wait", *ids], assert_exit_code=1)
+    assert f"Task {ids[1]} was not found" in result.stderr
+
+
+def test_wait_many_tasks_polls_in_batches(run_line):
+    ids = [str(uuid.uuid1()) for _ in range(250)]
+    requested = _register_task_list({task_id: ["SUCCEEDED"] for task_id in ids})
+
+    run_line(["globus", "task", "wait", *ids])
+    assert [len(batch) for batch in requested] == [100, 100, 50]
+
+
+def test_wait_single_task(run_line):
+    task_id = str(uuid.uuid1())
+    load_response(
+        RegisteredResponse(
+            service="transfer",
+            path=f"/task/{task_id}",
+            json={"task_id": task_id, "status": "SUCCEEDED"},
+        )
+    )
+
+    result = run_line(f"globus task wait -Fjson {task_id}")
+    assert json.loads(result.stdout)["status"] == "SUCCEEDED"
+    assert result.stderr == ""
+
+
+def test_wait_requires_task_ids(run_line):
+    result = run_line("globus task wait", assert_exit_code=2)
+    assert "Missing argument 'TASK_ID'" in result.stderr
+
+
+def test_wait_invalid_batch_line(run_line):
+    result = run_line(
+        "globus task wait --batch -", stdin="not-a-task\n", assert_exit_code=2
+    )
+    assert "--batch line 1: 'not-a-task' is not a valid task ID" in result.stderr
+
+
+def test_wait_adaptive_polling(run_line, mocksleep, monkeypatch, caplog):
+    monkeypatch.setattr("random.random", lambda: 0.5)
+    ids = [str(uuid.uuid1()) for _ in range(2)]
+    _register_task_list({ids[0]: ["ACTIVE"] * 5 + ["SUCCEEDED"], ids[1]: ["SUCCEEDED"]})
+
+    run_line(
+        ["globus", "task", "wait", "--polling-strategy", "adaptive", "--debug", *ids]
+    )
+    sleeps = [call.args[0] for call in mocksleep.call_args_list]
+    assert sleeps == [1, 1.5, 2.25, 3.375, 5.0625]
+    assert "task wait made 6 requests for 2 tasks" in caplog.text
+
+
+def test_wait_timeout_is_not_overshot(run_line, mocksleep):
+    ids = [str(uuid.uuid1()) for _ in range(2)]
+    _register_task_list({ids[0]: ["ACTIVE"], ids[1]: ["ACTIVE"]})
+
+    run_line(
+        [
+            "globus",
+            "task",
+            "wait",
+            "--polling-interval",
+            "4",
+            "--timeout",
+            "10",
+            *ids,
+        ],
+        assert_exit_code=1,
+    )
+    assert [call.args[0] for call in mocksleep.call_args_list] == [4, 4, 2]
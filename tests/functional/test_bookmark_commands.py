@@ -1,7 +1,11 @@
 import json
+import urllib.parse
 
+import responses
 from globus_sdk._testing import load_response_set
 
+from globus_cli.commands.bookmark import _common as bookmark_common
+
 
 def test_bookmark_create(run_line, go_ep1_id):
     """
@@ -118,3 +122,47 @@ def test_bookmark_list_failure(run_line):
     load_response_set("cli.bookmark_list_failure")
     result = run_line("globus bookmark list", assert_exit_code=1)
     assert "InternalError" in result.stderr
+
+
+def _count_calls(method, path):
+    return sum(
+        1
+        for call in responses.calls
+        if call.request.method == method
+        and urllib.parse.urlparse(call.request.url).path.endswith(path)
+    )
+
+
+def test_bookmark_names_are_resolved_from_local_index(run_line, go_ep1_id):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    bookmark_id = meta["bookmark_id"]
+    bookmark_name = meta["bookmark_name"]
+    updated_bookmark_name = meta["bookmark_name_after_update"]
+
+    result = run_line(f'globus bookmark show "{bookmark_name}"')
+    assert f"{go_ep1_id}:/share/\n" == result.output
+    result = run_line(f'globus bookmark show "{bookmark_id}"')
+    assert f"{go_ep1_id}:/share/\n" == result.output
+    # the list was fetched once, and the ID was found in it
+    assert _count_calls("GET", "/bookmark_list") == 1
+    assert _count_calls("GET", f"/bookmark/{bookmark_id}") == 0
+
+    # a rename is applied to the index
+    run_line(f'globus bookmark rename "{bookmark_name}" "{updated_bookmark_name}"')
+    run_line(f'globus bookmark show "{updated_bookmark_name}"')
+    assert _count_calls("GET", "/bookmark_list") == 1
+
+    # a deleted bookmark is looked up again
+    run_line(f'globus bookmark delete "{updated_bookmark_name}"')
+    run_line(f'globus bookmark show "{updated_bookmark_name}"', assert_exit_code=1)
+    assert _count_calls("GET", "/bookmark_list") == 2
+
+
+def test_bookmark_index_expires(run_line, monkeypatch):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    bookmark_name = meta["bookmark_name"]
+
+    run_line(f'globus bookmark show "{bookmark_name}"')
+    monkeypatch.setattr(bookmark_common, "BOOKMARK_INDEX_TTL", -1)
+    run_line(f'globus bookmark show "{bookmark_name}"')
+    assert _count_calls("GET", "/bookmark_list") == 2
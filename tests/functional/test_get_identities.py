@@ -1,7 +1,13 @@
 import json
+import threading
+import uuid
 
+import responses
 from globus_sdk._testing import RegisteredResponse, load_response, load_response_set
 
+from globus_cli.commands.get_identities import _resolve_identities
+from globus_cli.parsing import ParsedIdentity
+
 
 def test_default_one_id(run_line):
     """
@@ -92,3 +98,133 @@ def test_json(run_line):
     assert meta["user_id"] == output["identities"][0]["id"]
     for key in ["username", "name", "organization", "email"]:
         assert meta[key] == output["identities"][0][key]
+
+
+def test_batch_from_stdin(run_line):
+    """
+    Reads inputs from stdin with --batch, after any given as arguments
+    """
+    meta = load_response_set("cli.multiuser_get_identities").metadata
+    users = meta["users"]
+    stdin = "\n".join(
+        [
+            users[1]["username"],
+            "",
+            "# comments are ignored",
+            users[0]["user_id"],
+        ]
+    )
+    result = run_line(
+        f"globus get-identities {users[0]['username']} --batch -", stdin=stdin
+    )
+    assert result.output.splitlines() == [
+        users[0]["user_id"],
+        users[1]["user_id"],
+        users[0]["username"],
+    ]
+
+
+def test_batch_invalid_line(run_line):
+    result = run_line(
+        "globus get-identities --batch -",
+        stdin="foo@globusid.org\ninvalid\n",
+        assert_exit_code=2,
+    )
+    assert "--batch line 2: 'invalid' does not appear" in result.stderr
+
+
+def test_no_values_is_an_error(run_line):
+    result = run_line("globus get-identities", assert_exit_code=2)
+    assert "Either VALUES or --batch must be given" in result.stderr
+
+
+def test_lookups_are_batched_and_deduplicated(run_line, monkeypatch):
+    """
+    Inputs are split into batches of unique values, and output stays in input order
+    """
+    monkeypatch.setattr(
+        "globus_cli.commands.get_identities.IDENTITY_LOOKUP_BATCH_SIZE", 2
+    )
+    meta = load_response_set("cli.multiuser_get_identities").metadata
+    users = meta["users"]
+    in_vals = [
+        users[0]["username"],
+        users[0]["username"].upper(),
+        users[1]["user_id"],
+        "invalid@nosuchdomain.exists",
+        users[1]["username"],
+        users[0]["user_id"],
+        users[0]["username"],
+    ]
+
+    result = run_line("globus get-identities --batch -", stdin="\n".join(in_vals))
+    assert result.output.splitlines() == [
+        users[0]["user_id"],
+        users[0]["user_id"],
+        users[1]["username"],
+        "NO_SUCH_IDENTITY",
+        users[1]["user_id"],
+        users[0]["username"],
+        users[0]["user_id"],
+    ]
+
+    # three unique usernames (two batches) and two unique IDs (one batch)
+    requested = sorted(
+        sorted(v for v in call.request.params.get(k, "").split(",") if v)
+        for call in responses.calls
+        for k in ("ids", "usernames")
+        if k in call.request.params
+    )
+    assert requested == sorted(
+        [
+            sorted([users[0]["username"], "invalid@nosuchdomain.exists"]),
+            [users[1]["username"]],
+            sorted([users[1]["user_id"], users[0]["user_id"]]),
+        ]
+    )
+
+
+def test_verbose_json_output_is_deduplicated(run_line):
+    meta = load_response_set("cli.multiuser_get_identities").metadata
+    users = meta["users"]
+    result = run_line(
+        [
+            "globus",
+            "get-identities",
+            "-Fjson",
+            users[1]["username"],
+            users[0]["user_id"],
+            users[1]["user_id"],
+        ]
+    )
+    output = json.loads(result.output)
+    assert [x["id"] for x in output["identities"]] == [
+        users[1]["user_id"],
+        users[0]["user_id"],
+    ]
+
+
+def test_trailing_partial_batches_are_looked_up_together():
+    started = {"identity": threading.Event(), "username": threading.Event()}
+
+    class FakeAuthClient:
+        def get_identities(self, *, ids=None, usernames=None, provision=False):
+            idtype, other = (
+                ("identity", "username") if ids else ("username", "identity")
+            )
+            started[idtype].set()
+            # each lookup only finishes once the other has started
+            assert started[other].wait(timeout=1)
+            return {"identities": []}
+
+    resolved = _resolve_identities(
+        FakeAuthClient(),
+        [
+            ParsedIdentity("foo@globusid.org", "username"),
+            ParsedIdentity(str(uuid.UUID(int=1)), "identity"),
+        ],
+        False,
+        batch_size=10,
+        concurrency=2,
+    )
+    assert [identity for _, identity in resolved] == [None, None]
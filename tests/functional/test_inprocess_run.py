@@ -0,0 +1,77 @@
+import pytest
+from globus_sdk._testing import load_response_set
+
+import globus_cli
+from globus_cli import inprocess
+from globus_cli.login_manager import LoginManager
+
+
+@pytest.fixture(autouse=True)
+def fresh_login_manager(monkeypatch):
+    # the shared LoginManager holds the token storage of the test which built it
+    monkeypatch.setattr(inprocess, "_login_manager", None)
+
+
+def test_run_returns_displayed_data(capsys):
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = globus_cli.run(["whoami"])
+
+    assert result.exit_code == 0
+    assert len(result.data) == 1
+    assert result.data[0]["preferred_username"] == meta["username"]
+    assert result.data[0]["email"] == meta["email"]
+    assert result.stdout == ""
+    # nothing was printed
+    assert capsys.readouterr() == ("", "")
+
+
+def test_run_applies_jmespath():
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = globus_cli.run(["globus", "whoami", "--jmespath", "email"])
+
+    assert result.exit_code == 0
+    assert result.data == [meta["email"]]
+
+
+def test_run_returns_exit_code_and_errors(capsys):
+    result = globus_cli.run(["no-such-command"])
+
+    assert result.exit_code == 2
+    assert result.data == []
+    assert "No such command" in result.stderr
+    assert capsys.readouterr() == ("", "")
+
+
+def test_run_reuses_clients(monkeypatch):
+    load_response_set("cli.foo_user_info")
+    authorizers = []
+    get_client_authorizer = LoginManager._get_client_authorizer
+
+    def counting_get_client_authorizer(self, *args, **kwargs):
+        authorizers.append(args)
+        return get_client_authorizer(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        LoginManager, "_get_client_authorizer", counting_get_client_authorizer
+    )
+
+    for _ in range(3):
+        assert globus_cli.run(["whoami"]).exit_code == 0
+    assert authorizers == [("auth.globus.org",)]
+
+
+def test_run_rereads_token_storage(test_token_storage):
+    load_response_set("cli.foo_user_info")
+    assert globus_cli.run(["whoami"]).exit_code == 0
+
+    # another process logs out, which the snapshot of stored data does not show
+    test_token_storage.clear_snapshot()
+    test_token_storage._load_snapshot()
+    test_token_storage._connection.execute("DELETE FROM token_storage")
+    test_token_storage._connection.commit()
+
+    result = globus_cli.run(["whoami"])
+    assert result.exit_code == 4
+    assert "Missing login" in result.stderr
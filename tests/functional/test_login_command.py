@@ -21,6 +21,8 @@ def test_login_validates_token(
 
     with mock.patch("globus_cli.login_manager.manager.internal_auth_client") as m:
         ac = mock.MagicMock(spec=globus_sdk.NativeAppAuthClient)
+        # the client's transport is set on the instance, so it is not in the spec
+        ac.transport = mock.Mock()
         m.return_value = ac
 
         run_line("globus login")
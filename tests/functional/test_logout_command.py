@@ -0,0 +1,24 @@
+import responses
+from globus_sdk._testing import load_response_set
+
+from globus_cli.cache import get_activation_cache, get_bookmark_index_cache
+
+
+def test_logout_clears_local_caches(run_line):
+    load_response_set("cli.foo_user_info")
+    responses.add(
+        responses.DELETE,
+        "https://auth.globus.org/v2/api/clients/fakeClientIDString",
+        json={},
+    )
+    responses.add(
+        responses.POST, "https://auth.globus.org/v2/oauth2/token/revoke", json={}
+    )
+    get_activation_cache()["some-endpoint"] = 0
+    get_bookmark_index_cache()["bookmarks"] = []
+
+    result = run_line("globus logout --yes")
+
+    assert "successfully logged out" in result.stdout
+    assert "some-endpoint" not in get_activation_cache()
+    assert "bookmarks" not in get_bookmark_index_cache()
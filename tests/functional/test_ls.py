@@ -1,3 +1,4 @@
+import json
 import urllib.parse
 
 from globus_sdk._testing import (
@@ -106,3 +107,27 @@ def test_orderby_encoding(run_line, go_ep1_id):
     parsed_params = urllib.parse.parse_qs(parsed_url.query)
     assert "orderby" in parsed_params
     assert parsed_params["orderby"] == ["size DESC,name ASC"]
+
+
+def test_recursive_parallel_matches_serial(run_line, go_ep1_id):
+    """
+    Confirms --parallel produces the same output, in the same order, as a serial
+    recursive ls
+    """
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.ls_results")
+    serial = run_line(f"globus ls -r -F json {go_ep1_id}:/share")
+    parallel = run_line(f"globus ls -r --parallel 4 -F json {go_ep1_id}:/share")
+    assert '"name": "godata/file1.txt"' in parallel.output
+    assert parallel.output == serial.output
+
+
+def test_recursive_jsonl(run_line, go_ep1_id):
+    """
+    Confirms -F jsonl prints one item per line for the RecursiveLsResponse
+    """
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.ls_results")
+    result = run_line(f"globus ls -r -F jsonl {go_ep1_id}:/share")
+    names = [json.loads(line)["name"] for line in result.output.splitlines()]
+    assert "godata/file1.txt" in names
@@ -0,0 +1,90 @@
+import pytest
+from globus_sdk._testing import load_response_set
+
+from globus_cli.login_manager import LoginManager
+
+
+def test_shell_runs_each_line(run_line):
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = run_line(
+        "globus shell",
+        stdin="# a comment\n\nwhoami\nglobus whoami --verbose\n",
+    )
+    assert result.stdout.count(meta["username"]) == 2
+    assert "Email" in result.stdout
+
+
+def test_shell_reuses_clients(run_line, monkeypatch):
+    load_response_set("cli.foo_user_info")
+    authorizers = []
+    get_client_authorizer = LoginManager._get_client_authorizer
+
+    def counting_get_client_authorizer(self, *args, **kwargs):
+        authorizers.append(args)
+        return get_client_authorizer(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        LoginManager, "_get_client_authorizer", counting_get_client_authorizer
+    )
+
+    run_line("globus shell", stdin="whoami\nwhoami\nwhoami\n")
+    assert authorizers == [("auth.globus.org",)]
+
+
+def test_shell_exits_with_status_of_last_command(run_line):
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = run_line(
+        "globus shell", stdin="no-such-command\nwhoami\n", assert_exit_code=0
+    )
+    assert "No such command" in result.stderr
+    assert meta["username"] in result.stdout
+
+    run_line("globus shell", stdin="whoami\nno-such-command\n", assert_exit_code=2)
+
+
+def test_shell_exit_on_error(run_line):
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = run_line(
+        "globus shell --exit-on-error",
+        stdin="no-such-command\nwhoami\n",
+        assert_exit_code=2,
+    )
+    assert meta["username"] not in result.stdout
+
+
+def test_shell_stops_at_exit(run_line):
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = run_line("globus shell", stdin="exit\nwhoami\n")
+    assert meta["username"] not in result.stdout
+
+
+def test_shell_rejects_bad_lines(run_line):
+    result = run_line(
+        "globus shell", stdin="whoami 'unterminated\nshell\n", assert_exit_code=2
+    )
+    assert "Could not parse command" in result.stderr
+    assert "cannot be run in a shell" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "line",
+    (
+        "transfer --batch - {ep}:/a {ep}:/b",
+        "transfer --batch=- {ep}:/a {ep}:/b",
+        "task wait -",
+    ),
+)
+def test_shell_rejects_reading_stdin(run_line, go_ep1_id, line):
+    meta = load_response_set("cli.foo_user_info").metadata
+
+    result = run_line(
+        "globus shell",
+        stdin=line.format(ep=go_ep1_id) + "\nwhoami\n",
+    )
+    assert "Commands cannot read from stdin ('-')" in result.stderr
+    # the following command was run, and not read as input
+    assert meta["username"] in result.stdout
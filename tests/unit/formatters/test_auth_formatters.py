@@ -0,0 +1,37 @@
+from unittest import mock
+
+import click
+
+from globus_cli.parsing.command_state import CommandState
+from globus_cli.termio.formatters.auth import IdentityIDFormatter
+
+IDENTITY_ID = "25de0aed-aa83-4600-a1be-a62a910af116"
+
+
+def _mock_auth_client():
+    client = mock.Mock()
+    client.get_identities.return_value = {
+        "identities": [{"id": IDENTITY_ID, "username": "foo@globusid.org"}]
+    }
+    return client
+
+
+def test_identity_formatter_uses_persistent_cache():
+    client = _mock_auth_client()
+    assert IdentityIDFormatter(client).format(IDENTITY_ID) == "foo@globusid.org"
+    assert client.get_identities.call_count == 1
+
+    # a new formatter (as in a new command) does not need to call Auth again
+    assert IdentityIDFormatter(client).format(IDENTITY_ID) == "foo@globusid.org"
+    assert client.get_identities.call_count == 1
+
+
+def test_identity_formatter_cache_can_be_disabled():
+    client = _mock_auth_client()
+    IdentityIDFormatter(client).format(IDENTITY_ID)
+
+    with click.Context(click.Command("fake-command")) as ctx:
+        ctx.ensure_object(CommandState).use_identity_cache = False
+        formatter = IdentityIDFormatter(client)
+        assert formatter.format(IDENTITY_ID) == "foo@globusid.org"
+    assert client.get_identities.call_count == 2
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import click
+import pytest
+
+from globus_cli.cache import get_activation_cache
+from globus_cli.services.transfer import (
+    autoactivate,
+    autoactivate_endpoints,
+    forget_activation,
+)
+
+
+class FakeTransferClient:
+    def __init__(self, expires_in=3600, code="AlreadyActivated"):
+        self.expires_in = expires_in
+        self.code = code
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def endpoint_autoactivate(self, endpoint_id, if_expires_in=None):
+        with self._lock:
+            self.calls.append((endpoint_id, if_expires_in))
+        return {
+            "code": self.code,
+            "expires_in": self.expires_in,
+            "oauth_server": None,
+            "DATA": [],
+        }
+
+
+def test_activation_is_cached():
+    client = FakeTransferClient()
+    assert autoactivate(client, "ep1", if_expires_in=60)["code"] == "AlreadyActivated"
+    assert autoactivate(client, "ep1", if_expires_in=60) is None
+    assert client.calls == [("ep1", 60)]
+
+
+def test_cached_activation_which_expires_soon_is_checked_again():
+    client = FakeTransferClient(expires_in=600)
+    autoactivate(client, "ep1", if_expires_in=60)
+    # the cached activation does not last for another day
+    autoactivate(client, "ep1", if_expires_in=86400)
+    assert client.calls == [("ep1", 60), ("ep1", 86400)]
+
+
+def test_activation_which_never_expires_is_cached():
+    client = FakeTransferClient(expires_in=-1)
+    autoactivate(client, "ep1", if_expires_in=86400)
+    assert get_activation_cache()["ep1"] == {"expires_at": None}
+    autoactivate(client, "ep1", if_expires_in=86400)
+    assert len(client.calls) == 1
+
+
+def test_expired_cache_entry_is_checked_again(monkeypatch):
+    client = FakeTransferClient()
+    autoactivate(client, "ep1")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 3600)
+    autoactivate(client, "ep1")
+    assert len(client.calls) == 2
+
+
+def test_failed_activation_is_not_cached():
+    client = FakeTransferClient(code="AutoActivationFailed")
+    with click.Context(click.Command("test")):
+        with pytest.raises(click.exceptions.Exit):
+            autoactivate_endpoints(client, ["ep1"])
+    assert "ep1" not in get_activation_cache()
+
+
+def test_forget_activation():
+    client = FakeTransferClient()
+    autoactivate(client, "ep1")
+    forget_activation("ep1")
+    autoactivate(client, "ep1")
+    assert len(client.calls) == 2
+
+
+def test_autoactivate_endpoints_runs_requests_concurrently():
+    client = FakeTransferClient()
+    barrier = threading.Barrier(2, timeout=5)
+    original = client.endpoint_autoactivate
+
+    def endpoint_autoactivate(endpoint_id, if_expires_in=None):
+        # both requests must be in flight at once to pass the barrier
+        barrier.wait()
+        return original(endpoint_id, if_expires_in=if_expires_in)
+
+    client.endpoint_autoactivate = endpoint_autoactivate
+
+    results = autoactivate_endpoints(client, ["ep1", "ep2", "ep1"], if_expires_in=60)
+
+    assert len(results) == 2
+    assert sorted(client.calls) == [("ep1", 60), ("ep2", 60)]
+    assert autoactivate_endpoints(client, ["ep1", "ep2"], if_expires_in=60) == [
+        None,
+        None,
+    ]
@@ -0,0 +1,45 @@
+import pytest
+
+from globus_cli.services.transfer import plan_delete_paths
+
+
+def test_repeated_paths_are_removed():
+    plan = plan_delete_paths(["/a/x", "/a/y", "/a/x", "/a/y/"], recursive=False)
+    assert plan.paths == ["/a/x", "/a/y"]
+    assert (plan.duplicates, plan.covered, plan.removed) == (2, 0, 2)
+
+
+def test_paths_under_a_recursive_delete_are_removed():
+    paths = ["/a/b/c.txt", "/a/b/", "/a/bc", "/a/b/d/e.txt", "/z", "/a/b/c.txt"]
+    plan = plan_delete_paths(paths, recursive=True)
+    assert plan.paths == ["/a/b/", "/a/bc", "/z"]
+    assert (plan.duplicates, plan.covered) == (1, 2)
+
+
+def test_paths_are_kept_without_recursion():
+    paths = ["/a/", "/a/b"]
+    assert plan_delete_paths(paths, recursive=False).paths == paths
+
+
+@pytest.mark.parametrize(
+    "paths, expect",
+    (
+        (["/", "/a", "~/b"], ["/", "~/b"]),
+        (["~/", "~/b", "/b"], ["~/", "/b"]),
+        (["rel/", "rel/x", "/rel/x"], ["rel/", "/rel/x"]),
+    ),
+)
+def test_roots_and_relative_paths(paths, expect):
+    assert plan_delete_paths(paths, recursive=True).paths == expect
+
+
+@pytest.mark.parametrize("interpret_globs, expect_covered", ((True, 0), (False, 1)))
+def test_globs_do_not_cover_other_paths(interpret_globs, expect_covered):
+    plan = plan_delete_paths(
+        ["/a/*", "/a/*/b", "/c/", "/c/d*"],
+        recursive=True,
+        interpret_globs=interpret_globs,
+    )
+    # a literal ancestor always covers a glob below it
+    assert "/c/d*" not in plan.paths
+    assert plan.covered == expect_covered + 1
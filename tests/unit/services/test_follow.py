@@ -0,0 +1,69 @@
+from globus_cli.services.follow import EventTracker, follow_event_log
+
+
+def _event(time, code="PROGRESS"):
+    return {"time": time, "code": code}
+
+
+def test_tracker_returns_new_events_oldest_first():
+    tracker = EventTracker()
+    log = [_event("t2", "B"), _event("t1", "A")]
+    assert tracker.new_events(log) == [_event("t1", "A"), _event("t2", "B")]
+    assert tracker.new_events(log) == []
+
+    log = [_event("t3", "C"), *log]
+    assert tracker.new_events(log) == [_event("t3", "C")]
+
+
+def test_tracker_distinguishes_events_with_the_same_time():
+    tracker = EventTracker()
+    assert tracker.new_events([_event("t1", "A")]) == [_event("t1", "A")]
+    # a second event is logged in the same second as the first
+    log = [_event("t1", "B"), _event("t1", "A")]
+    assert tracker.new_events(log) == [_event("t1", "B")]
+
+
+def test_tracker_stops_reading_at_seen_events():
+    tracker = EventTracker()
+    tracker.new_events([_event("t2"), _event("t1")])
+
+    read = []
+
+    def log():
+        for event in [_event("t3"), _event("t2"), _event("t1"), _event("t0")]:
+            read.append(event)
+            yield event
+
+    assert tracker.new_events(log()) == [_event("t3")]
+    # reading stopped at the first event older than the latest seen
+    assert read == [_event("t3"), _event("t2"), _event("t1")]
+
+
+def test_tracker_limit():
+    tracker = EventTracker()
+    log = [_event("t3"), _event("t2"), _event("t1")]
+    assert tracker.new_events(log, limit=2) == [_event("t2"), _event("t3")]
+
+
+def test_follow_event_log(mocksleep):
+    logs = [
+        [_event("t1")],
+        [_event("t1")],
+        [_event("t2"), _event("t1")],
+        [_event("t3"), _event("t2"), _event("t1")],
+    ]
+    done = iter([False, False, False, True])
+
+    events = list(
+        follow_event_log(
+            lambda: logs.pop(0), lambda: next(done), interval=1, max_interval=100
+        )
+    )
+
+    assert events == [_event("t1"), _event("t2"), _event("t3")]
+    assert logs == []
+    # polling slows down while the log is quiet, and speeds up on new events
+    intervals = [call.args[0] for call in mocksleep.call_args_list]
+    assert len(intervals) == 3
+    assert intervals[1] > intervals[0]
+    assert intervals[2] < intervals[1]
@@ -0,0 +1,67 @@
+import pytest
+
+from globus_cli.services.transfer.polling import (
+    AdaptivePollingSchedule,
+    PollingSchedule,
+    get_polling_schedule,
+)
+
+
+def _intervals(schedule, polls):
+    return [schedule.next_interval(tasks) for tasks in polls]
+
+
+def test_fixed_schedule():
+    schedule = get_polling_schedule("fixed", 5)
+    assert type(schedule) is PollingSchedule
+    assert _intervals(schedule, [[]] * 3) == [5, 5, 5]
+
+
+def test_adaptive_schedule_grows_to_ceiling():
+    schedule = AdaptivePollingSchedule(
+        1, max_interval=5, growth=2, rng=lambda: 0.5  # no jitter
+    )
+    assert _intervals(schedule, [[]] * 6) == [1, 2, 4, 5, 5, 5]
+
+
+def test_adaptive_schedule_ceiling_is_at_least_initial_interval():
+    schedule = AdaptivePollingSchedule(600, rng=lambda: 0.5)
+    assert _intervals(schedule, [[]] * 2) == [600, 600]
+
+
+@pytest.mark.parametrize("rand, expect", [(0.0, 8.0), (0.5, 10.0), (1.0, 12.0)])
+def test_adaptive_schedule_jitter(rand, expect):
+    schedule = AdaptivePollingSchedule(10, jitter=0.2, rng=lambda: rand)
+    assert schedule.next_interval([]) == pytest.approx(expect)
+
+
+def test_adaptive_schedule_resets_when_data_stops_moving():
+    schedule = AdaptivePollingSchedule(1, growth=2, rng=lambda: 0.5)
+    polls = [
+        [{"bytes_transferred": 0}],
+        [{"bytes_transferred": 0}],
+        [{"bytes_transferred": 100}],
+        [{"bytes_transferred": 500}],
+        # stopped: back to the start
+        [{"bytes_transferred": 500}],
+        # still stopped: grow again
+        [{"bytes_transferred": 500}],
+    ]
+    assert _intervals(schedule, polls) == [1, 2, 4, 8, 1, 2]
+
+
+def test_adaptive_schedule_sums_progress_over_tasks():
+    schedule = AdaptivePollingSchedule(1, growth=2, rng=lambda: 0.5)
+    polls = [
+        [{"bytes_transferred": 0}, {"bytes_transferred": 10}, {"status": "ACTIVE"}],
+        [{"bytes_transferred": 10}, {"bytes_transferred": 10}, {"status": "ACTIVE"}],
+        [{"bytes_transferred": 10}, {"bytes_transferred": 20}, {"status": "ACTIVE"}],
+    ]
+    assert _intervals(schedule, polls) == [1, 2, 4]
+
+
+def test_adaptive_schedule_reset():
+    schedule = AdaptivePollingSchedule(1, growth=2, rng=lambda: 0.5)
+    assert _intervals(schedule, [[]] * 3) == [1, 2, 4]
+    schedule.reset()
+    assert _intervals(schedule, [[]] * 2) == [1, 2]
@@ -0,0 +1,107 @@
+import globus_sdk
+import pytest
+import responses
+
+from globus_cli.services import rate_limit
+from globus_cli.services.rate_limit import RateLimiter, get_rate_limiter
+from globus_cli.services.transfer import CustomTransferClient
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_limiters(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_burst_does_not_sleep(mocksleep, fake_clock):
+    limiter = RateLimiter(5, burst=3)
+    for _ in range(3):
+        limiter.acquire()
+    mocksleep.assert_not_called()
+
+    # the fourth request must wait for one token at 5/s
+    limiter.acquire()
+    mocksleep.assert_called_once_with(pytest.approx(0.2))
+
+
+def test_tokens_refill_over_time(mocksleep, fake_clock):
+    limiter = RateLimiter(5, burst=1)
+    limiter.acquire()
+    fake_clock[0] += 0.2
+    limiter.acquire()
+    mocksleep.assert_not_called()
+
+
+def test_aimd_rate_adjustment():
+    limiter = RateLimiter(10, max_rate=10.5, min_rate=2, increase=0.25)
+    limiter.record_success()
+    assert limiter.rate == 10.25
+    limiter.record_success()
+    limiter.record_success()
+    assert limiter.rate == 10.5
+
+    limiter.record_throttle()
+    assert limiter.rate == 5.25
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.rate == 2
+
+
+def test_retry_after_blocks_next_request(mocksleep, fake_clock):
+    limiter = RateLimiter(10)
+    limiter.record_throttle(retry_after=7)
+    limiter.acquire()
+    mocksleep.assert_called_once_with(pytest.approx(7))
+
+
+def test_request_context_records_success_only_without_error():
+    limiter = RateLimiter(10, increase=1)
+    with limiter.request():
+        pass
+    assert limiter.rate == 11
+
+    with pytest.raises(RuntimeError):
+        with limiter.request():
+            raise RuntimeError("oops")
+    assert limiter.rate == 11
+
+
+@pytest.mark.parametrize("status", (429, 503))
+def test_transfer_client_reports_throttling(status):
+    responses.add(
+        responses.GET,
+        "https://transfer.api.globus.org/v0.10/endpoint/foo",
+        status=status,
+        headers={"Retry-After": "3"},
+        json={"code": "Throttled", "message": "slow down"},
+    )
+    client = CustomTransferClient()
+    limiter = RateLimiter(10)
+    with pytest.raises(globus_sdk.TransferAPIError):
+        with limiter.request():
+            client.get_endpoint("foo")
+    assert limiter.rate == 5
+
+
+def test_get_rate_limiter_is_shared_per_key():
+    assert get_rate_limiter("abc") is get_rate_limiter("abc")
+    assert get_rate_limiter("abc") is not get_rate_limiter("def")
+
+
+def test_rate_configuration_per_key(monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_RATE_LIMIT", "7, ABC=3")
+    assert get_rate_limiter("abc").rate == 3
+    assert get_rate_limiter("def").rate == 7
+    assert get_rate_limiter().rate == 7
+
+
+def test_invalid_rate_configuration(monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_RATE_LIMIT", "abc=fast")
+    with pytest.raises(Exception, match="GLOBUS_CLI_RATE_LIMIT"):
+        get_rate_limiter("abc")
@@ -0,0 +1,98 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from globus_cli.services.transfer import RecursiveLsResponse
+
+
+def _build_tree(fanout, depth):
+    """
+    Build a map of {path: [(name, type), ...]} describing a synthetic filesystem
+    in which every directory has `fanout` subdirectories and one file.
+    """
+    tree = {}
+
+    def _fill(path, remaining):
+        entries = [(f"file{remaining}.txt", "file")]
+        if remaining:
+            for i in range(fanout):
+                subdir = f"dir{i}"
+                entries.append((subdir, "dir"))
+                _fill(f"{path}{subdir}/", remaining - 1)
+        tree[path] = entries
+
+    _fill("/", depth)
+    return tree
+
+
+class _FakeClient:
+    def __init__(self, tree):
+        self.tree = tree
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def operation_ls(self, endpoint_id, **params):
+        path = params.get("path", "/")
+        if not path.endswith("/"):
+            path += "/"
+        with self.lock:
+            self.calls.append(path)
+        data = {
+            "path": path,
+            "DATA": [{"name": name, "type": type_} for name, type_ in self.tree[path]],
+        }
+        res = mock.Mock()
+        res.data = data
+        res.__getitem__ = lambda self, key: data[key]
+        return res
+
+
+@pytest.mark.parametrize("parallelism", (2, 4, 16))
+@pytest.mark.parametrize("max_depth", (0, 1, 3))
+def test_parallel_order_matches_serial(parallelism, max_depth):
+    tree = _build_tree(fanout=3, depth=3)
+
+    serial = [
+        x["name"]
+        for x in RecursiveLsResponse(
+            _FakeClient(tree), "EP", {"path": "/"}, max_depth=max_depth
+        )
+    ]
+    parallel_client = _FakeClient(tree)
+    parallel = [
+        x["name"]
+        for x in RecursiveLsResponse(
+            parallel_client,
+            "EP",
+            {"path": "/"},
+            max_depth=max_depth,
+            parallelism=parallelism,
+        )
+    ]
+
+    assert parallel == serial
+    # every directory within the depth limit is listed exactly once
+    assert len(parallel_client.calls) == len(set(parallel_client.calls))
+    assert len(parallel_client.calls) == sum(3**d for d in range(max_depth + 1))
+
+
+def test_parallel_does_not_mutate_shared_params():
+    tree = _build_tree(fanout=2, depth=2)
+    params = {"path": "/", "show_hidden": 0}
+    list(RecursiveLsResponse(_FakeClient(tree), "EP", params, parallelism=4))
+    assert params == {"path": "/", "show_hidden": 0}
+
+
+def test_parallel_errors_are_raised_to_the_consumer():
+    tree = _build_tree(fanout=2, depth=2)
+    del tree["/dir1/"]
+
+    response = RecursiveLsResponse(_FakeClient(tree), "EP", {}, parallelism=4)
+    with pytest.raises(KeyError):
+        list(response)
+
+
+def test_invalid_parallelism_is_rejected():
+    with pytest.raises(ValueError):
+        RecursiveLsResponse(_FakeClient({}), "EP", {}, parallelism=0)
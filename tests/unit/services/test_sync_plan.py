@@ -0,0 +1,123 @@
+import globus_sdk
+import pytest
+from globus_sdk._testing import construct_error
+
+from globus_cli.services.transfer import SyncPlanItem, plan_sync_transfer
+
+
+def _file(name, size=1, mtime="2022-01-01 00:00:00+00:00"):
+    return {"name": name, "type": "file", "size": size, "last_modified": mtime}
+
+
+def _dir(name):
+    return {"name": name, "type": "dir", "size": 0, "last_modified": None}
+
+
+class FakeTransferClient:
+    def __init__(self, trees):
+        # trees maps endpoint IDs to {directory path: [items]}
+        self.trees = trees
+        self.listed = []
+
+    def operation_ls(self, endpoint_id, path, **kwargs):
+        self.listed.append((endpoint_id, path))
+        try:
+            items = self.trees[endpoint_id][path]
+        except KeyError:
+            raise construct_error(
+                error_class=globus_sdk.TransferAPIError,
+                http_status=404,
+                body={"code": "ClientError.NotFound", "message": "not found"},
+            )
+        # listings are not necessarily sorted
+        return {"DATA": [dict(x) for x in reversed(items)]}
+
+
+def test_plan_sync_transfers_only_differences():
+    client = FakeTransferClient(
+        {
+            "src": {
+                "/data/": [
+                    _file("same.txt"),
+                    _file("bigger.txt", size=2),
+                    _file("newer.txt", mtime="2022-02-01 00:00:00+00:00"),
+                    _file("new.txt"),
+                    _dir("sub"),
+                    _dir("newdir"),
+                ],
+                "/data/sub/": [_file("a"), _file("b")],
+            },
+            "dst": {
+                "/backup/": [
+                    _file("same.txt"),
+                    _file("bigger.txt"),
+                    _file("newer.txt"),
+                    _file("extra.txt"),
+                    _dir("sub"),
+                ],
+                "/backup/sub/": [_file("a", mtime="2022-03-01 00:00:00+00:00")],
+            },
+        }
+    )
+
+    plan = plan_sync_transfer(client, "src", "/data", "dst", "/backup/")
+
+    assert sorted(plan.items, key=lambda x: x.source_path) == [
+        SyncPlanItem("/data/bigger.txt", "/backup/bigger.txt", False),
+        SyncPlanItem("/data/new.txt", "/backup/new.txt", False),
+        SyncPlanItem("/data/newdir/", "/backup/newdir/", True),
+        SyncPlanItem("/data/newer.txt", "/backup/newer.txt", False),
+        SyncPlanItem("/data/sub/b", "/backup/sub/b", False),
+    ]
+    assert (plan.new_files, plan.changed_files, plan.new_dirs) == (2, 2, 1)
+    assert plan.unchanged_files == 2
+    # the new directory is not listed
+    assert ("src", "/data/newdir/") not in client.listed
+
+
+def test_plan_sync_missing_destination():
+    client = FakeTransferClient({"src": {"/data/": [_file("a")]}, "dst": {}})
+    plan = plan_sync_transfer(client, "src", "/data/", "dst", "/backup/")
+    assert plan.items == [SyncPlanItem("/data/", "/backup/", True)]
+
+
+def test_plan_sync_missing_source_is_an_error():
+    client = FakeTransferClient({"src": {}, "dst": {"/backup/": []}})
+    with pytest.raises(globus_sdk.TransferAPIError):
+        plan_sync_transfer(client, "src", "/data/", "dst", "/backup/")
+
+
+def test_plan_sync_applies_filter_rules_to_files():
+    client = FakeTransferClient(
+        {
+            "src": {"/d/": [_file("a.txt"), _file("b.log"), _file("c.log")]},
+            "dst": {"/e/": []},
+        }
+    )
+    plan = plan_sync_transfer(
+        client,
+        "src",
+        "/d/",
+        "dst",
+        "/e/",
+        filter_rules=[("include", "c.*"), ("exclude", "*.log")],
+    )
+    assert [x.source_path for x in plan.items] == ["/d/a.txt", "/d/c.log"]
+
+
+def test_plan_sync_reports_file_and_dir_conflicts():
+    client = FakeTransferClient(
+        {
+            "src": {"/d/": [_file("a"), _dir("b"), _file("c")]},
+            "dst": {"/e/": [_dir("a"), _file("b")]},
+        }
+    )
+    plan = plan_sync_transfer(client, "src", "/d/", "dst", "/e/")
+    assert plan.items == [SyncPlanItem("/d/c", "/e/c", False)]
+    assert plan.type_conflicts == [
+        SyncPlanItem("/d/a", "/e/a", False),
+        SyncPlanItem("/d/b/", "/e/b/", True),
+    ]
+    assert plan.changed_files == 0
+    # neither side of a conflict is walked
+    assert ("src", "/d/b/") not in client.listed
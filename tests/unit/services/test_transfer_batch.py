@@ -0,0 +1,71 @@
+import io
+import re
+
+import globus_sdk
+import pytest
+
+from globus_cli.services.transfer import add_batch_to_transfer_data
+
+BATCH_INPUT = """\
+# a comment, followed by a blank line
+
+a b
+  leading/space   trailing/space   \t
+/abs/src ~/dest/
+../up ./here/
+"quoted path" dest1
+escaped\\ path dest2
+--recursive srcdir/ destdir/
+src3 dest3 --external-checksum abc123
+-r srcdir2 destdir2
+src4 dest4 # trailing comment
+unicodeé dest6
+"""
+
+
+def _build(
+    batch_input,
+    source_base=None,
+    dest_base=None,
+    checksum_algorithm=None,
+    stream_class=io.StringIO,
+):
+    tdata = globus_sdk.TransferData(
+        source_endpoint="src_id", destination_endpoint="dst_id"
+    )
+    add_batch_to_transfer_data(
+        source_base, dest_base, checksum_algorithm, tdata, stream_class(batch_input)
+    )
+    return tdata["DATA"]
+
+
+@pytest.mark.parametrize(
+    "source_base, dest_base", [(None, None), ("/base/", "~/"), ("rel", "/x/y")]
+)
+@pytest.mark.parametrize("checksum_algorithm", [None, "SHA1"])
+def test_fast_path_matches_full_parser(
+    monkeypatch, source_base, dest_base, checksum_algorithm
+):
+    fast = _build(BATCH_INPUT, source_base, dest_base, checksum_algorithm)
+
+    # a pattern which never matches sends every line through shlex and click
+    monkeypatch.setattr(
+        "globus_cli.services.transfer.data._SIMPLE_BATCH_LINE", re.compile(r"(?!)")
+    )
+    slow = _build(BATCH_INPUT, source_base, dest_base, checksum_algorithm)
+
+    assert fast == slow
+    assert len(fast) == 11
+
+
+def test_batch_input_is_streamed():
+    """
+    The batch is consumed line by line, rather than with readlines()
+    """
+
+    class LineStream(io.StringIO):
+        def readlines(self, *args):
+            raise AssertionError("readlines() should not be used")
+
+    batch_input = "a b\nc d\n" * 1000
+    assert len(_build(batch_input, source_base="/", stream_class=LineStream)) == 2000
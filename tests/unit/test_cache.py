@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from globus_cli.cache import ACCESS_TIME_RESOLUTION, PersistentCache, get_identity_cache
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    def func(**kwargs):
+        kwargs.setdefault("ttl", 60)
+        kwargs.setdefault("max_entries", 10)
+        kwargs.setdefault("filename", str(tmp_path / "test-cache.db"))
+        kwargs.setdefault("namespace", "userprofile/production")
+        return PersistentCache("test", **kwargs)
+
+    return func
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_values_persist_between_instances(make_cache):
+    make_cache()["foo"] = {"bar": [1, 2]}
+    cache = make_cache()
+    assert cache["foo"] == {"bar": [1, 2]}
+    assert "foo" in cache
+    assert "baz" not in cache
+    assert set(cache) == {"foo"}
+
+
+def test_caches_are_partitioned_by_namespace_and_name(make_cache, tmp_path):
+    make_cache()["foo"] = 1
+    assert "foo" not in make_cache(namespace="userprofile/sandbox")
+    other = PersistentCache(
+        "other",
+        ttl=60,
+        max_entries=10,
+        filename=str(tmp_path / "test-cache.db"),
+        namespace="userprofile/production",
+    )
+    assert "foo" not in other
+
+
+def test_entries_expire_after_ttl(make_cache, fake_time):
+    make_cache()["foo"] = 1
+    fake_time[0] += 59
+    assert make_cache()["foo"] == 1
+    fake_time[0] += 2
+    with pytest.raises(KeyError):
+        make_cache()["foo"]
+
+
+def test_least_recently_used_entries_are_evicted(make_cache, fake_time):
+    cache = make_cache(ttl=3600, max_entries=3)
+    for key in ("a", "b", "c"):
+        fake_time[0] += 1
+        cache[key] = key
+
+    # read "a" from a new instance, so that it is the most recently used
+    fake_time[0] += ACCESS_TIME_RESOLUTION + 1
+    assert make_cache(ttl=3600, max_entries=3)["a"] == "a"
+
+    fake_time[0] += 1
+    cache["d"] = "d"
+    assert set(make_cache(ttl=3600, max_entries=3)) == {"a", "c", "d"}
+
+
+def test_recent_reads_do_not_write(make_cache, fake_time):
+    make_cache(ttl=3600)["a"] = 1
+    cache = make_cache(ttl=3600)
+    statements = []
+    cache._connection().set_trace_callback(statements.append)
+
+    # the entry was used recently, so its access time is left as it is
+    fake_time[0] += ACCESS_TIME_RESOLUTION - 1
+    assert cache["a"] == 1
+    assert not [s for s in statements if s.startswith("UPDATE")]
+
+    fake_time[0] += 2
+    cache._memory.clear()
+    assert cache["a"] == 1
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+
+
+def test_delete_and_clear(make_cache):
+    cache = make_cache()
+    cache["a"] = 1
+    cache["b"] = 2
+    del cache["a"]
+    with pytest.raises(KeyError):
+        del cache["a"]
+    assert set(make_cache()) == {"b"}
+
+    cache.clear()
+    assert len(make_cache()) == 0
+
+
+def test_unusable_database_acts_as_empty_cache(make_cache, tmp_path):
+    cache = make_cache(filename=str(tmp_path / "no-such-dir" / "cache.db"))
+    cache["foo"] = 1
+    # values are still held in memory
+    assert cache["foo"] == 1
+    assert "foo" not in make_cache(filename=str(tmp_path / "no-such-dir" / "cache.db"))
+
+
+def test_identity_cache_uses_cli_cache_file(patch_cache_storage):
+    get_identity_cache()["abc"] = {"id": "abc"}
+    assert get_identity_cache()["abc"] == {"id": "abc"}
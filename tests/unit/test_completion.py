@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from click.shell_completion import ShellComplete
+
+from globus_cli import completion
+from globus_cli import manifest as command_manifest
+from globus_cli.reflect import iter_all_commands, load_main_entrypoint
+
+
+@pytest.fixture(scope="module")
+def manifest():
+    return command_manifest.build_command_manifest()
+
+
+def _click_completions(args, incomplete):
+    comp = ShellComplete(load_main_entrypoint(), {}, "globus", "_GLOBUS_COMPLETE")
+    return [(i.type, i.value, i.help) for i in comp.get_completions(args, incomplete)]
+
+
+def _manifest_completions(manifest, args, incomplete):
+    items = completion.complete_from_manifest(manifest["commands"], args, incomplete)
+    if items is None:
+        return None
+    return [(i.type, i.value, i.help) for i in items]
+
+
+@pytest.mark.parametrize(
+    "args, incomplete",
+    [
+        ([], ""),
+        ([], "t"),
+        ([], "--"),
+        (["task"], ""),
+        (["task"], "e"),
+        (["transfer"], "--sync"),
+        (["transfer", "--sync-level"], ""),
+        (["transfer", "--sync-level"], "c"),
+        (["transfer"], "--sync-level="),
+        (["transfer", "--dry-run"], "--dry"),
+        (["task", "list", "--filter-status"], ""),
+        (["ls", "--format"], "j"),
+        (["ls", "-F", "json"], "--f"),
+        (["delete", "--batch"], ""),
+        (["transfer", "--", "x"], "--"),
+    ],
+)
+def test_manifest_completion_matches_click(manifest, args, incomplete):
+    assert _manifest_completions(manifest, args, incomplete) == _click_completions(
+        args, incomplete
+    )
+
+
+# loading and completing every command can be slow on a busy test runner
+@pytest.mark.timeout(30)
+def test_manifest_completion_matches_click_for_all_commands(manifest):
+    for ctx in iter_all_commands():
+        args = ctx.command_path.split()[1:]
+        for incomplete in ("", "-", "--"):
+            fast = _manifest_completions(manifest, args, incomplete)
+            if fast is not None:
+                assert fast == _click_completions(args, incomplete), (
+                    args,
+                    incomplete,
+                )
+
+
+def test_manifest_defers_unknown_input_to_click(manifest):
+    assert _manifest_completions(manifest, ["no-such-command"], "") is None
+
+
+def test_completion_does_not_load_commands_or_sdk(tmp_path):
+    to_run = "; ".join(
+        [
+            "import sys",
+            "from globus_cli.entrypoint import main",
+            "main()",
+            "assert 'globus_sdk' not in sys.modules, 'globus_sdk'",
+            "assert 'globus_cli.commands' not in sys.modules, 'commands'",
+        ]
+    )
+    env = {
+        **os.environ,
+        "HOME": str(tmp_path),
+        "_GLOBUS_COMPLETE": "bash_complete",
+        "COMP_WORDS": "globus task li",
+        "COMP_CWORD": "2",
+    }
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run], env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["plain,list"]
@@ -0,0 +1,55 @@
+import jmespath
+import pytest
+
+from globus_cli.termio import Field
+from globus_cli.utils import CLIStubResponse
+
+_SAMPLE_DATA = [
+    {"foo": 1, "bar": {"baz": "x", "qux": None}, "true": 2},
+    {"foo": None},
+    {"bar": "not-a-dict"},
+    {"bar": [{"baz": 1}]},
+    [{"foo": 1}],
+    "foo",
+    None,
+    3,
+]
+
+
+@pytest.mark.parametrize(
+    "key",
+    (
+        "@",
+        "foo",
+        "true",
+        "bar.baz",
+        "bar.qux",
+        "bar.baz.nonexistent",
+        "missing.path",
+        "bar[0].baz",
+        "[foo, bar]",
+        "bar.*",
+    ),
+)
+@pytest.mark.parametrize("data", _SAMPLE_DATA)
+def test_get_value_matches_jmespath(key, data):
+    assert Field("X", key).get_value(data) == jmespath.search(key, data)
+
+
+def test_get_value_supports_response_objects():
+    data = CLIStubResponse({"foo": {"bar": "baz"}})
+    # objects which are not dicts, but support `get()`, have fields looked up
+    data.get = data.data.get
+    assert Field("X", "foo.bar").get_value(data) == "baz"
+
+
+def test_get_value_compiles_once(monkeypatch):
+    field = Field("X", "foo[0]")
+    assert field.get_value({"foo": [1]}) == 1
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("should not re-parse")
+
+    monkeypatch.setattr(jmespath, "compile", _fail)
+    monkeypatch.setattr(jmespath, "search", _fail)
+    assert field.get_value({"foo": [2]}) == 2
@@ -0,0 +1,110 @@
+import http.server
+import logging
+import threading
+from unittest import mock
+
+import click
+import globus_sdk
+import pytest
+import responses
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.login_manager.http_session import PooledHTTPSession
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    responses.add_passthru(url)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused(local_server, caplog):
+    session = PooledHTTPSession()
+    for _ in range(3):
+        assert session.get(local_server + "/foo").text == "ok"
+
+    stats = session.connection_stats()
+    assert stats.requests == 3
+    assert stats.hosts == 1
+    assert stats.connections == 1
+    assert stats.reused == 2
+
+    with caplog.at_level(logging.DEBUG, logger="globus_cli"):
+        session.log_connection_stats()
+    assert "3 requests to 1 hosts used 1 connections (2 reused)" in caplog.text
+
+
+def test_pool_sizes_can_be_configured(monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_HTTP_POOL_CONNECTIONS", "3")
+    monkeypatch.setenv("GLOBUS_CLI_HTTP_POOL_MAXSIZE", "7")
+    adapter = PooledHTTPSession().get_adapter("https://transfer.api.globus.org")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+    adapter = PooledHTTPSession(pool_maxsize=2).get_adapter("https://example.org")
+    assert adapter._pool_maxsize == 2
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "ten"])
+def test_invalid_pool_size(monkeypatch, value):
+    monkeypatch.setenv("GLOBUS_CLI_HTTP_POOL_MAXSIZE", value)
+    with pytest.raises(click.UsageError, match="GLOBUS_CLI_HTTP_POOL_MAXSIZE"):
+        PooledHTTPSession()
+
+
+def test_login_manager_clients_share_a_session():
+    manager = LoginManager()
+    with mock.patch.object(
+        manager, "_get_client_authorizer", return_value=globus_sdk.NullAuthorizer()
+    ):
+        clients = [
+            manager.get_transfer_client(),
+            manager.get_auth_client(),
+            manager.get_groups_client(),
+            manager.get_flows_client(),
+            manager.get_search_client(),
+            manager.get_timer_client(),
+        ]
+    assert all(c.transport.session is manager.http_session for c in clients)
+
+    session = manager.http_session
+    with mock.patch.object(session, "close") as mock_close:
+        manager.close()
+    mock_close.assert_called_once()
+    # a new session is created after closing
+    assert manager.http_session is not session
+
+
+def test_replaced_client_sessions_are_closed():
+    manager = LoginManager()
+    client = globus_sdk.AuthClient()
+    original_session = client.transport.session
+    with mock.patch.object(original_session, "close") as mock_close:
+        assert manager._use_http_session(client) is client
+    mock_close.assert_called_once()
+    assert client.transport.session is manager.http_session
+
+    # a client which already uses the session is left alone
+    with mock.patch.object(manager.http_session, "close") as mock_close:
+        manager._use_http_session(client)
+    mock_close.assert_not_called()
+    manager.close()
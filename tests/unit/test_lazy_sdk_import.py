@@ -31,6 +31,7 @@ about 100ms, it eats a significant chunk of our time budget for completions and
 very latency-sensitive usages. We need to ensure that doesn't get done when the CLI does
 its (almost entirely eager) imports.
 """
+import json
 import subprocess
 import sys
 
@@ -71,3 +72,55 @@ def test_importing_cli_doesnt_import_forbidden_modules(forbidden_module):
     assert status == 0, str(proc.communicate())
     proc.stdout.close()
     proc.stderr.close()
+
+
+# Import budgets for representative invocations of the `globus` entrypoint: modules
+# which each invocation must not import. Showing help never needs the SDK's
+# services, requests, or modules which are only used by running commands.
+_HELP_BUDGET = (
+    "requests",
+    "http.client",
+    "jmespath",
+    "cryptography",
+    "globus_sdk.services",
+    "sqlite3",
+    "logging.config",
+)
+_RUN_CLI = """\
+import json, sys
+sys.argv = ["globus", *sys.argv[1:]]
+from globus_cli.entrypoint import main
+try:
+    main()
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@pytest.mark.parametrize(
+    "argv, forbidden_modules",
+    [
+        (["--help"], _HELP_BUDGET),
+        (["version", "--help"], _HELP_BUDGET),
+        (["ls", "--help"], _HELP_BUDGET),
+        (["transfer", "--help"], _HELP_BUDGET),
+        (["task", "list", "--help"], _HELP_BUDGET),
+        (["endpoint", "search", "--help"], _HELP_BUDGET),
+        (["bookmark", "list", "--help"], _HELP_BUDGET),
+        (["flows", "run", "show-logs", "--help"], _HELP_BUDGET),
+    ],
+)
+def test_command_import_budget(argv, forbidden_modules):
+    proc = subprocess.run(
+        [sys.executable, "-c", _RUN_CLI, *argv],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    loaded = set(json.loads(proc.stdout.splitlines()[-1]))
+    assert not {
+        name
+        for name in loaded
+        if any(name == m or name.startswith(m + ".") for m in forbidden_modules)
+    }
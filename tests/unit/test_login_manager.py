@@ -228,6 +228,61 @@ def test_requires_login_pass_manager(patch_scope_requirements, patched_tokenstor
     assert dummy_command()
 
 
+def test_shared_login_manager_is_used_by_all_commands(
+    patch_scope_requirements, patched_tokenstorage
+):
+    @LoginManager.requires_login("a")
+    def dummy_command(login_manager):
+        return login_manager
+
+    with LoginManager.shared() as shared_manager:
+        assert dummy_command() is shared_manager
+        assert dummy_command() is shared_manager
+    assert dummy_command() is not shared_manager
+
+
+def test_service_clients_are_reused_until_tokens_change(test_token_storage):
+    manager = LoginManager()
+    transfer_client = manager.get_transfer_client()
+    assert manager.get_transfer_client() is transfer_client
+    assert manager.get_auth_client() is not transfer_client
+
+    test_token_storage.remove_tokens_for_resource_server("transfer.api.globus.org")
+    with pytest.raises(ValueError, match="Could not get login data"):
+        manager.get_transfer_client()
+
+
+def test_valid_logins_are_cached_until_tokens_change(test_token_storage):
+    manager = LoginManager()
+    with mock.patch.object(LoginManager, "_validate_token") as m:
+        m.return_value = False
+        assert not manager.has_login("transfer.api.globus.org")
+        m.return_value = True
+        assert manager.has_login("transfer.api.globus.org")
+        assert manager.has_login("transfer.api.globus.org")
+        # failures are not cached, but the successful check is
+        assert m.call_count == 2
+
+        test_token_storage.remove_tokens_for_resource_server("transfer.api.globus.org")
+        assert not manager.has_login("transfer.api.globus.org")
+        assert m.call_count == 2
+
+
+def test_validate_token_uses_shared_http_session(
+    test_token_storage, disable_login_manager_validate_token
+):
+    disable_login_manager_validate_token.undo()
+    manager = LoginManager()
+    with mock.patch(
+        "globus_cli.login_manager.manager.internal_auth_client"
+    ) as m_client:
+        auth_client = m_client.return_value
+        auth_client.oauth2_validate_token.return_value = {"active": True}
+        assert manager.has_login("transfer.api.globus.org")
+    assert auth_client.transport.session is manager.http_session
+    manager.close()
+
+
 def test_flow_error_message(patched_tokenstorage):
     dummy_id = str(uuid.uuid1())
 
@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from globus_cli import manifest as command_manifest
+from globus_cli.version import __version__
+
+
+@pytest.fixture
+def cached_manifest_file(monkeypatch, tmp_path):
+    filename = str(tmp_path / "command_manifest.json")
+    monkeypatch.setattr(
+        command_manifest, "_get_cached_manifest_filename", lambda: filename
+    )
+    return filename
+
+
+# loading every command can be slow on a busy test runner
+@pytest.mark.timeout(30)
+def test_packaged_manifest_matches_command_tree():
+    with open(command_manifest.PACKAGED_MANIFEST_FILENAME, encoding="utf-8") as fp:
+        packaged = json.load(fp)
+    # round-trip the live manifest through JSON, so that tuples compare as lists
+    live = json.loads(json.dumps(command_manifest.build_command_manifest()))
+    assert packaged == live, "run 'make command-manifest' to update the manifest"
+
+
+def test_packaged_manifest_is_preferred(cached_manifest_file):
+    command_manifest.save_command_manifest({"version": __version__, "commands": {}})
+    assert command_manifest.load_command_manifest()["commands"] != {}
+
+
+def test_manifest_from_another_version_is_not_used(
+    monkeypatch, tmp_path, cached_manifest_file
+):
+    monkeypatch.setattr(
+        command_manifest,
+        "PACKAGED_MANIFEST_FILENAME",
+        str(tmp_path / "no-such-manifest.json"),
+    )
+    assert command_manifest.load_command_manifest() is None
+
+    manifest = {"version": __version__, "commands": {}}
+    command_manifest.save_command_manifest(manifest)
+    assert command_manifest.load_command_manifest() == manifest
+
+    with open(cached_manifest_file, "w") as fp:
+        json.dump({**manifest, "version": "0.0.1"}, fp)
+    assert command_manifest.load_command_manifest() is None
+
+
+def test_iter_manifest_commands_skips_hidden_commands():
+    root = {
+        "hidden": False,
+        "commands": {
+            "a": {"hidden": False},
+            "b": {"hidden": True},
+            "g": {"hidden": False, "commands": {"c": {"hidden": False}}},
+            "h": {"hidden": True, "commands": {"d": {"hidden": False}}},
+        },
+    }
+    assert [
+        (path, [subpath for subpath, _ in subcommands])
+        for path, _, subcommands in command_manifest.iter_manifest_commands(root)
+    ] == [("globus", ["globus a"]), ("globus g", ["globus g c"])]
+
+
+def test_list_commands_does_not_load_commands(tmp_path):
+    to_run = "; ".join(
+        [
+            "import sys",
+            "sys.argv = ['globus', 'list-commands']",
+            "from globus_cli.commands import main",
+            "main(standalone_mode=False)",
+            "assert 'globus_cli.commands.task' not in sys.modules, 'task'",
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run],
+        env={**os.environ, "HOME": str(tmp_path)},
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "globus task list" in proc.stdout
@@ -0,0 +1,26 @@
+"""
+The `globus` entrypoint does not load the command tree up front, so modules must be
+importable on their own, in a fresh interpreter, without relying on the command tree
+having been imported first to resolve circular imports.
+"""
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "globus_cli.termio",
+        "globus_cli.services.transfer",
+        "globus_cli.exception_handling",
+        "globus_cli.parsing",
+        "globus_cli.login_manager",
+    ],
+)
+def test_module_imports_on_its_own(module):
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import {module}"], capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
@@ -1,10 +1,18 @@
+import json
 import os
 import re
 
 import click
 import pytest
 
+from globus_cli.parsing.command_state import CommandState
 from globus_cli.termio import Field, TextMode, display, term_is_interactive
+from globus_cli.termio.printer import (
+    print_json_record_stream,
+    print_json_response,
+    print_table,
+)
+from globus_cli.utils import RecordListConverter
 
 
 @pytest.mark.parametrize(
@@ -49,3 +57,134 @@ def test_format_record_list(capsys):
     # and one empty line between the records
     assert "" in output.splitlines()
     assert re.match(r"Bird:\s+Killdeer", output)
+
+
+def test_format_table_evaluates_each_field_once_per_row(capsys):
+    calls = []
+
+    class CountingField(Field):
+        def get_value(self, data):
+            calls.append(data["bird"])
+            return super().get_value(data)
+
+    data = [{"bird": "Killdeer"}, {"bird": "Franklin's Gull"}]
+    with click.Context(click.Command("fake-command")) as _:
+        display(data, fields=[CountingField("Bird", "bird")])
+    assert calls == ["Killdeer", "Franklin's Gull"]
+    assert capsys.readouterr().out.splitlines() == [
+        "Bird           ",
+        "---------------",
+        "Killdeer       ",
+        "Franklin's Gull",
+    ]
+
+
+def test_streaming_table_prints_rows_before_reading_all_data(capsys):
+    # the number of new lines printed before each row is read
+    printed_before_read = []
+
+    def generate():
+        for i in range(10):
+            printed_before_read.append(capsys.readouterr().out.count("\n"))
+            yield {"n": i, "word": "x" * i}
+
+    fields = [Field("N", "n"), Field("Word", "word")]
+    print_table(generate(), fields, lookahead=3)
+
+    # the first three rows are read before anything is printed (to size columns)
+    # then the headers and those rows are printed, and after that rows are printed
+    # one at a time as they are read
+    assert printed_before_read == [0, 0, 0, 5, 1, 1, 1, 1, 1, 1]
+
+
+def test_streaming_table_sizes_columns_from_lookahead(capsys):
+    data = [{"word": "x" * n} for n in (1, 6, 3, 9)]
+    print_table(iter(data), [Field("Word", "word")], lookahead=2)
+    assert capsys.readouterr().out.splitlines() == [
+        "Word  ",
+        "------",
+        "x     ",
+        "xxxxxx",
+        "xxx   ",
+        "xxxxxxxxx",
+    ]
+
+
+def test_streaming_table_with_declared_widths_does_not_read_ahead(capsys):
+    printed_before_read = []
+
+    def generate():
+        for i in range(3):
+            printed_before_read.append(capsys.readouterr().out.count("\n"))
+            yield {"n": i}
+
+    print_table(generate(), [Field("N", "n", width=3)], lookahead=100)
+
+    # headers are printed before any row is read
+    assert printed_before_read == [2, 1, 1]
+
+
+def test_table_uses_declared_widths(capsys):
+    data = [{"a": "abc", "b": "d"}]
+    print_table(data, [Field("A", "a", width=5), Field("B", "b")])
+    assert capsys.readouterr().out.splitlines() == [
+        "A     | B",
+        "----- | -",
+        "abc   | d",
+    ]
+
+
+def test_streaming_table_leaves_last_column_unbounded(capsys):
+    printed_before_read = []
+
+    def generate():
+        for word in ("a long value", "b"):
+            printed_before_read.append(capsys.readouterr().out.splitlines())
+            yield {"n": 1, "word": word}
+
+    print_table(
+        generate(), [Field("N", "n", width=3), Field("Word", "word")], lookahead=100
+    )
+
+    # only the other columns need a width for rows to be printed without reading ahead
+    assert printed_before_read == [["N   | Word", "--- | ----"], ["1   | a long value"]]
+    assert capsys.readouterr().out.splitlines() == ["1   | b   "]
+
+
+@pytest.mark.parametrize(
+    "records",
+    (
+        [],
+        [{"a": 1}],
+        [{"b": [1, 2], "a": {"y": None, "x": "multi\nline"}}, {"c": []}, "scalar"],
+    ),
+)
+@pytest.mark.parametrize("sort_keys", (True, False))
+def test_json_record_stream_matches_json_response(capsys, records, sort_keys):
+    with click.Context(click.Command("fake-command")) as _:
+        print_json_response({"DATA": records}, sort_keys=sort_keys)
+        expect = capsys.readouterr().out
+        print_json_record_stream("DATA", iter(records), sort_keys=sort_keys)
+        assert capsys.readouterr().out == expect
+
+
+def test_display_jsonl_record_stream(capsys):
+    data = [{"bird": "Killdeer", "wingspan": 46}, {"bird": "Gull", "wingspan": 91}]
+    with click.Context(click.Command("fake-command")) as ctx:
+        ctx.ensure_object(CommandState).output_format = "jsonl"
+        display(
+            iter(data),
+            fields=[Field("Bird", "bird")],
+            json_converter=RecordListConverter("DATA"),
+        )
+    output = capsys.readouterr().out
+    assert output == (
+        '{"bird":"Killdeer","wingspan":46}\n{"bird":"Gull","wingspan":91}\n'
+    )
+
+
+def test_display_jsonl_single_document(capsys):
+    with click.Context(click.Command("fake-command")) as ctx:
+        ctx.ensure_object(CommandState).output_format = "jsonl"
+        display({"b": 1, "a": [1, 2]})
+    assert json.loads(capsys.readouterr().out) == {"a": [1, 2], "b": 1}
@@ -1,4 +1,9 @@
-from globus_cli.login_manager.tokenstore import _resolve_namespace
+from globus_cli.login_manager.tokenstore import (
+    _resolve_namespace,
+    build_storage_adapter,
+    clear_token_storage_snapshot,
+    token_storage_adapter,
+)
 
 
 def test_default_namespace():
@@ -11,3 +16,65 @@ def test_profile_namespace(user_profile):
 
 def test_client_namespace(client_login):
     assert _resolve_namespace() == "clientprofile/production/fake_client_id"
+
+
+def test_storage_is_read_in_one_query(tmp_path, mock_login_token_response):
+    filename = str(tmp_path / "storage.db")
+    build_storage_adapter(filename).store(mock_login_token_response)
+
+    adapter = build_storage_adapter(filename)
+    statements = []
+    adapter._connection.set_trace_callback(statements.append)
+    for rs_name in mock_login_token_response.by_resource_server:
+        assert adapter.get_token_data(rs_name) is not None
+    assert adapter.get_token_data("no-such-server.globus.org") is None
+    assert adapter.read_config("scope_contract_versions") is not None
+    assert adapter.read_config("auth_client_data") is None
+    assert set(adapter.get_by_resource_server()) == set(
+        mock_login_token_response.by_resource_server
+    )
+
+    assert len([s for s in statements if s.lstrip().startswith("SELECT")]) == 1
+
+
+def test_storage_writes_through(tmp_path, mock_login_token_response):
+    filename = str(tmp_path / "storage.db")
+    adapter = build_storage_adapter(filename)
+    adapter.store(mock_login_token_response)
+    adapter.store_config("auth_client_data", {"client_id": "foo"})
+    adapter.remove_tokens_for_resource_server("transfer.api.globus.org")
+
+    for reader in (adapter, build_storage_adapter(filename)):
+        assert reader.get_token_data("transfer.api.globus.org") is None
+        assert reader.get_token_data("auth.globus.org") is not None
+        assert reader.read_config("auth_client_data") == {"client_id": "foo"}
+
+    adapter.remove_config("auth_client_data")
+    assert adapter.read_config("auth_client_data") is None
+    assert build_storage_adapter(filename).read_config("auth_client_data") is None
+
+
+def test_storage_reads_are_not_shared(tmp_path, mock_login_token_response):
+    adapter = build_storage_adapter(str(tmp_path / "storage.db"))
+    adapter.store(mock_login_token_response)
+
+    adapter.get_token_data("auth.globus.org")["access_token"] = "changed"
+    assert adapter.get_token_data("auth.globus.org")["access_token"] != "changed"
+
+
+def test_storage_snapshot_can_be_cleared(
+    tmp_path, monkeypatch, mock_login_token_response
+):
+    filename = str(tmp_path / "storage.db")
+    adapter = build_storage_adapter(filename)
+    monkeypatch.setattr(token_storage_adapter, "_instance", adapter)
+    assert adapter.get_by_resource_server() == {}
+
+    # another process logs in
+    build_storage_adapter(filename).store(mock_login_token_response)
+    assert adapter.get_by_resource_server() == {}
+
+    clear_token_storage_snapshot()
+    assert set(adapter.get_by_resource_server()) == set(
+        mock_login_token_response.by_resource_server
+    )
@@ -1,3 +1,4 @@
+import io
 import unittest.mock
 
 import click
@@ -56,13 +57,39 @@ def test_shlex_process_stream_success():
     def foo(bar):
         values.append(bar)
 
-    text_like = unittest.mock.Mock()
-    text_like.readlines.return_value = ["alpha\n", "beta  # gamma\n"]
+    text_like = unittest.mock.MagicMock()
+    text_like.__iter__.return_value = iter(["alpha\n", "beta  # gamma\n"])
     text_like.name = "alphabet.txt"
 
     with outer_main.make_context("main", []):
         shlex_process_stream(foo, text_like, "data")
     assert values == ["alpha", "beta"]
+    text_like.readlines.assert_not_called()
+
+
+def test_shlex_process_stream_fast_path():
+    @click.command()
+    def outer_main():
+        pass
+
+    values = []
+
+    @click.command()
+    @click.argument("bar")
+    def foo(bar):
+        values.append(bar)
+
+    def fast_path(line):
+        if line.startswith("fast:"):
+            values.append(line.strip())
+            return True
+        return False
+
+    with outer_main.make_context("main", []):
+        shlex_process_stream(
+            foo, io.StringIO("alpha\nfast: beta\ngamma\n"), "data", fast_path=fast_path
+        )
+    assert values == ["alpha", "fast: beta", "gamma"]
 
 
 def test_shlex_process_stream_error_handling(capsys):
@@ -77,8 +104,8 @@ def test_shlex_process_stream_error_handling(capsys):
     def foo(bar):
         values.append(bar)
 
-    text_like = unittest.mock.Mock()
-    text_like.readlines.return_value = ["alpha beta\n"]
+    text_like = unittest.mock.MagicMock()
+    text_like.__iter__.return_value = iter(["alpha beta\n"])
     text_like.name = "alphabet.txt"
 
     with pytest.raises(click.exceptions.Exit) as excinfo: